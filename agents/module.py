@@ -36,7 +36,7 @@ from manifest.agent import manifest_agent
 from manifest.models import ManifestModel
 from paramgroups.agent import paramgroups_agent
 from paramgroups.models import ParamgroupsModel
-from wrapper.agent import wrapper_agent
+from wrapper.agent import get_wrapper_agent
 
 
 class ModuleAgent:
@@ -53,7 +53,7 @@ class ModuleAgent:
         # Define artifact agents mapping with models and formatters
         self.artifact_agents = {
             'wrapper': {
-                'agent': wrapper_agent,
+                'agent': get_wrapper_agent(),
                 'model': ArtifactModel,
                 'filename': 'wrapper.py',
                 'validate_tool': 'validate_wrapper',
@@ -0,0 +1,49 @@
+"""Unit tests for the wrapper agent's optimize_wrapper_performance tool."""
+
+import unittest
+from wrapper.agent import optimize_wrapper_performance
+
+
+PYTHON_WRAPPER = """#!/usr/bin/env python
+import argparse
+import subprocess
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input', required=True)
+    args = parser.parse_args()
+    subprocess.run(['tool', args.input], check=True, capture_output=True)
+
+if __name__ == '__main__':
+    main()
+"""
+
+
+class TestOptimizeWrapperPerformance(unittest.TestCase):
+    """Verify both return formats, including the empty-content error path."""
+
+    def test_markdown_format_returns_report(self):
+        result = optimize_wrapper_performance(None, PYTHON_WRAPPER)
+        self.assertIsInstance(result, str)
+        self.assertIn("PYTHON-Specific Best Practices", result)
+
+    def test_dict_format_returns_analysis(self):
+        result = optimize_wrapper_performance(None, PYTHON_WRAPPER, return_format="dict")
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result["language"], "python")
+        self.assertNotIn("error", result)
+
+    def test_markdown_format_empty_content(self):
+        result = optimize_wrapper_performance(None, "   \n")
+        self.assertIsInstance(result, str)
+        self.assertTrue(result.startswith("Error:"))
+
+    def test_dict_format_empty_content(self):
+        result = optimize_wrapper_performance(None, "   \n", return_format="dict")
+        self.assertIsInstance(result, dict)
+        self.assertIn("error", result)
+        self.assertIn("No wrapper content provided", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
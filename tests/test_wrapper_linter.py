@@ -0,0 +1,68 @@
+"""Unit tests for the wrapper linter's programmatic entry points."""
+
+import contextlib
+import io
+import os
+import unittest
+from wrapper.linter import lint, lint_batch, main
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "wrapper", "examples")
+
+SAMPLE_WRAPPERS = [
+    os.path.join(EXAMPLES_DIR, "valid", "sample_python_wrapper.py"),
+    os.path.join(EXAMPLES_DIR, "valid", "sample_bash_wrapper.sh"),
+    os.path.join(EXAMPLES_DIR, "valid", "sample_r_wrapper.R"),
+    os.path.join(EXAMPLES_DIR, "invalid", "syntax_error.py"),
+    os.path.join(EXAMPLES_DIR, "invalid", "missing_parameters.py"),
+]
+
+
+def run_cli(argv):
+    """Run the linter's main() and capture what it prints."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exit_code = main(argv)
+    return exit_code, buf.getvalue()
+
+
+class TestLint(unittest.TestCase):
+    """lint() must report exactly what the command line interface prints."""
+
+    def test_matches_cli_output(self):
+        for script_path in SAMPLE_WRAPPERS:
+            with self.subTest(script=os.path.basename(script_path)):
+                exit_code, report, errors = lint(script_path)
+                self.assertEqual((exit_code, report), run_cli([script_path]))
+                self.assertEqual(errors, "")
+
+    def test_matches_cli_output_with_parameters(self):
+        script_path = SAMPLE_WRAPPERS[0]
+        parameters = ["input.file", "output.prefix"]
+        exit_code, report, _ = lint(script_path, parameters)
+        self.assertEqual((exit_code, report), run_cli([script_path, "--parameters", *parameters]))
+
+    def test_syntax_error_fails(self):
+        exit_code, report, _ = lint(os.path.join(EXAMPLES_DIR, "invalid", "syntax_error.py"))
+        self.assertEqual(exit_code, 1)
+        self.assertIn("Python syntax error", report)
+
+
+class TestLintBatch(unittest.TestCase):
+    """lint_batch() must return the same results as linting each script in turn."""
+
+    def test_matches_sequential_lint(self):
+        expected = {script_path: lint(script_path) for script_path in SAMPLE_WRAPPERS}
+        self.assertEqual(lint_batch(SAMPLE_WRAPPERS, use_processes=False), expected)
+
+    def test_matches_sequential_lint_with_parameters(self):
+        parameters = ["input.file"]
+        expected = {script_path: lint(script_path, parameters) for script_path in SAMPLE_WRAPPERS}
+        self.assertEqual(lint_batch(SAMPLE_WRAPPERS, parameters, use_processes=False), expected)
+
+    def test_empty_batch(self):
+        self.assertEqual(lint_batch([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
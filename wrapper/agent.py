@@ -1,230 +1,347 @@
+import collections
+import functools
+import itertools
+import logging
+import operator
+import os
 import re
-from typing import Dict, Any, List
+import string
+import sys
+from typing import Callable, Dict, Any, Iterator, List, Literal, Tuple, Union
 from pathlib import Path
+from pydantic import BaseModel
 from pydantic_ai import Agent, RunContext
-from dotenv import load_dotenv
-from agents.models import configured_llm_model
 
+try:
+    import wrapper.linter as _linter
+except ImportError:
+    _linter = None
 
-# Load environment variables from .env file
-load_dotenv()
+
+logger = logging.getLogger(__name__)
 
 # Get the wrapper templates directory
 WRAPPER_TEMPLATES_DIR = Path(__file__).parent / "templates"
 
-
-system_prompt = """
-You are an expert software architect and DevOps specialist with deep expertise in 
-creating robust wrapper scripts for bioinformatics pipelines and GenePattern modules. 
-Your task is to create production-ready wrapper scripts that provide seamless 
-integration between GenePattern's interface and underlying bioinformatics tools.
-
-CRITICAL: Your output must ALWAYS be valid code only - no markdown, no explanations, no text before or after the code.
-
-MULTI-LANGUAGE WRAPPER GENERATION:
-You MUST generate wrapper scripts in the appropriate language based on the tool being wrapped:
-
-**Python Wrappers** - Use when:
-- The underlying tool is written in Python
-- The tool requires complex parameter validation or data transformation
-- Running in containerized environments (Docker/Singularity)
-- The tool has complex file I/O or multi-step workflows
-- High complexity score (many parameters, conditional logic)
-
-**R Wrappers** - Use when:
-- The underlying tool is an R package or R-based tool
-- The tool is native to the R/Bioconductor ecosystem
-- Direct R library integration provides better performance
-- The analysis is inherently R-based (statistical modeling, visualization)
-
-**Bash Wrappers** - Use when:
-- The underlying tool is a compiled binary (C/C++/Fortran)
-- Simple command-line tool with straightforward parameters
-- The tool is shell-based or has minimal parameter complexity
-- Low overhead and fast execution is priority
-- **The underlying tool is Java/JVM-based (Java, Scala, Groovy, Kotlin)** — bash is always
-  the correct wrapper language for JVM tools. The bash script invokes the tool via its
-  command-line interface (e.g. `gatk Mutect2 ...`, `java -jar picard.jar ...`).
-  NEVER write a Java source-file wrapper for a Java tool.
-
-**Other Languages** - Consider when:
-- Perl tools: Perl wrapper for legacy bioinformatics tools
-- Julia tools: Julia wrapper for performance-critical scientific computing
-
-LANGUAGE SELECTION PRIORITY:
-1. Match the tool's native language when possible (R tool → R wrapper, Python tool → Python wrapper)
-2. **Java/JVM tools → bash wrapper** (not Java, not Python)
-3. For other compiled tools, prefer Bash for simplicity unless complexity demands Python
-4. The prompt will include a "WRAPPER LANGUAGE IS FIXED" section — always follow it exactly.
-
-Key requirements for GenePattern wrapper scripts:
-- Create clean, maintainable code that handles parameter passing efficiently
-- Implement comprehensive error handling and input validation
-- Design for reliability with proper exit codes and error reporting
-- Support multiple programming languages (Python, Bash, R) as appropriate
-- Follow best practices for argument parsing and data handling
-- Ensure robust file I/O operations with proper path handling
-- Include logging and debugging capabilities for troubleshooting
-
-Wrapper Script Design Principles:
-- Use appropriate scripting language based on tool requirements and ecosystem
-- Implement clear separation between parameter parsing, validation, and execution
-- Provide informative error messages that help users diagnose issues
-- Handle edge cases gracefully (missing files, invalid parameters, etc.)
-- Ensure scripts are portable across different environments
-- Support both required and optional parameters with sensible defaults
-- Include proper shebang lines and execute permissions
-
-Language-Specific Best Practices:
-- Python: Use argparse for argument parsing, subprocess for tool execution
-- Bash: Use getopts or manual parsing, proper variable quoting and error checking
-- R: Use optparse or argparse, proper error handling with tryCatch
-- General: Follow language conventions and idioms for maintainability
-
-CRITICAL GENEPATTERN FLAG NAMING CONVENTION:
-- GenePattern parameter names use dots (e.g., input.file, output.dir, p.thres)
-- Wrapper argparse/optparse flags MUST use the SAME dot-based names
-  * CORRECT: parser.add_argument("--input.file", dest="input_file", ...)
-  * WRONG:   parser.add_argument("--input-file", dest="input_file", ...)
-- This ensures the wrapper's flags match the manifest's commandLine and
-  prefix_when_specified values exactly. Using dashes instead of dots causes
-  a fatal mismatch at runtime.
-
-CRITICAL: PLANNING DATA PARAMETER NAMES ARE THE SINGLE SOURCE OF TRUTH
-- The parameter names provided by the create_wrapper tool (from planning_data) are
-  AUTHORITATIVE and MUST be used verbatim as CLI flags.
-- You MUST NOT rename, expand, abbreviate, or add prefixes to parameter names.
-  * If planning_data says "reference"   → use --reference   (NOT --reference.fasta)
-  * If planning_data says "tumor.bam"   → use --tumor.bam   (NOT --input.tumor.bam)
-  * If planning_data says "normal.bam"  → use --normal.bam  (NOT --input.normal.bam)
-  * If planning_data says "output.vcf.name" → use --output.vcf.name (NOT --output.vcf)
-- These names are locked to match the manifest pN_name values. Any deviation will
-  cause a manifest/wrapper consistency failure that cannot be auto-corrected.
-
-Error Handling Strategy:
-- Validate all input parameters before tool execution
-- Check file existence and permissions before processing
-- Capture and report tool execution errors with context
-- Use appropriate exit codes (0 for success, non-zero for failures)
-- Provide clear error messages that guide users toward solutions
-- Log intermediate steps for debugging complex workflows
-
-Output Management:
-- Ensure predictable output file naming and locations
-- Handle temporary files properly with cleanup
-- Provide progress indicators for long-running operations
-- Validate output files are created successfully
-- Support different output formats as specified by parameters
-
-ASCII-ONLY STRINGS AND COMMENTS:
-- NEVER use Unicode characters (e.g. ellipsis '…', em-dash '—', curly quotes '"''"', arrows '→',
-  bullet '•', or any character with ord > 127) in log messages, print statements, comments, or
-  any other string literal in the generated wrapper.
-- GenePattern containers may run with an ASCII-only locale; non-ASCII characters in log/print
-  calls will raise UnicodeEncodeError at runtime and crash the module.
-- Use plain ASCII equivalents instead: '...' not '…', '-' or '--' not '—', straight quotes not
-  curly quotes, '*' or '-' not '•', '->' not '→', etc.
-
-REMEMBER: Output ONLY valid code. No explanations, no markdown, no additional text.
-Always generate complete, production-ready wrapper scripts that provide reliable
-integration between GenePattern and bioinformatics tools with excellent user experience.
-"""
-
-# Create agent without MCP dependency
-wrapper_agent = Agent(configured_llm_model(), system_prompt=system_prompt)
-
-
-@wrapper_agent.tool
-def validate_wrapper(context: RunContext[str], script_path: str, parameters: List[str] = None) -> str:
+# Report sections that optimize_wrapper_performance can emit
+_ALL_SECTIONS = frozenset({"optimizations", "best_practices", "monitoring", "testing"})
+
+# Best practices section headers for the languages optimize_wrapper_performance detects
+_LANG_HEADERS = {
+    language: f"**{language.upper()}-Specific Best Practices:**\n"
+    for language in ("python", "bash", "r", "unknown")
+}
+
+# Static recommendations for optimize_wrapper_performance, shared across calls
+_LANG_BEST_PRACTICES = {
+    "python": (
+        "Use argparse for robust argument parsing",
+        "Implement proper logging with configurable levels",
+        "Use pathlib for cross-platform path operations",
+        "Add type hints for better code documentation",
+        "Use f-strings for string formatting",
+        "Use context managers for file operations",
+        "Handle subprocess errors with proper exception catching",
+    ),
+    "bash": (
+        "Use 'set -euo pipefail' for strict error handling",
+        "Quote all variable expansions: \"${var}\"",
+        "Use [[ ]] for test conditions instead of [ ]",
+        "Implement proper function error checking",
+        "Use local variables in functions",
+        "Add comprehensive usage documentation",
+    ),
+    "r": (
+        "Use optparse or argparse for argument handling",
+        "Implement tryCatch for comprehensive error handling",
+        "Use appropriate data.table operations for performance",
+        "Add session info logging for reproducibility",
+        "Use appropriate R logging mechanisms",
+        "Handle missing packages gracefully",
+    ),
+}
+
+_DEFAULT_BEST_PRACTICES = (
+    "Add clear documentation for the wrapper language",
+    "Implement proper error handling mechanisms",
+    "Use consistent coding style and conventions",
+    "Add input validation and error reporting",
+)
+
+_MONITORING_RECOMMENDATIONS = (
+    "Add execution time logging for performance tracking",
+    "Monitor memory usage for large dataset processing",
+    "Log file sizes and processing statistics",
+    "Implement progress reporting for long-running operations",
+    "Add resource usage warnings for resource-intensive operations",
+)
+
+_TESTING_RECOMMENDATIONS = (
+    "Unit tests for parameter validation functions",
+    "Integration tests with various input sizes",
+    "Performance benchmarks with representative data",
+    "Error condition testing (missing files, invalid inputs)",
+    "Cross-platform compatibility validation",
+)
+
+
+def _bullets(items) -> str:
+    """Render items as a Markdown bullet list."""
+    return "".join(f"- {item}\n" for item in items)
+
+
+# Pre-rendered Markdown for the static sections
+_LANG_BEST_PRACTICES_TEXT = {language: _bullets(items) for language, items in _LANG_BEST_PRACTICES.items()}
+_DEFAULT_BEST_PRACTICES_TEXT = _bullets(_DEFAULT_BEST_PRACTICES)
+_MONITORING_TEXT = "\n**Performance Monitoring Recommendations:**\n" + _bullets(_MONITORING_RECOMMENDATIONS)
+_TESTING_TEXT = "\n**Testing and Validation:**\n" + _bullets(_TESTING_RECOMMENDATIONS)
+
+# Substring markers for wrapper language detection, matched in a single scan
+_LANG_MARKERS = re.compile(r'(?P<python>import )|(?P<bash>#!/bin/sh)|(?P<r>library\()')
+
+# Import statements counted by the speed analysis of optimize_wrapper_performance
+_IMPORT_RE = re.compile(r'import \w+')
+
+# Substrings the optimization analysis looks for, found together in one scan. The lookahead
+# reports occurrences that overlap each other, so counts match separate str.count() scans.
+_OPTIMIZATION_PROBES = (
+    "subprocess.run", "capture_output=True", "$(command)", "`command`", "grep", ".read()",
+    "read.csv", "read.table", "try:", "tryCatch", "set -e", "logging", "os.path.exists",
+    "file.exists", "[ -f ", "def ", "function ", '"""', "CONFIG",
+)
+_OPTIMIZATION_PROBES_RE = re.compile("(?=(" + "|".join(map(re.escape, _OPTIMIZATION_PROBES)) + "))")
+
+
+def _scan_probes(wrapper_content: str) -> collections.Counter:
+    """Count occurrences of each _OPTIMIZATION_PROBES substring in a single pass over the content."""
+    return collections.Counter(match.group(1) for match in _OPTIMIZATION_PROBES_RE.finditer(wrapper_content))
+
+
+# Shebangs identifying the wrapper language, in detection priority order
+_LANG_SHEBANGS = (
+    ("python", "#!/usr/bin/env python"),
+    ("bash", "#!/bin/bash"),
+    ("r", "#!/usr/bin/env Rscript"),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_wrapper_language(wrapper_content: str) -> str:
     """
-    Validate GenePattern wrapper scripts.
-
-    This tool validates wrapper scripts that serve as the interface between
-    GenePattern and the underlying analysis tools. Wrapper scripts handle
-    parameter parsing, input validation, tool execution, and output formatting.
-
-    Args:
-        script_path: Path to the wrapper script file to validate. Can be Python,
-                    R, shell script, or other executable formats. The script should
-                    follow GenePattern wrapper conventions for parameter handling
-                    and output generation.
-        parameters: Optional list of parameter names that the wrapper script
-                   should handle. If provided, validates that the script properly
-                   processes all specified parameters, including required parameter
-                   validation and optional parameter defaults.
-
+    Detect the wrapper language from its shebang or characteristic content.
+    
+    Python takes priority over bash, and bash over R, when markers for several languages
+    appear in the same script. Results are cached, so analysing the same wrapper against
+    different performance goals scans it only once.
+    """
+    # Shebangs settle the common cases without a full marker scan: nothing outranks a python
+    # shebang, and only a python marker outranks a bash one
+    if wrapper_content.startswith("#!/usr/bin/env python"):
+        return "python"
+    if wrapper_content.startswith("#!/bin/bash"):
+        return "python" if "import " in wrapper_content else "bash"
+    
+    found = set()
+    for match in _LANG_MARKERS.finditer(wrapper_content):
+        found.add(match.lastgroup)
+        if match.lastgroup == "python":
+            break
+    
+    for language, shebang in _LANG_SHEBANGS:
+        if language in found or wrapper_content.startswith(shebang):
+            return language
+    return "unknown"
+
+
+# Maintainability checks for optimize_wrapper_performance as (predicate, recommendation) pairs;
+# predicates receive the content, its _scan_probes counts and its line count
+_MAINTAINABILITY_RULES = [
+    # Code organization
+    (lambda content, probes, lines: lines > 100 and not probes["def "] and not probes["function "],
+     "Break down into smaller, reusable functions"),
+    # Documentation
+    (lambda content, probes, lines: not probes['"""'] and content.find("#", 0, 200) == -1,
+     "Add comprehensive docstrings and comments"),
+    # Constants and configuration
+    (lambda content, probes, lines: not probes["CONFIG"] and content.count('"') > 20,
+     "Extract configuration constants to top of file"),
+]
+
+
+@functools.cache
+def _system_prompt() -> str:
+    """Load the wrapper agent system prompt, reading the file only once per process."""
+    return (WRAPPER_TEMPLATES_DIR / "system_prompt.txt").read_text(encoding="utf-8")
+
+
+# Parameter categories reported by analyze_wrapper_requirements, in report order
+_PARAMETER_CATEGORIES = ('file_inputs', 'file_outputs', 'choices', 'numeric', 'flags', 'text')
+
+# Category bucket for each non-File parameter type
+_TYPE_CATEGORIES = {
+    'Choice': 'choices',
+    'Integer': 'numeric',
+    'Float': 'numeric',
+    'Boolean': 'flags',
+    'Text': 'text',
+    'String': 'text',
+}
+
+
+def _categorize_parameters(parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Count parameter definitions in the buckets used by the wrapper analysis tools in one pass.
+    
     Returns:
-        A string containing the validation results, indicating whether the wrapper
-        script follows proper conventions, handles parameters correctly, and includes
-        necessary error handling, along with any syntax errors or missing functionality.
+        Dictionary with a count per entry of _PARAMETER_CATEGORIES plus 'files' (all File
+        parameters) and 'required', and a 'has_path' flag for parameter names mentioning a path
     """
-    import io
-    import sys
-    from contextlib import redirect_stderr, redirect_stdout
-    import traceback
+    buckets = dict.fromkeys(_PARAMETER_CATEGORIES, 0)
+    buckets['files'] = 0
+    buckets['required'] = 0
+    buckets['has_path'] = False
+    
+    for p in parameters:
+        param_type = p.get('type')
+        name = p.get('name', '').lower()
+        
+        if param_type == 'File':
+            buckets['files'] += 1
+            if 'input' in name:
+                buckets['file_inputs'] += 1
+            if 'output' in name:
+                buckets['file_outputs'] += 1
+        elif param_type in _TYPE_CATEGORIES:
+            buckets[_TYPE_CATEGORIES[param_type]] += 1
+        
+        if p.get('required', False):
+            buckets['required'] += 1
+        if 'path' in name:
+            buckets['has_path'] = True
+    
+    return buckets
 
-    print(f"🔍 WRAPPER TOOL: Running validate_wrapper on '{script_path}'")
 
-    try:
-        import wrapper.linter
-
-        argv = [script_path]
-        if parameters and isinstance(parameters, list):
-            argv.extend(["--parameters"] + parameters)
-
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
-
-        try:
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                exit_code = wrapper.linter.main(argv)
-
-            output = stdout_capture.getvalue()
-            errors = stderr_capture.getvalue()
-            result_text = f"Wrapper validation {'PASSED' if exit_code == 0 else 'FAILED'}\n\n{output}"
-            if errors:
-                result_text += f"\nErrors:\n{errors}"
-            return result_text
-        except SystemExit as e:
-            exit_code = e.code if e.code is not None else 0
-            output = stdout_capture.getvalue()
-            errors = stderr_capture.getvalue()
-            result_text = f"Wrapper validation {'PASSED' if exit_code == 0 else 'FAILED'}\n\n{output}"
-            if errors:
-                result_text += f"\nErrors:\n{errors}"
-            return result_text
-    except Exception as e:
-        error_msg = f"Error running wrapper linter: {str(e)}\n{traceback.format_exc()}"
-        print(f"❌ WRAPPER TOOL: {error_msg}")
-        return error_msg
+# Parameter fields each cached report builder reads; other fields do not affect the output
+_REQUIREMENTS_PARAMETER_FIELDS = ('name', 'type', 'required')
+_STRUCTURE_PARAMETER_FIELDS = ('name', 'type', 'required', 'description', 'default')
 
 
-@wrapper_agent.tool
-def analyze_wrapper_requirements(context: RunContext[str], tool_info: Dict[str, Any], parameters: List[Dict[str, Any]] = None, execution_environment: str = "container") -> str:
+def _freeze_parameters(parameters: List[Dict[str, Any]], fields: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, type, Any], ...], ...]:
     """
-    Analyze tool information to determine optimal wrapper script requirements and implementation strategy.
+    Reduce parameter definitions to nested tuples of the given fields for use as a cache key.
     
-    Args:
-        tool_info: Dictionary with tool information (name, description, language, etc.)
-        parameters: List of parameter definitions for the module
-        execution_environment: Target execution environment ('container', 'local', 'cluster')
+    Each value is stored with its type so that equal values rendering differently (True and 1)
+    do not share a cache entry. Parameter type names are interned so the builders' comparisons
+    against the (compiler-interned) type literals hit the identity fast path.
+    """
+    frozen = []
+    for p in parameters:
+        entries = []
+        for field in fields:
+            if field not in p:
+                continue
+            value = p[field]
+            if field == 'type' and type(value) is str:
+                value = sys.intern(value)
+            entries.append((field, type(value), value))
+        frozen.append(tuple(entries))
+    return tuple(frozen)
+
+
+def _cached_call(func: Callable[..., str], *args) -> str:
+    """Call an lru_cache-wrapped builder, bypassing the cache when the arguments are unhashable."""
+    try:
+        hash(args)
+    except TypeError:
+        return func.__wrapped__(*args)
+    return func(*args)
+
+
+# Recommendation sections of the analyze_wrapper_requirements report
+_REQUIREMENTS_RECOMMENDATIONS = string.Template(
+    "\n**Execution Strategy:**\n"
+    "${environment_strategy}"
+    "${tool_execution}"
+    "\n**Error Handling Requirements:**\n"
+    "- Comprehensive input validation before tool execution\n"
+    "- Clear error messages with actionable guidance\n"
+    "- Proper exit codes (0=success, 1=user error, 2=system error)\n"
+    "- Tool output capture and error reporting\n"
+    "- Graceful handling of interrupted execution\n"
+    "\n**Development Recommendations:**\n"
+    "${development}"
+    "\n**Testing Strategy:**\n"
+    "- Unit tests for parameter validation functions\n"
+    "- Integration tests with sample data\n"
+    "- Error condition testing (missing files, invalid parameters)\n"
+    "- Performance testing with representative datasets\n"
+    "- Cross-platform compatibility testing\n"
+)
+
+_ENVIRONMENT_STRATEGIES = {
+    'container': (
+        "- Container-optimized execution with proper signal handling\n"
+        "- Path mapping between host and container filesystem\n"
+        "- Environment variable propagation\n"
+    ),
+    'cluster': (
+        "- Cluster-aware resource management\n"
+        "- Job scheduling and monitoring integration\n"
+        "- Distributed file system handling\n"
+    ),
+    'local': (
+        "- Local execution with resource monitoring\n"
+        "- Standard file system operations\n"
+        "- Process management and cleanup\n"
+    ),
+}
+
+_TOOL_EXECUTION = {
+    'python': "- Use subprocess for Python tool execution with proper error handling\n",
+    'r': "- Direct R library calls or Rscript execution\n",
+    'c': "- Direct binary execution with argument passing\n",
+    'c++': "- Direct binary execution with argument passing\n",
+}
+
+_DEFAULT_TOOL_EXECUTION = "- Generic command-line tool execution\n"
+
+_DEVELOPMENT_RECOMMENDATIONS = {
+    'python': (
+        "- Use argparse for robust argument parsing\n"
+        "- Implement comprehensive logging with configurable levels\n"
+        "- Use pathlib for cross-platform path handling\n"
+        "- Include type hints for better code documentation\n"
+    ),
+    'bash': (
+        "- Use getopts for argument parsing or manual validation\n"
+        "- Implement proper variable quoting and error checking\n"
+        "- Use 'set -euo pipefail' for strict error handling\n"
+        "- Include comprehensive usage documentation\n"
+    ),
+    'r': (
+        "- Use optparse or argparse for argument handling\n"
+        "- Implement tryCatch for comprehensive error handling\n"
+        "- Use proper R logging mechanisms\n"
+        "- Include session info for reproducibility\n"
+    ),
+}
+
+
+# Tool languages whose wrapper language is chosen without looking at complexity
+_NATIVE_WRAPPER_LANGUAGES = ('python', 'r', 'bash', 'shell')
+
+
+def _assess_tool_complexity(language: str, parameters: List[Dict[str, Any]]) -> Tuple[List[str], int, Dict[str, Any]]:
+    """
+    Score tool complexity from its implementation language and parameters.
     
     Returns:
-        Analysis of wrapper requirements with language recommendations and implementation strategy
+        Tuple of (tool_characteristics, complexity_score, parameter buckets or None without parameters)
     """
-    print(f"🔧 WRAPPER TOOL: Running analyze_wrapper_requirements for '{tool_info.get('name', 'unknown')}' with {len(parameters or [])} parameters (env: {execution_environment})")
-    
-    tool_name = tool_info.get('name', 'Unknown Tool')
-    description = tool_info.get('description', '')
-    language = tool_info.get('language', 'unknown').lower()
-    version = tool_info.get('version', 'latest')
-    
-    analysis = f"Wrapper Script Requirements Analysis for {tool_name}:\n"
-    analysis += "=" * 55 + "\n\n"
-    
-    # Analyze tool characteristics for wrapper design
     tool_characteristics = []
     complexity_score = 0
+    buckets = None
     
     if language in ['python', 'r', 'java', 'scala']:
         tool_characteristics.append("Interpreted/VM-based tool")
@@ -238,598 +355,785 @@ def analyze_wrapper_requirements(context: RunContext[str], tool_info: Dict[str,
     
     if parameters:
         param_count = len(parameters)
-        file_params = [p for p in parameters if p.get('type') == 'File']
-        choice_params = [p for p in parameters if p.get('type') == 'Choice']
-        required_params = [p for p in parameters if p.get('required', False)]
+        buckets = _categorize_parameters(parameters)
         
         if param_count > 10:
             tool_characteristics.append("Many parameters (>10)")
             complexity_score += 2
-        if len(file_params) > 3:
+        if buckets['files'] > 3:
             tool_characteristics.append("Complex file handling")
             complexity_score += 1
-        if len(choice_params) > 2:
+        if buckets['choices'] > 2:
             tool_characteristics.append("Multiple choice parameters")
             complexity_score += 1
-        if len(required_params) > 5:
+        if buckets['required'] > 5:
             tool_characteristics.append("Many required parameters")
             complexity_score += 1
     
-    analysis += f"**Tool Analysis:**\n"
-    analysis += f"- Tool name: {tool_name}\n"
-    analysis += f"- Implementation language: {language.title()}\n"
-    analysis += f"- Execution environment: {execution_environment}\n"
-    analysis += f"- Complexity score: {complexity_score}/7\n"
+    return tool_characteristics, complexity_score, buckets
+
+
+# Wrapper language selection as (wrapper_language, predicate, rationale) rules; the first rule
+# whose predicate accepts (tool language, execution environment, complexity score) wins
+_WRAPPER_LANGUAGE_RULES = [
+    ("python", lambda language, environment, score: language == 'python',
+     "Native Python tool - Python wrapper for seamless integration"),
+    ("r", lambda language, environment, score: language == 'r',
+     "R tool - R wrapper for direct library integration"),
+    ("bash", lambda language, environment, score: language in ('bash', 'shell'),
+     "Shell-based tool - Bash wrapper for native execution"),
+    ("python", lambda language, environment, score: environment == 'container',
+     "Container environment - Python wrapper for robust container integration"),
+    ("python", lambda language, environment, score: score >= 4,
+     "High complexity - Python wrapper for advanced error handling"),
+    ("bash", lambda language, environment, score: True,
+     "Simple tool - Bash wrapper for lightweight execution"),
+]
+
+
+def _recommend_wrapper_language(language: str, execution_environment: str, complexity_score: int) -> Tuple[str, List[str]]:
+    """
+    Choose the wrapper language for a tool.
+    
+    Returns:
+        Tuple of (wrapper_language, rationale)
+    """
+    for wrapper_language, rule, rationale in _WRAPPER_LANGUAGE_RULES:
+        if rule(language, execution_environment, complexity_score):
+            return wrapper_language, [rationale]
+
+
+@functools.lru_cache(maxsize=128)
+def _build_requirements_analysis(tool_name: str, language: str, execution_environment: str,
+                                 parameters: Tuple[Tuple[Tuple[str, type, Any], ...], ...],
+                                 detail_level: str = 'full') -> str:
+    """Build the analyze_wrapper_requirements report from frozen parameter definitions."""
+    parameters = [{field: value for field, _, value in fields} for fields in parameters]
+    
+    parts = [f"Wrapper Script Requirements Analysis for {tool_name}:\n"]
+    parts.append("=" * 55 + "\n\n")
+    
+    if detail_level == 'summary':
+        # Only the recommendation is reported; the complexity score matters only when neither
+        # the tool language nor the environment settles the choice
+        complexity_score = 0
+        if language not in _NATIVE_WRAPPER_LANGUAGES and execution_environment != 'container':
+            _, complexity_score, _ = _assess_tool_complexity(language, parameters)
+        wrapper_language, wrapper_rationale = _recommend_wrapper_language(language, execution_environment, complexity_score)
+        parts.append(f"**Wrapper Language Recommendation: {wrapper_language.upper()}**\n")
+        parts.append(f"- Rationale: {'; '.join(wrapper_rationale)}\n\n")
+        return "".join(parts)
+    
+    # Analyze tool characteristics for wrapper design
+    tool_characteristics, complexity_score, buckets = _assess_tool_complexity(language, parameters)
+    
+    parts.append(f"**Tool Analysis:**\n")
+    parts.append(f"- Tool name: {tool_name}\n")
+    parts.append(f"- Implementation language: {language.title()}\n")
+    parts.append(f"- Execution environment: {execution_environment}\n")
+    parts.append(f"- Complexity score: {complexity_score}/7\n")
     
     if tool_characteristics:
-        analysis += f"- Characteristics: {', '.join(tool_characteristics)}\n"
-    analysis += "\n"
+        parts.append(f"- Characteristics: {', '.join(tool_characteristics)}\n")
+    parts.append("\n")
     
     # Recommend wrapper language
-    wrapper_language = "python"  # Default
-    wrapper_rationale = []
+    wrapper_language, wrapper_rationale = _recommend_wrapper_language(language, execution_environment, complexity_score)
     
-    if language == 'python':
-        wrapper_language = "python"
-        wrapper_rationale.append("Native Python tool - Python wrapper for seamless integration")
-    elif language == 'r':
-        wrapper_language = "r"
-        wrapper_rationale.append("R tool - R wrapper for direct library integration")
-    elif language in ['bash', 'shell']:
-        wrapper_language = "bash"
-        wrapper_rationale.append("Shell-based tool - Bash wrapper for native execution")
-    elif execution_environment == 'container':
-        wrapper_language = "python"
-        wrapper_rationale.append("Container environment - Python wrapper for robust container integration")
-    elif complexity_score >= 4:
-        wrapper_language = "python"
-        wrapper_rationale.append("High complexity - Python wrapper for advanced error handling")
-    else:
-        wrapper_language = "bash"
-        wrapper_rationale.append("Simple tool - Bash wrapper for lightweight execution")
-    
-    analysis += f"**Wrapper Language Recommendation: {wrapper_language.upper()}**\n"
-    analysis += f"- Rationale: {'; '.join(wrapper_rationale)}\n\n"
+    parts.append(f"**Wrapper Language Recommendation: {wrapper_language.upper()}**\n")
+    parts.append(f"- Rationale: {'; '.join(wrapper_rationale)}\n\n")
     
     # Parameter handling strategy
     if parameters:
-        analysis += f"**Parameter Handling Strategy:**\n"
-        analysis += f"- Total parameters: {len(parameters)}\n"
+        parts.append(f"**Parameter Handling Strategy:**\n")
+        parts.append(f"- Total parameters: {len(parameters)}\n")
         
-        param_categories = {
-            'file_inputs': [p for p in parameters if p.get('type') == 'File' and 'input' in p.get('name', '').lower()],
-            'file_outputs': [p for p in parameters if p.get('type') == 'File' and 'output' in p.get('name', '').lower()],
-            'choices': [p for p in parameters if p.get('type') == 'Choice'],
-            'numeric': [p for p in parameters if p.get('type') in ['Integer', 'Float']],
-            'flags': [p for p in parameters if p.get('type') == 'Boolean'],
-            'text': [p for p in parameters if p.get('type') in ['Text', 'String']]
-        }
-        
-        for category, params in param_categories.items():
-            if params:
-                analysis += f"- {category.replace('_', ' ').title()}: {len(params)} parameters\n"
+        for category in _PARAMETER_CATEGORIES:
+            if buckets[category]:
+                parts.append(f"- {category.replace('_', ' ').title()}: {buckets[category]} parameters\n")
         
         # Special handling requirements
         special_handling = []
-        if param_categories['file_inputs']:
+        if buckets['file_inputs']:
             special_handling.append("Input file validation and existence checking")
-        if param_categories['file_outputs']:
+        if buckets['file_outputs']:
             special_handling.append("Output directory creation and write permissions")
-        if param_categories['choices']:
+        if buckets['choices']:
             special_handling.append("Choice parameter validation against allowed values")
-        if any('path' in p.get('name', '').lower() for p in parameters):
+        if buckets['has_path']:
             special_handling.append("Path handling and normalization")
         
         if special_handling:
-            analysis += f"\n**Special Handling Requirements:**\n"
+            parts.append(f"\n**Special Handling Requirements:**\n")
             for requirement in special_handling:
-                analysis += f"- {requirement}\n"
-    
-    # Execution strategy recommendations
-    analysis += f"\n**Execution Strategy:**\n"
-    
-    if execution_environment == 'container':
-        analysis += "- Container-optimized execution with proper signal handling\n"
-        analysis += "- Path mapping between host and container filesystem\n"
-        analysis += "- Environment variable propagation\n"
-    elif execution_environment == 'cluster':
-        analysis += "- Cluster-aware resource management\n"
-        analysis += "- Job scheduling and monitoring integration\n"
-        analysis += "- Distributed file system handling\n"
-    else:
-        analysis += "- Local execution with resource monitoring\n"
-        analysis += "- Standard file system operations\n"
-        analysis += "- Process management and cleanup\n"
+                parts.append(f"- {requirement}\n")
     
-    if language == 'python':
-        analysis += "- Use subprocess for Python tool execution with proper error handling\n"
-    elif language == 'r':
-        analysis += "- Direct R library calls or Rscript execution\n"
-    elif language in ['c', 'c++']:
-        analysis += "- Direct binary execution with argument passing\n"
-    else:
-        analysis += "- Generic command-line tool execution\n"
+    # Execution, error handling, development and testing recommendations
+    parts.append(_REQUIREMENTS_RECOMMENDATIONS.substitute(
+        environment_strategy=_ENVIRONMENT_STRATEGIES.get(execution_environment, _ENVIRONMENT_STRATEGIES['local']),
+        tool_execution=_TOOL_EXECUTION.get(language, _DEFAULT_TOOL_EXECUTION),
+        development=_DEVELOPMENT_RECOMMENDATIONS.get(wrapper_language, ''),
+    ))
     
-    # Error handling recommendations
-    analysis += f"\n**Error Handling Requirements:**\n"
-    analysis += "- Comprehensive input validation before tool execution\n"
-    analysis += "- Clear error messages with actionable guidance\n"
-    analysis += "- Proper exit codes (0=success, 1=user error, 2=system error)\n"
-    analysis += "- Tool output capture and error reporting\n"
-    analysis += "- Graceful handling of interrupted execution\n"
+    return "".join(parts)
+
+
+# Maps parameter name punctuation to underscores for wrapper variable names
+_PARAM_VAR_TABLE = str.maketrans('.-', '__')
+
+# Static fragments of the generate_wrapper_structure skeletons
+_PY_HEADER = (
+    "**Python Wrapper Structure:**\n\n"
+    "```python\n"
+    "#!/usr/bin/env python\n"
+    '"""\nWrapper script for [TOOL_NAME] - [DESCRIPTION]\n"""\n\n'
+    "import argparse\nimport os\nimport sys\nimport subprocess\nimport logging\nfrom pathlib import Path\n\n"
+    "def setup_logging(verbose=False):\n"
+    '    """Configure logging for the wrapper."""\n'
+    "    level = logging.DEBUG if verbose else logging.INFO\n"
+    "    logging.basicConfig(level=level, format='%(levelname)s: %(message)s')\n\n"
+    "def parse_arguments():\n"
+    '    """Parse and validate command line arguments."""\n'
+    '    parser = argparse.ArgumentParser(description="[TOOL_NAME] wrapper")\n\n'
+)
+
+_PY_ARGS_FOOTER = (
+    "    return parser.parse_args()\n\n"
+    "def validate_inputs(args):\n"
+    '    """Validate input parameters and files."""\n'
+    "    # Add input validation logic here\n"
+    "    pass\n\n"
+    "def run_tool(args):\n"
+    '    """Execute the underlying tool with validated parameters."""\n'
+)
+
+_PY_MAIN_FOOTER = (
+    "    # Add parameter-to-command mapping here\n"
+    "    \n"
+    "    try:\n"
+    "        result = subprocess.run(cmd, check=True, capture_output=True, text=True)\n"
+    "        return True\n"
+    "    except subprocess.CalledProcessError as e:\n"
+    "        logging.error(f'Tool execution failed: {e}')\n"
+    "        return False\n\n"
+    "def main():\n"
+    "    args = parse_arguments()\n"
+    "    setup_logging(getattr(args, 'verbose', False))\n"
+    "    validate_inputs(args)\n"
+    "    success = run_tool(args)\n"
+    "    sys.exit(0 if success else 1)\n\n"
+    "if __name__ == '__main__':\n"
+    "    main()\n"
+    "```\n\n"
+)
+
+_BASH_HEADER = (
+    "**Bash Wrapper Structure:**\n\n"
+    "```bash\n"
+    "#!/bin/bash\n"
+    "set -euo pipefail  # Exit on error, undefined vars, pipe failures\n\n"
+    "# Tool information\n"
+    "TOOL_NAME=\"[TOOL_NAME]\"\n"
+)
+
+_BASH_USAGE_HEADER = (
+    "\n"
+    "usage() {\n"
+    '    echo "Usage: $0 [OPTIONS]"\n'
+    '    echo "Options:"\n'
+)
+
+_BASH_PARSE_HEADER = (
+    '    exit 1\n'
+    "}\n\n"
+    "parse_arguments() {\n"
+    "    while [[ $# -gt 0 ]]; do\n"
+    "        case $1 in\n"
+)
+
+_BASH_PARSE_FOOTER = (
+    "            -h|--help)\n"
+    "                usage\n"
+    "                ;;\n"
+    "            *)\n"
+    '                echo "Unknown option: $1"\n'
+    "                usage\n"
+    "                ;;\n"
+    "        esac\n"
+    "    done\n"
+    "}\n\n"
+    "validate_inputs() {\n"
+    "    # Add input validation logic here\n"
+    "    return 0\n"
+    "}\n\n"
+    "run_tool() {\n"
+    "    $TOOL_COMMAND \\\n"
+)
+
+_BASH_FOOTER = (
+    "        # Add more parameters as needed\n"
+    "}\n\n"
+    "main() {\n"
+    "    parse_arguments \"$@\"\n"
+    "    validate_inputs\n"
+    "    run_tool\n"
+    "}\n\n"
+    "main \"$@\"\n"
+    "```\n\n"
+)
+
+_R_HEADER = (
+    "**R Wrapper Structure:**\n\n"
+    "```r\n"
+    "#!/usr/bin/env Rscript\n\n"
+    "# Load required libraries\n"
+    "suppressMessages({\n"
+    "  library(optparse)\n"
+    "  library(futile.logger)\n"
+    "})\n\n"
+    "# Define command line options\n"
+    "option_list <- list(\n"
+)
+
+_R_OPTIONS_FOOTER = (
+    ")\n\n"
+    "# Parse arguments\n"
+    "opt_parser <- OptionParser(option_list=option_list)\n"
+    "opt <- parse_args(opt_parser)\n\n"
+    "validate_inputs <- function(opt) {\n"
+    "  # Add input validation logic here\n"
+    "  return(TRUE)\n"
+    "}\n\n"
+    "run_tool <- function(opt) {\n"
+    "  tryCatch({\n"
+)
+
+_R_FOOTER = (
+    "                 collapse=' ')\n"
+    "    \n"
+    "    result <- system(cmd, intern=TRUE)\n"
+    "    return(TRUE)\n"
+    "  }, error = function(e) {\n"
+    "    flog.error('Tool execution failed: %s', e$message)\n"
+    "    return(FALSE)\n"
+    "  })\n"
+    "}\n\n"
+    "# Main execution\n"
+    "main <- function() {\n"
+    "  if (!validate_inputs(opt)) {\n"
+    "    quit(status=1)\n"
+    "  }\n"
+    "  \n"
+    "  success <- run_tool(opt)\n"
+    "  quit(status=if(success) 0 else 1)\n"
+    "}\n\n"
+    "main()\n"
+    "```\n\n"
+)
+
+_STRUCTURE_GUIDELINES_FOOTER = (
+    "- Required parameter presence validation\n"
+    "- Parameter type and format validation\n"
+    "\n**Error Handling:**\n"
+    "- Return exit code 0 for success\n"
+    "- Return exit code 1 for user/input errors\n"
+    "- Return exit code 2 for system/tool errors\n"
+    "- Provide clear, actionable error messages\n"
+    "- Log intermediate steps for debugging\n"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_wrapper_structure(language: str, tool_command: str,
+                             parameters: Tuple[Tuple[Tuple[str, type, Any], ...], ...]) -> str:
+    """Build the generate_wrapper_structure report from frozen parameter definitions."""
+    parameters = [{field: value for field, _, value in fields} for fields in parameters]
+    n_params = len(parameters)
     
-    # Development recommendations
-    analysis += f"\n**Development Recommendations:**\n"
-    
-    if wrapper_language == 'python':
-        analysis += "- Use argparse for robust argument parsing\n"
-        analysis += "- Implement comprehensive logging with configurable levels\n"
-        analysis += "- Use pathlib for cross-platform path handling\n"
-        analysis += "- Include type hints for better code documentation\n"
-    elif wrapper_language == 'bash':
-        analysis += "- Use getopts for argument parsing or manual validation\n"
-        analysis += "- Implement proper variable quoting and error checking\n"
-        analysis += "- Use 'set -euo pipefail' for strict error handling\n"
-        analysis += "- Include comprehensive usage documentation\n"
-    elif wrapper_language == 'r':
-        analysis += "- Use optparse or argparse for argument handling\n"
-        analysis += "- Implement tryCatch for comprehensive error handling\n"
-        analysis += "- Use proper R logging mechanisms\n"
-        analysis += "- Include session info for reproducibility\n"
-    
-    analysis += f"\n**Testing Strategy:**\n"
-    analysis += "- Unit tests for parameter validation functions\n"
-    analysis += "- Integration tests with sample data\n"
-    analysis += "- Error condition testing (missing files, invalid parameters)\n"
-    analysis += "- Performance testing with representative datasets\n"
-    analysis += "- Cross-platform compatibility testing\n"
-    
-    print("✅ WRAPPER TOOL: analyze_wrapper_requirements completed successfully")
-    return analysis
-
-
-@wrapper_agent.tool
-def generate_wrapper_structure(context: RunContext[str], language: str, parameters: List[Dict[str, Any]], tool_command: str) -> str:
-    """
-    Generate the basic structure and key components for a wrapper script in the specified language.
-    
-    Args:
-        language: Programming language for the wrapper ('python', 'bash', 'r')
-        parameters: List of parameter definitions for argument parsing
-        tool_command: Base command to execute the underlying tool
-    
-    Returns:
-        Detailed wrapper script structure with key functions and implementation guidelines
-    """
-    print(f"🏗️ WRAPPER TOOL: Running generate_wrapper_structure for {language} with {len(parameters)} parameters")
-    
-    if not parameters:
-        print("❌ WRAPPER TOOL: generate_wrapper_structure failed - no parameters provided")
-        return "Error: No parameters provided for wrapper structure generation"
-    
-    language = language.lower()
-    if language not in ['python', 'bash', 'r']:
-        print(f"❌ WRAPPER TOOL: generate_wrapper_structure failed - unsupported language: {language}")
-        return f"Error: Unsupported wrapper language: {language}. Supported: python, bash, r"
-    
-    structure = f"Wrapper Script Structure for {language.upper()}:\n"
-    structure += "=" * 45 + "\n\n"
+    parts = [f"Wrapper Script Structure for {language.upper()}:\n"]
+    parts.append("=" * 45 + "\n\n")
     
     # Language-specific structure
     if language == 'python':
-        structure += "**Python Wrapper Structure:**\n\n"
-        structure += "```python\n"
-        structure += "#!/usr/bin/env python\n"
-        structure += '"""\nWrapper script for [TOOL_NAME] - [DESCRIPTION]\n"""\n\n'
-        structure += "import argparse\nimport os\nimport sys\nimport subprocess\nimport logging\nfrom pathlib import Path\n\n"
-        
-        structure += "def setup_logging(verbose=False):\n"
-        structure += '    """Configure logging for the wrapper."""\n'
-        structure += "    level = logging.DEBUG if verbose else logging.INFO\n"
-        structure += "    logging.basicConfig(level=level, format='%(levelname)s: %(message)s')\n\n"
-        
-        structure += "def parse_arguments():\n"
-        structure += '    """Parse and validate command line arguments."""\n'
-        structure += '    parser = argparse.ArgumentParser(description="[TOOL_NAME] wrapper")\n\n'
+        parts.append(_PY_HEADER)
         
         # Generate parameter parsing
-        for param in parameters[:5]:  # Show first 5 as example
+        for param in itertools.islice(parameters, 5):  # Show first 5 as example
             param_name = param.get('name', 'unknown')
             param_type = param.get('type', 'Text')
             required = param.get('required', False)
             description = param.get('description', f'{param_name} parameter')
-            param_var = param_name.replace('.', '_').replace('-', '_')
+            param_var = param_name.translate(_PARAM_VAR_TABLE)
 
-            structure += f"    parser.add_argument('--{param_name}', dest='{param_var}',\n"
+            parts.append(f"    parser.add_argument('--{param_name}', dest='{param_var}',\n")
             if required:
-                structure += "                       required=True,\n"
+                parts.append("                       required=True,\n")
             if param_type == 'Choice':
-                structure += "                       choices=['option1', 'option2'],\n"
+                parts.append("                       choices=['option1', 'option2'],\n")
             elif param_type in ['Integer', 'Float']:
-                structure += f"                       type={param_type.lower()},\n"
+                parts.append(f"                       type={param_type.lower()},\n")
             elif param_type == 'Boolean':
-                structure += "                       action='store_true',\n"
-            structure += f"                       help='{description}')\n\n"
+                parts.append("                       action='store_true',\n")
+            parts.append(f"                       help='{description}')\n\n")
         
-        if len(parameters) > 5:
-            structure += f"    # ... ({len(parameters) - 5} more parameters)\n\n"
+        if n_params > 5:
+            parts.append(f"    # ... ({n_params - 5} more parameters)\n\n")
         
-        structure += "    return parser.parse_args()\n\n"
-        
-        structure += "def validate_inputs(args):\n"
-        structure += '    """Validate input parameters and files."""\n'
-        structure += "    # Add input validation logic here\n"
-        structure += "    pass\n\n"
-        
-        structure += "def run_tool(args):\n"
-        structure += '    """Execute the underlying tool with validated parameters."""\n'
-        structure += f"    cmd = ['{tool_command}']\n"
-        structure += "    # Add parameter-to-command mapping here\n"
-        structure += "    \n"
-        structure += "    try:\n"
-        structure += "        result = subprocess.run(cmd, check=True, capture_output=True, text=True)\n"
-        structure += "        return True\n"
-        structure += "    except subprocess.CalledProcessError as e:\n"
-        structure += "        logging.error(f'Tool execution failed: {e}')\n"
-        structure += "        return False\n\n"
-        
-        structure += "def main():\n"
-        structure += "    args = parse_arguments()\n"
-        structure += "    setup_logging(getattr(args, 'verbose', False))\n"
-        structure += "    validate_inputs(args)\n"
-        structure += "    success = run_tool(args)\n"
-        structure += "    sys.exit(0 if success else 1)\n\n"
-        structure += "if __name__ == '__main__':\n"
-        structure += "    main()\n"
-        structure += "```\n\n"
+        parts.append(_PY_ARGS_FOOTER)
+        parts.append(f"    cmd = ['{tool_command}']\n")
+        parts.append(_PY_MAIN_FOOTER)
     
     elif language == 'bash':
-        structure += "**Bash Wrapper Structure:**\n\n"
-        structure += "```bash\n"
-        structure += "#!/bin/bash\n"
-        structure += "set -euo pipefail  # Exit on error, undefined vars, pipe failures\n\n"
-        structure += "# Tool information\n"
-        structure += "TOOL_NAME=\"[TOOL_NAME]\"\n"
-        structure += f"TOOL_COMMAND=\"{tool_command}\"\n\n"
-        
-        structure += "# Default parameter values\n"
-        for param in parameters[:3]:
-            param_name = param.get('name', 'unknown').upper().replace('.', '_').replace('-', '_')
-            default_value = param.get('default', '""')
-            structure += f"{param_name}={default_value}\n"
-        structure += "\n"
+        parts.append(_BASH_HEADER)
+        parts.append(f"TOOL_COMMAND=\"{tool_command}\"\n\n")
         
-        structure += "usage() {\n"
-        structure += '    echo "Usage: $0 [OPTIONS]"\n'
-        structure += '    echo "Options:"\n'
-        for param in parameters[:3]:
+        # Name and shell variable of each parameter shown in the example, derived once
+        shown = []
+        for param in itertools.islice(parameters, 3):
             param_name = param.get('name', 'unknown')
-            description = param.get('description', f'{param_name} parameter')
-            structure += f'    echo "  --{param_name} VALUE    {description}"\n'
-        structure += '    exit 1\n'
-        structure += "}\n\n"
-        
-        structure += "parse_arguments() {\n"
-        structure += "    while [[ $# -gt 0 ]]; do\n"
-        structure += "        case $1 in\n"
-        for param in parameters[:3]:
-            param_name = param.get('name', 'unknown')
-            param_var = param_name.upper().replace('.', '_').replace('-', '_')
-            structure += f"            --{param_name})\n"
-            structure += f"                {param_var}=\"$2\"\n"
-            structure += "                shift 2\n"
-            structure += "                ;;\n"
-        structure += "            -h|--help)\n"
-        structure += "                usage\n"
-        structure += "                ;;\n"
-        structure += "            *)\n"
-        structure += '                echo "Unknown option: $1"\n'
-        structure += "                usage\n"
-        structure += "                ;;\n"
-        structure += "        esac\n"
-        structure += "    done\n"
-        structure += "}\n\n"
-        
-        structure += "validate_inputs() {\n"
-        structure += "    # Add input validation logic here\n"
-        structure += "    return 0\n"
-        structure += "}\n\n"
+            shown.append((param, param_name, param_name.upper().translate(_PARAM_VAR_TABLE)))
         
-        structure += "run_tool() {\n"
-        structure += f"    $TOOL_COMMAND \\\n"
-        for param in parameters[:3]:
-            param_name = param.get('name', 'unknown')
-            param_var = param_name.upper().replace('.', '_').replace('-', '_')
-            structure += f"        --{param_name} \"${param_var}\" \\\n"
-        structure += "        # Add more parameters as needed\n"
-        structure += "}\n\n"
-        
-        structure += "main() {\n"
-        structure += "    parse_arguments \"$@\"\n"
-        structure += "    validate_inputs\n"
-        structure += "    run_tool\n"
-        structure += "}\n\n"
-        structure += "main \"$@\"\n"
-        structure += "```\n\n"
+        parts.append("# Default parameter values\n")
+        for param, param_name, param_var in shown:
+            default_value = param.get('default', '""')
+            parts.append(f"{param_var}={default_value}\n")
+        parts.append(_BASH_USAGE_HEADER)
+        for param, param_name, param_var in shown:
+            description = param.get('description', f'{param_name} parameter')
+            parts.append(f'    echo "  --{param_name} VALUE    {description}"\n')
+        parts.append(_BASH_PARSE_HEADER)
+        for param, param_name, param_var in shown:
+            parts.append(f"            --{param_name})\n")
+            parts.append(f"                {param_var}=\"$2\"\n")
+            parts.append("                shift 2\n")
+            parts.append("                ;;\n")
+        parts.append(_BASH_PARSE_FOOTER)
+        for param, param_name, param_var in shown:
+            parts.append(f"        --{param_name} \"${param_var}\" \\\n")
+        parts.append(_BASH_FOOTER)
     
     elif language == 'r':
-        structure += "**R Wrapper Structure:**\n\n"
-        structure += "```r\n"
-        structure += "#!/usr/bin/env Rscript\n\n"
-        structure += "# Load required libraries\n"
-        structure += "suppressMessages({\n"
-        structure += "  library(optparse)\n"
-        structure += "  library(futile.logger)\n"
-        structure += "})\n\n"
-        
-        structure += "# Define command line options\n"
-        structure += "option_list <- list(\n"
-        for i, param in enumerate(parameters[:3]):
+        # Name and R variable of each parameter shown in the example, derived once
+        shown = []
+        for param in itertools.islice(parameters, 3):
             param_name = param.get('name', 'unknown')
+            shown.append((param, param_name, param_name.translate(_PARAM_VAR_TABLE)))
+        
+        parts.append(_R_HEADER)
+        for i, (param, param_name, param_var) in enumerate(shown):
             param_type = param.get('type', 'character')
             description = param.get('description', f'{param_name} parameter')
             r_type = 'character' if param_type in ['Text', 'File', 'Choice'] else 'numeric'
-            param_var = param_name.replace('.', '_').replace('-', '_')
-
-            structure += f"  make_option(c('--{param_name}'), type='{r_type}',\n"
-            structure += f"              help='{description}')"
-            if i < min(len(parameters), 3) - 1:
-                structure += ","
-            structure += "\n"
-        structure += ")\n\n"
-        
-        structure += "# Parse arguments\n"
-        structure += "opt_parser <- OptionParser(option_list=option_list)\n"
-        structure += "opt <- parse_args(opt_parser)\n\n"
-        
-        structure += "validate_inputs <- function(opt) {\n"
-        structure += "  # Add input validation logic here\n"
-        structure += "  return(TRUE)\n"
-        structure += "}\n\n"
-        
-        structure += "run_tool <- function(opt) {\n"
-        structure += "  tryCatch({\n"
-        structure += f"    cmd <- paste('{tool_command}',\n"
-        for param in parameters[:3]:
-            param_name = param.get('name', 'unknown')
-            param_var = param_name.replace('.', '_').replace('-', '_')
-            structure += f"                 '--{param_name}', opt${param_var},\n"
-        structure += "                 collapse=' ')\n"
-        structure += "    \n"
-        structure += "    result <- system(cmd, intern=TRUE)\n"
-        structure += "    return(TRUE)\n"
-        structure += "  }, error = function(e) {\n"
-        structure += "    flog.error('Tool execution failed: %s', e$message)\n"
-        structure += "    return(FALSE)\n"
-        structure += "  })\n"
-        structure += "}\n\n"
-        
-        structure += "# Main execution\n"
-        structure += "main <- function() {\n"
-        structure += "  if (!validate_inputs(opt)) {\n"
-        structure += "    quit(status=1)\n"
-        structure += "  }\n"
-        structure += "  \n"
-        structure += "  success <- run_tool(opt)\n"
-        structure += "  quit(status=if(success) 0 else 1)\n"
-        structure += "}\n\n"
-        structure += "main()\n"
-        structure += "```\n\n"
+
+            parts.append(f"  make_option(c('--{param_name}'), type='{r_type}',\n")
+            parts.append(f"              help='{description}')")
+            if i < min(n_params, 3) - 1:
+                parts.append(",")
+            parts.append("\n")
+        parts.append(_R_OPTIONS_FOOTER)
+        parts.append(f"    cmd <- paste('{tool_command}',\n")
+        for param, param_name, param_var in shown:
+            parts.append(f"                 '--{param_name}', opt${param_var},\n")
+        parts.append(_R_FOOTER)
     
     # Implementation guidelines
-    structure += f"**Implementation Guidelines:**\n\n"
+    parts.append(f"**Implementation Guidelines:**\n\n")
     
-    structure += f"**Parameter Mapping:**\n"
+    parts.append(f"**Parameter Mapping:**\n")
     for param in parameters:
         param_name = param.get('name', 'unknown')
         param_type = param.get('type', 'Text')
         required = 'Required' if param.get('required', False) else 'Optional'
-        structure += f"- {param_name}: {param_type} ({required})\n"
-    
-    structure += f"\n**Validation Requirements:**\n"
-    file_params = [p for p in parameters if p.get('type') == 'File']
-    choice_params = [p for p in parameters if p.get('type') == 'Choice']
-    
-    if file_params:
-        structure += "- File existence and readability checks\n"
-    if choice_params:
-        structure += "- Choice parameter validation against allowed values\n"
-    structure += "- Required parameter presence validation\n"
-    structure += "- Parameter type and format validation\n"
-    
-    structure += f"\n**Error Handling:**\n"
-    structure += "- Return exit code 0 for success\n"
-    structure += "- Return exit code 1 for user/input errors\n"
-    structure += "- Return exit code 2 for system/tool errors\n"
-    structure += "- Provide clear, actionable error messages\n"
-    structure += "- Log intermediate steps for debugging\n"
-    
-    print("✅ WRAPPER TOOL: generate_wrapper_structure completed successfully")
+        parts.append(f"- {param_name}: {param_type} ({required})\n")
+    
+    parts.append(f"\n**Validation Requirements:**\n")
+    buckets = _categorize_parameters(parameters)
+    
+    if buckets['files']:
+        parts.append("- File existence and readability checks\n")
+    if buckets['choices']:
+        parts.append("- Choice parameter validation against allowed values\n")
+    parts.append(_STRUCTURE_GUIDELINES_FOOTER)
+    
+    return "".join(parts)
+
+
+class WrapperValidationResult(BaseModel):
+    """Structured result of the validate_wrapper tool"""
+    passed: bool  # Whether the wrapper script passed all linter checks
+    exit_code: int  # Linter exit code (0 on PASS, 1 on FAIL)
+    stdout: str  # Linter report
+    stderr: str  # Error output, empty when the linter ran normally
+
+    def __str__(self) -> str:
+        text = f"Wrapper validation {'PASSED' if self.passed else 'FAILED'}\n\n{self.stdout}"
+        if self.stderr:
+            text += f"\nErrors:\n{self.stderr}"
+        return text
+
+
+def validate_wrapper(context: RunContext[str], script_path: str, parameters: List[str] = None) -> WrapperValidationResult:
+    """
+    Validate GenePattern wrapper scripts.
+
+    This tool validates wrapper scripts that serve as the interface between
+    GenePattern and the underlying analysis tools. Wrapper scripts handle
+    parameter parsing, input validation, tool execution, and output formatting.
+
+    Args:
+        script_path: Path to the wrapper script file to validate. Can be Python,
+                    R, shell script, or other executable formats. The script should
+                    follow GenePattern wrapper conventions for parameter handling
+                    and output generation.
+        parameters: Optional list of parameter names that the wrapper script
+                   should handle. If provided, validates that the script properly
+                   processes all specified parameters, including required parameter
+                   validation and optional parameter defaults.
+
+    Returns:
+        A WrapperValidationResult whose passed flag tells whether the wrapper script
+        follows proper conventions, handles parameters correctly, and includes necessary
+        error handling; stdout holds the linter report with any syntax errors or missing
+        functionality. str() of the result gives the plain text report.
+    """
+    logger.debug("WRAPPER TOOL: Running validate_wrapper on %r", script_path)
+
+    try:
+        if _linter is None:
+            raise ImportError("wrapper.linter could not be imported")
+
+        expected_parameters = parameters if parameters and isinstance(parameters, list) else None
+        exit_code, output, errors = _linter.lint(script_path, expected_parameters)
+
+        return WrapperValidationResult(passed=exit_code == 0, exit_code=exit_code, stdout=output, stderr=errors)
+    except Exception as e:
+        error_msg = f"Error running wrapper linter: {e!r}"
+        # The full traceback is only formatted when debugging is requested
+        if os.getenv('WRAPPER_DEBUG'):
+            import traceback
+            error_msg += f"\n{traceback.format_exc()}"
+        logger.error("WRAPPER TOOL: %s", error_msg)
+        return WrapperValidationResult(passed=False, exit_code=1, stdout="", stderr=error_msg)
+
+
+def analyze_wrapper_requirements(context: RunContext[str], tool_info: Dict[str, Any], parameters: List[Dict[str, Any]] = None, execution_environment: str = "container", detail_level: str = "full") -> str:
+    """
+    Analyze tool information to determine optimal wrapper script requirements and implementation strategy.
+    
+    Use detail_level='summary' when only the wrapper language recommendation is needed.
+    
+    Args:
+        tool_info: Dictionary with tool information (name, description, language, etc.)
+        parameters: List of parameter definitions for the module
+        execution_environment: Target execution environment ('container', 'local', 'cluster')
+        detail_level: 'full' for the complete analysis, or 'summary' for just the wrapper
+                      language recommendation and its rationale
+    
+    Returns:
+        Analysis of wrapper requirements with language recommendations and implementation strategy
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("WRAPPER TOOL: Running analyze_wrapper_requirements for %r with %d parameters (env: %s)",
+                     tool_info.get('name', 'unknown'), len(parameters or []), execution_environment)
+    
+    tool_name = tool_info.get('name', 'Unknown Tool')
+    language = tool_info.get('language', 'unknown').lower()
+    
+    analysis = _cached_call(_build_requirements_analysis, tool_name, language, execution_environment,
+                            _freeze_parameters(parameters or (), _REQUIREMENTS_PARAMETER_FIELDS), detail_level)
+    
+    logger.debug("WRAPPER TOOL: analyze_wrapper_requirements completed successfully")
+    return analysis
+
+
+def generate_wrapper_structure(context: RunContext[str], language: str, parameters: List[Dict[str, Any]], tool_command: str) -> str:
+    """
+    Generate the basic structure and key components for a wrapper script in the specified language.
+    
+    Args:
+        language: Programming language for the wrapper ('python', 'bash', 'r')
+        parameters: List of parameter definitions for argument parsing
+        tool_command: Base command to execute the underlying tool
+    
+    Returns:
+        Detailed wrapper script structure with key functions and implementation guidelines
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("WRAPPER TOOL: Running generate_wrapper_structure for %s with %d parameters",
+                     language, len(parameters))
+    
+    if not parameters:
+        logger.error("WRAPPER TOOL: generate_wrapper_structure failed - no parameters provided")
+        return "Error: No parameters provided for wrapper structure generation"
+    
+    language = language.lower()
+    if language not in ['python', 'bash', 'r']:
+        logger.error("WRAPPER TOOL: generate_wrapper_structure failed - unsupported language: %s", language)
+        return f"Error: Unsupported wrapper language: {language}. Supported: python, bash, r"
+    
+    structure = _cached_call(_build_wrapper_structure, language, tool_command,
+                             _freeze_parameters(parameters, _STRUCTURE_PARAMETER_FIELDS))
+    
+    logger.debug("WRAPPER TOOL: generate_wrapper_structure completed successfully")
     return structure
 
 
-@wrapper_agent.tool
-def optimize_wrapper_performance(context: RunContext[str], wrapper_content: str, performance_goals: List[str] = None) -> str:
+def optimize_wrapper_performance(context: RunContext[str], wrapper_content: str, performance_goals: List[str] = None, include_sections: List[str] = None, return_format: Literal["markdown", "dict"] = "markdown") -> Union[str, Dict[str, Any]]:
     """
     Analyze wrapper script content and suggest performance optimizations and best practices.
     
     Args:
         wrapper_content: Current wrapper script content to analyze
         performance_goals: List of performance goals ('speed', 'memory', 'reliability', 'maintainability')
+        include_sections: Report sections to include ('optimizations', 'best_practices', 'monitoring',
+                          'testing'). Defaults to all sections.
+        return_format: 'markdown' for the formatted report, or 'dict' for the structured analysis
+                       without rendering it to text
     
     Returns:
-        Analysis with specific optimization recommendations and implementation improvements
+        Analysis with specific optimization recommendations and implementation improvements;
+        in 'dict' format, a dictionary with an 'error' key when no content is provided
     """
-    print(f"⚡ WRAPPER TOOL: Running optimize_wrapper_performance (content length: {len(wrapper_content)} chars)")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("WRAPPER TOOL: Running optimize_wrapper_performance (content length: %d chars)",
+                     len(wrapper_content))
     
     if performance_goals is None:
         performance_goals = ['reliability', 'speed']
     
     if not wrapper_content.strip():
-        print("❌ WRAPPER TOOL: optimize_wrapper_performance failed - no content provided")
-        return "Error: No wrapper content provided for performance analysis"
+        logger.error("WRAPPER TOOL: optimize_wrapper_performance failed - no content provided")
+        error_msg = "No wrapper content provided for performance analysis"
+        if return_format == "dict":
+            return {"error": error_msg}
+        return f"Error: {error_msg}"
+    
+    if return_format == "dict":
+        analysis = _analyze_wrapper_performance(wrapper_content, performance_goals, include_sections)
+    else:
+        analysis = "".join(optimize_wrapper_performance_iter(wrapper_content, performance_goals, include_sections))
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("WRAPPER TOOL: optimize_wrapper_performance completed successfully")
+    return analysis
+
+
+def _analyze_wrapper_performance(wrapper_content: str, performance_goals: List[str] = None,
+                                 include_sections: List[str] = None) -> Dict[str, Any]:
+    """
+    Collect the performance analysis for a wrapper script as structured data.
     
-    analysis = "Wrapper Performance Optimization:\n"
-    analysis += "=" * 40 + "\n\n"
+    Returns:
+        Dictionary with the detected language, content statistics and one entry per
+        requested section; 'optimizations' maps each category to its recommendations
+    """
+    if performance_goals is None:
+        performance_goals = ['reliability', 'speed']
+    
+    sections = _ALL_SECTIONS if include_sections is None else frozenset(include_sections)
     
     # Detect wrapper language
-    wrapper_language = "unknown"
-    if wrapper_content.startswith("#!/usr/bin/env python") or "import " in wrapper_content:
-        wrapper_language = "python"
-    elif wrapper_content.startswith("#!/bin/bash") or "#!/bin/sh" in wrapper_content:
-        wrapper_language = "bash"
-    elif wrapper_content.startswith("#!/usr/bin/env Rscript") or "library(" in wrapper_content:
-        wrapper_language = "r"
-    
-    analysis += f"**Wrapper Analysis:**\n"
-    analysis += f"- Detected language: {wrapper_language.upper()}\n"
-    analysis += f"- Content size: {len(wrapper_content)} characters\n"
-    analysis += f"- Lines of code: {len(wrapper_content.splitlines())}\n"
-    analysis += f"- Optimization goals: {', '.join(performance_goals)}\n\n"
-    
-    # Analyze current implementation
-    optimizations = []
-    
-    # Performance goal-specific analysis
-    if 'speed' in performance_goals:
-        speed_optimizations = []
+    wrapper_language = _detect_wrapper_language(wrapper_content)
+    
+    analysis = {
+        "language": wrapper_language,
+        "content_size": len(wrapper_content),
+        "lines_of_code": len(wrapper_content.splitlines()),
+        "performance_goals": list(performance_goals),
+    }
+    
+    if "optimizations" in sections:
+        # Analyze current implementation
+        optimizations = {}
+        probes = _scan_probes(wrapper_content)
+        goals = frozenset(performance_goals)
+    
+        # Performance goal-specific analysis
+        if 'speed' in goals:
+            speed_optimizations = []
         
-        if wrapper_language == "python":
-            if "subprocess.run" in wrapper_content and "capture_output=True" in wrapper_content:
-                speed_optimizations.append("Consider streaming output for large datasets instead of capturing all at once")
-            if "import " in wrapper_content and len(re.findall(r'import \w+', wrapper_content)) > 10:
-                speed_optimizations.append("Reduce import overhead by importing only needed modules")
+            if wrapper_language == "python":
+                if probes["subprocess.run"] and probes["capture_output=True"]:
+                    speed_optimizations.append("Consider streaming output for large datasets instead of capturing all at once")
+                if "import " in wrapper_content and sum(1 for _ in itertools.islice(_IMPORT_RE.finditer(wrapper_content), 11)) > 10:
+                    speed_optimizations.append("Reduce import overhead by importing only needed modules")
             
-        elif wrapper_language == "bash":
-            if "$(command)" in wrapper_content or "`command`" in wrapper_content:
-                speed_optimizations.append("Minimize subshell usage - store command results in variables")
-            if wrapper_content.count("grep") > 3:
-                speed_optimizations.append("Combine multiple grep operations or use more efficient text processing")
+            elif wrapper_language == "bash":
+                if probes["$(command)"] or probes["`command`"]:
+                    speed_optimizations.append("Minimize subshell usage - store command results in variables")
+                if probes["grep"] > 3:
+                    speed_optimizations.append("Combine multiple grep operations or use more efficient text processing")
         
-        if speed_optimizations:
-            optimizations.append(("Speed Optimizations", speed_optimizations))
+            if speed_optimizations:
+                optimizations["Speed Optimizations"] = speed_optimizations
     
-    if 'memory' in performance_goals:
-        memory_optimizations = []
+        if 'memory' in goals:
+            memory_optimizations = []
         
-        if wrapper_language == "python":
-            if "capture_output=True" in wrapper_content:
-                memory_optimizations.append("Stream large tool outputs instead of loading into memory")
-            if ".read()" in wrapper_content:
-                memory_optimizations.append("Use generators or chunked reading for large files")
+            if wrapper_language == "python":
+                if probes["capture_output=True"]:
+                    memory_optimizations.append("Stream large tool outputs instead of loading into memory")
+                if probes[".read()"]:
+                    memory_optimizations.append("Use generators or chunked reading for large files")
         
-        elif wrapper_language == "r":
-            if "read.csv" in wrapper_content or "read.table" in wrapper_content:
-                memory_optimizations.append("Use data.table::fread() for faster, memory-efficient file reading")
+            elif wrapper_language == "r":
+                if probes["read.csv"] or probes["read.table"]:
+                    memory_optimizations.append("Use data.table::fread() for faster, memory-efficient file reading")
         
-        if memory_optimizations:
-            optimizations.append(("Memory Optimizations", memory_optimizations))
+            if memory_optimizations:
+                optimizations["Memory Optimizations"] = memory_optimizations
     
-    if 'reliability' in performance_goals:
-        reliability_optimizations = []
+        if 'reliability' in goals:
+            reliability_optimizations = []
         
-        # Common reliability issues
-        if "try:" not in wrapper_content and "tryCatch" not in wrapper_content:
-            reliability_optimizations.append("Add comprehensive error handling with try/catch blocks")
+            # Common reliability issues
+            if not probes["try:"] and not probes["tryCatch"]:
+                reliability_optimizations.append("Add comprehensive error handling with try/catch blocks")
         
-        if wrapper_language == "bash" and "set -e" not in wrapper_content:
-            reliability_optimizations.append("Add 'set -euo pipefail' for strict error handling")
+            if wrapper_language == "bash" and not probes["set -e"]:
+                reliability_optimizations.append("Add 'set -euo pipefail' for strict error handling")
         
-        if wrapper_language == "python" and "logging" not in wrapper_content:
-            reliability_optimizations.append("Add logging for better debugging and monitoring")
+            if wrapper_language == "python" and not probes["logging"]:
+                reliability_optimizations.append("Add logging for better debugging and monitoring")
         
-        # File handling checks
-        if "os.path.exists" not in wrapper_content and "file.exists" not in wrapper_content and "[ -f " not in wrapper_content:
-            reliability_optimizations.append("Add file existence checks before processing")
+            # File handling checks
+            if not probes["os.path.exists"] and not probes["file.exists"] and not probes["[ -f "]:
+                reliability_optimizations.append("Add file existence checks before processing")
         
-        if reliability_optimizations:
-            optimizations.append(("Reliability Improvements", reliability_optimizations))
+            if reliability_optimizations:
+                optimizations["Reliability Improvements"] = reliability_optimizations
     
-    if 'maintainability' in performance_goals:
-        maintainability_optimizations = []
+        if 'maintainability' in goals:
+            maintainability_optimizations = [message for rule, message in _MAINTAINABILITY_RULES
+                                             if rule(wrapper_content, probes, analysis["lines_of_code"])]
         
-        # Code organization
-        lines = wrapper_content.splitlines()
-        if len(lines) > 100 and "def " not in wrapper_content and "function " not in wrapper_content:
-            maintainability_optimizations.append("Break down into smaller, reusable functions")
+            if maintainability_optimizations:
+                optimizations["Maintainability Improvements"] = maintainability_optimizations
         
-        # Documentation
-        if '"""' not in wrapper_content and "#" not in wrapper_content[:200]:
-            maintainability_optimizations.append("Add comprehensive docstrings and comments")
-        
-        # Constants and configuration
-        if wrapper_content.count('"') > 20 and "CONFIG" not in wrapper_content:
-            maintainability_optimizations.append("Extract configuration constants to top of file")
-        
-        if maintainability_optimizations:
-            optimizations.append(("Maintainability Improvements", maintainability_optimizations))
-    
-    # Report optimizations
-    if optimizations:
-        analysis += f"**Optimization Recommendations:**\n\n"
-        for category, items in optimizations:
-            analysis += f"### {category}:\n"
-            for item in items:
-                analysis += f"- {item}\n"
-            analysis += "\n"
-    else:
-        analysis += f"**Result:** Wrapper appears well-optimized for specified goals!\n\n"
-    
-    # Language-specific best practices
-    analysis += f"**{wrapper_language.upper()}-Specific Best Practices:**\n"
-    
-    if wrapper_language == "python":
-        analysis += "- Use argparse for robust argument parsing\n"
-        analysis += "- Implement proper logging with configurable levels\n"
-        analysis += "- Use pathlib for cross-platform path operations\n"
-        analysis += "- Add type hints for better code documentation\n"
-        analysis += "- Use f-strings for string formatting\n"
-        analysis += "- Use context managers for file operations\n"
-        analysis += "- Handle subprocess errors with proper exception catching\n"
-    
-    elif wrapper_language == "bash":
-        analysis += "- Use 'set -euo pipefail' for strict error handling\n"
-        analysis += "- Quote all variable expansions: \"${var}\"\n"
-        analysis += "- Use [[ ]] for test conditions instead of [ ]\n"
-        analysis += "- Implement proper function error checking\n"
-        analysis += "- Use local variables in functions\n"
-        analysis += "- Add comprehensive usage documentation\n"
-    
-    elif wrapper_language == "r":
-        analysis += "- Use optparse or argparse for argument handling\n"
-        analysis += "- Implement tryCatch for comprehensive error handling\n"
-        analysis += "- Use appropriate data.table operations for performance\n"
-        analysis += "- Add session info logging for reproducibility\n"
-        analysis += "- Use appropriate R logging mechanisms\n"
-        analysis += "- Handle missing packages gracefully\n"
+        analysis["optimizations"] = optimizations
+    
+    if "best_practices" in sections:
+        analysis["best_practices"] = list(_LANG_BEST_PRACTICES.get(wrapper_language, _DEFAULT_BEST_PRACTICES))
+    
+    if "monitoring" in sections:
+        analysis["monitoring"] = list(_MONITORING_RECOMMENDATIONS)
+    
+    if "testing" in sections:
+        analysis["testing"] = list(_TESTING_RECOMMENDATIONS)
     
-    else:
-        analysis += "- Add clear documentation for the wrapper language\n"
-        analysis += "- Implement proper error handling mechanisms\n"
-        analysis += "- Use consistent coding style and conventions\n"
-        analysis += "- Add input validation and error reporting\n"
-    
-    # Performance metrics and monitoring
-    analysis += f"\n**Performance Monitoring Recommendations:**\n"
-    analysis += "- Add execution time logging for performance tracking\n"
-    analysis += "- Monitor memory usage for large dataset processing\n"
-    analysis += "- Log file sizes and processing statistics\n"
-    analysis += "- Implement progress reporting for long-running operations\n"
-    analysis += "- Add resource usage warnings for resource-intensive operations\n"
-    
-    # Testing recommendations
-    analysis += f"\n**Testing and Validation:**\n"
-    analysis += "- Unit tests for parameter validation functions\n"
-    analysis += "- Integration tests with various input sizes\n"
-    analysis += "- Performance benchmarks with representative data\n"
-    analysis += "- Error condition testing (missing files, invalid inputs)\n"
-    analysis += "- Cross-platform compatibility validation\n"
-    
-    print("✅ WRAPPER TOOL: optimize_wrapper_performance completed successfully")
     return analysis
 
 
-@wrapper_agent.tool
+def optimize_wrapper_performance_iter(wrapper_content: str, performance_goals: List[str] = None,
+                                        include_sections: List[str] = None) -> Iterator[str]:
+    """
+    Yield the performance optimization report for a wrapper script section by section.
+    
+    optimize_wrapper_performance joins these chunks into a single string; callers that stream
+    the report can consume the chunks directly instead of holding the whole report in memory.
+    
+    Args:
+        wrapper_content: Wrapper script content to analyze (must not be empty)
+        performance_goals: List of performance goals, defaults to reliability and speed
+        include_sections: Report sections to include, defaults to all sections
+    
+    Yields:
+        Consecutive chunks of the optimization report
+    """
+    analysis = _analyze_wrapper_performance(wrapper_content, performance_goals, include_sections)
+    wrapper_language = analysis["language"]
+    
+    yield "Wrapper Performance Optimization:\n"
+    yield "=" * 40 + "\n\n"
+    
+    yield f"**Wrapper Analysis:**\n"
+    yield f"- Detected language: {wrapper_language.upper()}\n"
+    yield f"- Content size: {analysis['content_size']} characters\n"
+    yield f"- Lines of code: {analysis['lines_of_code']}\n"
+    yield f"- Optimization goals: {', '.join(analysis['performance_goals'])}\n\n"
+    
+    if "optimizations" in analysis:
+        optimizations = analysis["optimizations"]
+        if optimizations:
+            yield f"**Optimization Recommendations:**\n\n"
+            yield "".join(
+                f"### {category}:\n" + _bullets(items) + "\n"
+                for category, items in optimizations.items()
+            )
+        else:
+            yield f"**Result:** Wrapper appears well-optimized for specified goals!\n\n"
+    
+    if "best_practices" in analysis:
+        # Language-specific best practices
+        yield _LANG_HEADERS.get(wrapper_language) or f"**{wrapper_language.upper()}-Specific Best Practices:**\n"
+        yield _LANG_BEST_PRACTICES_TEXT.get(wrapper_language, _DEFAULT_BEST_PRACTICES_TEXT)
+    
+    if "monitoring" in analysis:
+        # Performance metrics and monitoring
+        yield _MONITORING_TEXT
+    
+    if "testing" in analysis:
+        # Testing recommendations
+        yield _TESTING_TEXT
+
+
+# Wrapper templates live in WRAPPER_TEMPLATES_DIR as <language>_template.<extension> and mark
+# the spots create_wrapper fills in with {UPPER_CASE} placeholders.
+_TEMPLATE_EXTENSIONS = {'python': 'py', 'r': 'R', 'bash': 'sh'}
+_TEMPLATE_FIELD_RE = re.compile(r'\{([A-Z_]+)\}')
+
+
+def _template_path(language: str) -> Path:
+    return WRAPPER_TEMPLATES_DIR / f"{language}_template.{_TEMPLATE_EXTENSIONS[language]}"
+
+
+# Attributes read from planning_data Parameter objects, fetched together in one call.
+_PARAMETER_ATTRS = operator.attrgetter('name', 'type', 'required', 'description', 'default_value', 'prefix')
+
+
+def _parameter_to_dict(param: Any) -> Dict[str, Any]:
+    """Convert a planning_data Parameter object to the dict form the wrapper generators use."""
+    try:
+        name, param_type, required, description, default, prefix = _PARAMETER_ATTRS(param)
+    except AttributeError:
+        # Partial objects: fall back to per-attribute defaults
+        name = getattr(param, 'name', 'unknown')
+        param_type = getattr(param, 'type', 'text')
+        required = getattr(param, 'required', False)
+        description = getattr(param, 'description', '')
+        default = getattr(param, 'default_value', None)
+        prefix = getattr(param, 'prefix', '')
+    return {
+        'name': name,
+        'type': param_type.value if hasattr(param_type, 'value') else str(param_type),
+        'required': required,
+        'description': description,
+        'default': default,
+        'prefix': prefix,
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(language: str) -> str:
+    """Read the wrapper template for a language once; later calls are served from memory."""
+    return _template_path(language).read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=8)
+def _split_template(template: str) -> Tuple[str, ...]:
+    """Split a template once into alternating literal text and placeholder names."""
+    return tuple(_TEMPLATE_FIELD_RE.split(template))
+
+
+def _fill_template(template: str, fields: Dict[str, str]) -> str:
+    """Substitute every {FIELD} placeholder; unknown placeholders are left as is."""
+    parts = _split_template(template)
+    return "".join(
+        part if i % 2 == 0 else fields.get(part, f"{{{part}}}")
+        for i, part in enumerate(parts)
+    )
+
+
 def create_wrapper(context: RunContext[str]) -> str:
     """
     Generate a comprehensive wrapper script for the GenePattern module using planning data.
@@ -849,11 +1153,11 @@ def create_wrapper(context: RunContext[str]) -> str:
     """
     # Extract data from context dependencies
     tool_info = context.deps.get('tool_info', {})
-    planning_data = context.deps.get('planning_data', {})
+    planning_data = context.deps.get('planning_data') or {}
     error_report = context.deps.get('error_report', '')
     attempt = context.deps.get('attempt', 1)
 
-    print(f"🔧 WRAPPER TOOL: Running create_wrapper (attempt {attempt})")
+    logger.debug("WRAPPER TOOL: Running create_wrapper (attempt %s)", attempt)
 
     # Extract tool information
     tool_name = tool_info.get('name', 'unknown')
@@ -865,12 +1169,12 @@ def create_wrapper(context: RunContext[str]) -> str:
         print(f"✓ User provided instructions: {tool_instructions[:100]}...")
 
     # USE PLANNING DATA - Extract all wrapper-related information
-    wrapper_script = planning_data.get('wrapper_script', 'wrapper.py') if planning_data else 'wrapper.py'
+    wrapper_script = planning_data.get('wrapper_script', 'wrapper.py')
     print(f"✓ Using wrapper_script from planning_data: {wrapper_script}")
 
     # Determine wrapper language from planning data or tool language
     # Priority: 1) planning_data language, 2) tool_info language
-    if planning_data and 'language' in planning_data:
+    if 'language' in planning_data:
         wrapper_language = planning_data['language'].lower()
         print(f"✓ Using language from planning_data: {wrapper_language}")
     else:
@@ -879,7 +1183,7 @@ def create_wrapper(context: RunContext[str]) -> str:
 
     # Extract parameters from planning_data
     parameters = []
-    if planning_data and 'parameters' in planning_data:
+    if 'parameters' in planning_data:
         params_raw = planning_data['parameters']
         # Handle both list of dicts and list of Parameter objects
         for param in params_raw:
@@ -887,21 +1191,14 @@ def create_wrapper(context: RunContext[str]) -> str:
                 parameters.append(param)
             else:
                 # Convert Parameter object to dict
-                parameters.append(param if isinstance(param, dict) else {
-                    'name': param.name if hasattr(param, 'name') else 'unknown',
-                    'type': param.type.value if hasattr(param, 'type') and hasattr(param.type, 'value') else str(param.type) if hasattr(param, 'type') else 'text',
-                    'required': param.required if hasattr(param, 'required') else False,
-                    'description': param.description if hasattr(param, 'description') else '',
-                    'default': param.default_value if hasattr(param, 'default_value') else None,
-                    'prefix': param.prefix if hasattr(param, 'prefix') else '',
-                })
+                parameters.append(_parameter_to_dict(param))
         print(f"✓ Using {len(parameters)} parameters from planning_data")
     else:
         print(f"⚠️ No parameters in planning_data")
 
     # Extract command_line example from planning_data to understand tool invocation
     tool_command = tool_name.lower()
-    if planning_data and 'command_line' in planning_data:
+    if 'command_line' in planning_data:
         cmd_line = planning_data['command_line']
         # Try to extract the base command from command_line
         # e.g., "python salmon_wrapper.py <input>" -> we want to know how tool is called
@@ -912,18 +1209,14 @@ def create_wrapper(context: RunContext[str]) -> str:
 
     # Validate wrapper language
     if wrapper_language not in ['python', 'bash', 'r']:
-        print(f"⚠️  WRAPPER TOOL: Unsupported language {wrapper_language}, defaulting to Python")
+        logger.warning("WRAPPER TOOL: Unsupported language %s, defaulting to Python", wrapper_language)
         wrapper_language = 'python'
 
     # Load the appropriate template
-    extension_map = {'python': 'py', 'r': 'R', 'bash': 'sh'}
-    template_file = WRAPPER_TEMPLATES_DIR / f"{wrapper_language}_template.{extension_map[wrapper_language]}"
-
     try:
-        with open(template_file, 'r') as f:
-            template = f.read()
+        template = _load_template(wrapper_language)
     except FileNotFoundError:
-        print(f"❌ WRAPPER TOOL: Template file not found: {template_file}")
+        logger.error("WRAPPER TOOL: Template file not found: %s", _template_path(wrapper_language))
         return f"# Error: Template file not found for {wrapper_language}"
 
     # Generate language-specific content based on parameters
@@ -937,7 +1230,7 @@ def create_wrapper(context: RunContext[str]) -> str:
         wrapper_content = template
 
     # Validate wrapper script name matches planning
-    expected_extension = extension_map.get(wrapper_language, 'py')
+    expected_extension = _TEMPLATE_EXTENSIONS.get(wrapper_language, 'py')
     if not wrapper_script.endswith(f'.{expected_extension}'):
         print(f"⚠️  WARNING: Planning specified wrapper_script '{wrapper_script}' but generated {wrapper_language} wrapper (expected .{expected_extension})")
 
@@ -945,10 +1238,23 @@ def create_wrapper(context: RunContext[str]) -> str:
     if attempt > 1 and error_report:
         print(f"⚠️  Retry attempt {attempt} due to: {error_report[:2000]}")
 
-    print(f"✅ WRAPPER TOOL: create_wrapper completed - generated {len(wrapper_content)} character {wrapper_language} wrapper")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("WRAPPER TOOL: create_wrapper completed - generated %d character %s wrapper",
+                     len(wrapper_content), wrapper_language)
     return wrapper_content
 
 
+# argparse keyword fragments per GenePattern type: (type/action argument, default format).
+# Files and flags take no default; Choice and anything unlisted are handled as quoted text.
+_PY_ARG_FORMATS = {
+    'File': (", type=str", ""),
+    'Integer': (", type=int", ", default={}"),
+    'Float': (", type=float", ", default={}"),
+    'Boolean': (", action='store_true'", ""),
+}
+_PY_TEXT_ARG_FORMAT = ("", ", default='{}'")
+
+
 def _generate_python_wrapper(template: str, tool_name: str, tool_description: str,
                              parameters: List[Dict[str, Any]], tool_command: str) -> str:
     """Generate Python wrapper from template."""
@@ -956,7 +1262,7 @@ def _generate_python_wrapper(template: str, tool_name: str, tool_description: st
     # Generate parameter definitions
     param_lines = []
     validation_lines = []
-    command_parts = [f"'{tool_command}'"]
+    command_lines = []
 
     for param in parameters:
         param_name = param.get('name', 'unknown')
@@ -967,50 +1273,31 @@ def _generate_python_wrapper(template: str, tool_name: str, tool_description: st
 
         # Python-safe dest: replace dots AND dashes with underscores
         # The flag itself keeps the original GenePattern dot-notation (e.g. --input.file)
-        param_var = param_name.replace('.', '_').replace('-', '_')
+        param_var = param_name.translate(_PARAM_VAR_TABLE)
+        help_arg = f", help='{description}'"
 
         # Build argparse argument – flag uses original param_name (dots preserved),
         # dest is set explicitly so argparse stores the value under a valid Python identifier
-        arg_line = f"    parser.add_argument('--{param_name}', dest='{param_var}'"
+        arg_parts = [f"    parser.add_argument('--{param_name}', dest='{param_var}'"]
 
         if required:
-            arg_line += ", required=True"
+            arg_parts.append(", required=True")
 
-        if param_type == 'File':
-            arg_line += f", type=str, help='{description}'"
-        elif param_type == 'Integer':
-            arg_line += f", type=int"
-            if default:
-                arg_line += f", default={default}"
-            arg_line += f", help='{description}'"
-        elif param_type == 'Float':
-            arg_line += f", type=float"
-            if default:
-                arg_line += f", default={default}"
-            arg_line += f", help='{description}'"
-        elif param_type == 'Boolean':
-            arg_line += f", action='store_true', help='{description}'"
-        elif param_type == 'Choice':
+        type_arg, default_format = _PY_ARG_FORMATS.get(param_type, _PY_TEXT_ARG_FORMAT)
+        if type_arg:
+            arg_parts.append(type_arg)
+        if param_type == 'Choice':
             choices = param.get('choices', [])
             if choices:
                 # Extract just the values from ChoiceOption dicts for argparse
-                choice_vals = []
-                for c in choices:
-                    if isinstance(c, dict):
-                        choice_vals.append(c.get('value', str(c)))
-                    else:
-                        choice_vals.append(str(c))
-                arg_line += f", choices={choice_vals}"
-            if default:
-                arg_line += f", default='{default}'"
-            arg_line += f", help='{description}'"
-        else:  # Text/String
-            if default:
-                arg_line += f", default='{default}'"
-            arg_line += f", help='{description}'"
-
-        arg_line += ")"
-        param_lines.append(arg_line)
+                choice_vals = [c.get('value', str(c)) if isinstance(c, dict) else str(c) for c in choices]
+                arg_parts.append(f", choices={choice_vals}")
+        if default and default_format:
+            arg_parts.append(default_format.format(default))
+
+        arg_parts.append(help_arg)
+        arg_parts.append(")")
+        param_lines.append(''.join(arg_parts))
 
         # Generate validation for file parameters
         if param_type == 'File' and 'input' in param_name.lower():
@@ -1019,12 +1306,11 @@ def _generate_python_wrapper(template: str, tool_name: str, tool_description: st
             validation_lines.append(f"        return False")
 
         # Add to command construction – flag in the command uses original dot-notation
+        command_lines.append(f"    if args.{param_var}:")
         if param_type == 'Boolean':
-            command_parts.append(f"    if args.{param_var}:")
-            command_parts.append(f"        cmd.append('--{param_name}')")
+            command_lines.append(f"        cmd.append('--{param_name}')")
         else:
-            command_parts.append(f"    if args.{param_var}:")
-            command_parts.append(f"        cmd.extend(['--{param_name}', str(args.{param_var})])")
+            command_lines.append(f"        cmd.extend(['--{param_name}', str(args.{param_var})])")
 
     # Build the parameters section
     parameters_section = '\n'.join(param_lines) if param_lines else "    # No parameters defined"
@@ -1036,14 +1322,16 @@ def _generate_python_wrapper(template: str, tool_name: str, tool_description: st
         validation_section = "    # No specific validation required"
 
     # Build command section
-    command_section = f"[{command_parts[0]}]\n" + '\n'.join(command_parts[1:])
+    command_section = f"['{tool_command}']\n" + '\n'.join(command_lines)
 
     # Replace placeholders in template
-    wrapper = template.replace('{TOOL_NAME}', tool_name)
-    wrapper = wrapper.replace('{TOOL_DESCRIPTION}', tool_description or f'Analysis using {tool_name}')
-    wrapper = wrapper.replace('{PARAMETERS}', parameters_section)
-    wrapper = wrapper.replace('{VALIDATION}', validation_section)
-    wrapper = wrapper.replace('{COMMAND}', command_section)
+    wrapper = _fill_template(template, {
+        'TOOL_NAME': tool_name,
+        'TOOL_DESCRIPTION': tool_description or f'Analysis using {tool_name}',
+        'PARAMETERS': parameters_section,
+        'VALIDATION': validation_section,
+        'COMMAND': command_section,
+    })
 
     return wrapper
 
@@ -1056,8 +1344,9 @@ def _generate_r_wrapper(template: str, tool_name: str, tool_description: str,
     # Generate option list
     option_lines = []
     validation_lines = []
-    execution_lines = []
+    execution_lines = [f"    cmd <- c('{tool_command}')"]
 
+    last_index = len(parameters) - 1
     for i, param in enumerate(parameters):
         param_name = param.get('name', 'unknown')
         param_type = param.get('type', 'Text')
@@ -1069,29 +1358,21 @@ def _generate_r_wrapper(template: str, tool_name: str, tool_description: str,
         # R-safe variable name: replace dots AND dashes with underscores.
         # optparse converts --input.file → opt$input_file automatically, so
         # we compute param_var the same way to stay consistent.
-        param_var = param_name.replace('.', '_').replace('-', '_')
+        param_var = param_name.translate(_PARAM_VAR_TABLE)
 
         # Build option – flag uses original param_name (dots preserved) to match
         # GenePattern manifest pN_name values exactly.
-        opt_line = f"  make_option(c('--{param_name}'), type='{r_type}'"
-
-        if default and param_type != 'Boolean':
-            if r_type == 'character':
-                opt_line += f", default='{default}'"
-            else:
-                opt_line += f", default={default}"
-        elif param_type == 'Boolean':
-            opt_line += f", default={str(default).upper() if default else 'FALSE'}"
-
-        if required:
-            opt_line += ", default=NULL"
-
-        opt_line += f", help='{description}')"
-
-        if i < len(parameters) - 1:
-            opt_line += ","
+        if param_type == 'Boolean':
+            default_arg = f", default={str(default).upper() if default else 'FALSE'}"
+        elif default:
+            default_arg = f", default='{default}'" if r_type == 'character' else f", default={default}"
+        else:
+            default_arg = ""
+        required_arg = ", default=NULL" if required else ""
+        separator = "," if i < last_index else ""
 
-        option_lines.append(opt_line)
+        option_lines.append(f"  make_option(c('--{param_name}'), type='{r_type}'{default_arg}{required_arg}, "
+                            f"help='{description}'){separator}")
 
         # Generate validation
         if param_type == 'File' and 'input' in param_name.lower():
@@ -1100,6 +1381,16 @@ def _generate_r_wrapper(template: str, tool_name: str, tool_description: str,
             validation_lines.append(f"    return(FALSE)")
             validation_lines.append(f"  }}")
 
+        # Add to execution command
+        if param_type == 'Boolean':
+            execution_lines.append(f"    if (!is.null(opt${param_var}) && opt${param_var}) {{")
+            execution_lines.append(f"      cmd <- c(cmd, '--{param_name}')")
+            execution_lines.append(f"    }}")
+        else:
+            execution_lines.append(f"    if (!is.null(opt${param_var})) {{")
+            execution_lines.append(f"      cmd <- c(cmd, '--{param_name}', opt${param_var})")
+            execution_lines.append(f"    }}")
+
     # Build options section
     options_section = '\n'.join(option_lines) if option_lines else "  # No options defined"
 
@@ -1110,21 +1401,6 @@ def _generate_r_wrapper(template: str, tool_name: str, tool_description: str,
         validation_section = "  # No specific validation required"
 
     # Build execution section
-    execution_lines.append(f"    cmd <- c('{tool_command}')")
-    for param in parameters:
-        param_name = param.get('name', 'unknown')
-        param_var = param_name.replace('.', '_').replace('-', '_')
-        param_type = param.get('type', 'Text')
-
-        if param_type == 'Boolean':
-            execution_lines.append(f"    if (!is.null(opt${param_var}) && opt${param_var}) {{")
-            execution_lines.append(f"      cmd <- c(cmd, '--{param_name}')")
-            execution_lines.append(f"    }}")
-        else:
-            execution_lines.append(f"    if (!is.null(opt${param_var})) {{")
-            execution_lines.append(f"      cmd <- c(cmd, '--{param_name}', opt${param_var})")
-            execution_lines.append(f"    }}")
-
     execution_lines.append(f"    ")
     execution_lines.append(f"    result <- system2(cmd[1], args=cmd[-1], stdout=TRUE, stderr=TRUE)")
 
@@ -1140,13 +1416,15 @@ def _generate_r_wrapper(template: str, tool_name: str, tool_description: str,
         library_loads = "# Additional packages loaded as needed"
 
     # Replace placeholders
-    wrapper = template.replace('{TOOL_NAME}', tool_name)
-    wrapper = wrapper.replace('{TOOL_DESCRIPTION}', tool_description or f'Analysis using {tool_name}')
-    wrapper = wrapper.replace('{OPTIONS}', options_section)
-    wrapper = wrapper.replace('{VALIDATION}', validation_section)
-    wrapper = wrapper.replace('{EXECUTION}', execution_section)
-    wrapper = wrapper.replace('{REQUIRED_PACKAGES}', required_packages_section)
-    wrapper = wrapper.replace('{LIBRARY_LOADS}', library_loads)
+    wrapper = _fill_template(template, {
+        'TOOL_NAME': tool_name,
+        'TOOL_DESCRIPTION': tool_description or f'Analysis using {tool_name}',
+        'OPTIONS': options_section,
+        'VALIDATION': validation_section,
+        'EXECUTION': execution_section,
+        'REQUIRED_PACKAGES': required_packages_section,
+        'LIBRARY_LOADS': library_loads,
+    })
 
     return wrapper
 
@@ -1160,7 +1438,7 @@ def _generate_bash_wrapper(template: str, tool_name: str, tool_description: str,
     usage_lines = []
     parse_lines = []
     validation_lines = []
-    execution_lines = []
+    execution_lines = [f"    \"{tool_command}\" \\"]
 
     for param in parameters:
         param_name = param.get('name', 'unknown')
@@ -1170,7 +1448,7 @@ def _generate_bash_wrapper(template: str, tool_name: str, tool_description: str,
         description = param.get('description', f'{param_name} parameter')
 
         # Bash variable names cannot contain dots or dashes – replace both with underscores
-        param_var = param_name.upper().replace('.', '_').replace('-', '_')
+        param_var = param_name.upper().translate(_PARAM_VAR_TABLE)
 
         # Generate default
         if param_type == 'Boolean':
@@ -1209,14 +1487,7 @@ def _generate_bash_wrapper(template: str, tool_name: str, tool_description: str,
             validation_lines.append(f"        return 1")
             validation_lines.append(f"    fi")
 
-    # Build execution command
-    execution_lines.append(f"    \"{tool_command}\" \\")
-    for param in parameters:
-        param_name = param.get('name', 'unknown')
-        param_var = param_name.upper().replace('.', '_').replace('-', '_')
-        param_type = param.get('type', 'Text')
-
-        # Flag in the command uses original param_name (dots preserved)
+        # Add to execution command – flag uses original param_name (dots preserved)
         if param_type == 'Boolean':
             execution_lines.append(f"        $([[ \"${{{param_var}}}\" == \"true\" ]] && echo \"--{param_name}\") \\")
         else:
@@ -1234,13 +1505,60 @@ def _generate_bash_wrapper(template: str, tool_name: str, tool_description: str,
     execution_section = '\n'.join(execution_lines)
 
     # Replace placeholders
-    wrapper = template.replace('{TOOL_NAME}', tool_name)
-    wrapper = wrapper.replace('{TOOL_DESCRIPTION}', tool_description or f'Analysis using {tool_name}')
-    wrapper = wrapper.replace('{TOOL_COMMAND}', tool_command)
-    wrapper = wrapper.replace('{DEFAULTS}', defaults_section)
-    wrapper = wrapper.replace('{USAGE_OPTIONS}', usage_section)
-    wrapper = wrapper.replace('{ARGUMENT_PARSING}', parsing_section)
-    wrapper = wrapper.replace('{VALIDATION}', validation_section)
-    wrapper = wrapper.replace('{EXECUTION}', execution_section)
+    wrapper = _fill_template(template, {
+        'TOOL_NAME': tool_name,
+        'TOOL_DESCRIPTION': tool_description or f'Analysis using {tool_name}',
+        'TOOL_COMMAND': tool_command,
+        'DEFAULTS': defaults_section,
+        'USAGE_OPTIONS': usage_section,
+        'ARGUMENT_PARSING': parsing_section,
+        'VALIDATION': validation_section,
+        'EXECUTION': execution_section,
+    })
 
     return wrapper
+
+
+# Agent tools, registered when the agent is first built
+_WRAPPER_TOOLS = [
+    validate_wrapper,
+    analyze_wrapper_requirements,
+    generate_wrapper_structure,
+    optimize_wrapper_performance,
+    create_wrapper,
+]
+
+
+@functools.cache
+def get_wrapper_agent() -> Agent:
+    """
+    Build the wrapper agent on first use.
+    
+    Loading .env and resolving the LLM model are deferred until the agent is needed, so
+    importing this module for its tools alone stays cheap. python-dotenv and agents.models
+    (which pulls in the OpenAI client) are imported here for the same reason.
+    """
+    from dotenv import load_dotenv
+    from agents.models import configured_llm_model
+
+    # Load environment variables from .env file
+    load_dotenv()
+    
+    # Create agent without MCP dependency. The system prompt is static text, so it forms a
+    # byte-identical prefix on every request; Anthropic models cache it explicitly, OpenAI-compatible
+    # providers cache the prefix automatically, and other providers ignore the setting.
+    agent = Agent(
+        configured_llm_model(),
+        system_prompt=_system_prompt(),
+        model_settings={'anthropic_cache_instructions': True},
+    )
+    for tool in _WRAPPER_TOOLS:
+        agent.tool(tool)
+    return agent
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from wrapper.agent import wrapper_agent` working while building the agent lazily
+    if name == "wrapper_agent":
+        return get_wrapper_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -34,15 +34,17 @@ Exit code is 0 on PASS, 1 on FAIL.
 from __future__ import annotations
 
 import argparse
+import functools
 import glob
 import importlib.util
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LintIssue:
     """Represents a validation issue found during wrapper script linting."""
     severity: str  # 'ERROR' or 'WARNING' or 'INFO'
@@ -51,8 +53,9 @@ class LintIssue:
 
     def format(self) -> str:
         """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+        if self.context:
+            return f"{self.severity}: {self.message} ({self.context})"
+        return f"{self.severity}: {self.message}"
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
@@ -102,6 +105,11 @@ Dependencies (optional):
     return p.parse_args(argv)
 
 
+# Tests that only read shared_context and spend most of their time waiting on a subprocess
+# (bash -n or Rscript), run alongside the others instead of in sequence
+_BACKGROUND_TESTS = frozenset({"test_syntax_validation.py"})
+
+
 def discover_tests() -> List[str]:
     """Discover test modules in the tests directory.
     
@@ -109,18 +117,75 @@ def discover_tests() -> List[str]:
         List of test module file paths that match the test_*.py pattern
     """
     tests_dir = os.path.join(os.path.dirname(__file__), "tests")
-    if not os.path.exists(tests_dir):
+    try:
+        mtime = os.stat(tests_dir).st_mtime
+    except OSError:
         return []
     
-    test_files = glob.glob(os.path.join(tests_dir, "test_*.py"))
-    return sorted(test_files)
+    return list(_discover_test_files(tests_dir, mtime))
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_test_files(tests_dir: str, mtime: float) -> tuple[str, ...]:
+    """Glob the tests directory; cached until its modification time changes."""
+    return tuple(sorted(glob.glob(os.path.join(tests_dir, "test_*.py"))))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_test_module(test_file: str):
+    """Import a test module from its file path, once per process.
+    
+    Modules are registered under a wrapper-specific name so they cannot clash with the
+    identically named manifest linter tests.
+    
+    Args:
+        test_file: Path to the test_*.py file
+        
+    Returns:
+        The imported module
+    """
+    module_name = f"wrapper_lint_{os.path.basename(test_file)[:-3]}"
+    spec = importlib.util.spec_from_file_location(module_name, test_file)
+    test_module = importlib.util.module_from_spec(spec)
+    # dataclasses resolves string annotations through sys.modules while the module executes
+    sys.modules[module_name] = test_module
+    try:
+        spec.loader.exec_module(test_module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return test_module
+
+
+def _run_test_file(test_file: str, script_path: str,
+                   shared_context: dict) -> tuple[Optional[List[LintIssue]], Optional[Exception]]:
+    """Run one test module against a wrapper script.
+    
+    Args:
+        test_file: Path to the test_*.py file
+        script_path: Path to wrapper script file
+        shared_context: Mutable dict the test reads its inputs from and writes results to
+        
+    Returns:
+        Tuple of (issues, error): issues is None when the module has no run_test function,
+        and error holds any exception raised while loading or running the test
+    """
+    try:
+        test_module = _load_test_module(test_file)
+        if not hasattr(test_module, "run_test"):
+            return None, None
+        return test_module.run_test(script_path, shared_context), None
+    except Exception as e:
+        return None, e
 
 
-def run_modular_tests(script_path: str, **test_kwargs) -> tuple[bool, List[LintIssue]]:
+def run_modular_tests(script_path: str, emit: Callable[[str], None] = print,
+                      **test_kwargs) -> tuple[bool, List[LintIssue]]:
     """Run all discovered test modules against a wrapper script.
     
     Args:
         script_path: Path to wrapper script file
+        emit: Callable receiving each progress line (defaults to print)
         **test_kwargs: Additional context for tests (expected_parameters, etc.)
         
     Returns:
@@ -141,88 +206,80 @@ def run_modular_tests(script_path: str, **test_kwargs) -> tuple[bool, List[LintI
     tests_run = 0
     shared_context = test_kwargs.copy()  # Shared context between tests
     
+    # Tests run in discovery order against one shared_context, so each can read what earlier
+    # tests recorded. The first test (test_01_file_validation) supplies the script content and
+    # type; tests in _BACKGROUND_TESTS need nothing more, so once it has run they start on a
+    # worker thread with a copy of the context and overlap the remaining tests.
+    first_test, *other_tests = test_files
+    outcomes = {first_test: _run_test_file(first_test, script_path, shared_context)}
+    background = [test_file for test_file in other_tests
+                  if os.path.basename(test_file) in _BACKGROUND_TESTS]
+    with ThreadPoolExecutor(max_workers=max(1, len(background))) as executor:
+        futures = {
+            test_file: executor.submit(_run_test_file, test_file, script_path, dict(shared_context))
+            for test_file in background
+        }
+        for test_file in other_tests:
+            if test_file not in futures:
+                outcomes[test_file] = _run_test_file(test_file, script_path, shared_context)
+        for test_file, future in futures.items():
+            outcomes[test_file] = future.result()
+    
+    # Report in discovery order, whatever order the tests finished in
     for test_file in test_files:
-        try:
-            # Use a simpler approach - add test directory to path temporarily
-            test_dir = os.path.dirname(test_file)
-            test_filename = os.path.basename(test_file)
-            module_name = test_filename[:-3]  # Remove .py extension
-            
-            # Temporarily add tests directory to Python path
-            tests_dir_added = False
-            if test_dir not in sys.path:
-                sys.path.insert(0, test_dir)
-                tests_dir_added = True
-            
-            try:
-                # Import the module using standard import
-                test_module = __import__(module_name)
-                
-                # Run the test if it has the required function
-                if hasattr(test_module, "run_test"):
-                    # Pass the shared context as a mutable dict that tests can modify
-                    test_issues = test_module.run_test(script_path, shared_context)
-                    all_issues.extend(test_issues)
-                    tests_run += 1
-                    
-                    # Tests can modify shared_context to pass data to subsequent tests
-                    # This allows file validation to pass script content and type to other tests
-                    
-                    # Add test info for verbose output
-                    test_name = os.path.basename(test_file).replace('.py', '').replace('_', ' ').title()
-                    if test_issues:
-                        error_count = sum(1 for issue in test_issues if issue.severity == "ERROR")
-                        warning_count = sum(1 for issue in test_issues if issue.severity == "WARNING")
-                        info_count = sum(1 for issue in test_issues if issue.severity == "INFO")
-                        
-                        if error_count > 0:
-                            print(f"  Test '{test_name}': {error_count} error(s) found")
-                        elif warning_count > 0:
-                            print(f"  Test '{test_name}': {warning_count} warning(s) found")
-                        elif info_count > 0:
-                            print(f"  Test '{test_name}': {info_count} info message(s)")
-                        else:
-                            print(f"  Test '{test_name}': {len(test_issues)} issue(s) found")
-                    else:
-                        print(f"  Test '{test_name}': PASSED")
-                        
-            finally:
-                # Clean up: remove tests directory from path
-                if tests_dir_added and test_dir in sys.path:
-                    sys.path.remove(test_dir)
-                    
-                # Clean up: remove module from sys.modules to avoid conflicts
-                if module_name in sys.modules:
-                    del sys.modules[module_name]
-            
-        except Exception as e:
+        test_issues, error = outcomes[test_file]
+        if error is not None:
             all_issues.append(LintIssue(
                 "ERROR", 
-                f"Failed to run test {os.path.basename(test_file)}: {str(e)}", 
+                f"Failed to run test {os.path.basename(test_file)}: {str(error)}", 
                 None
             ))
+            continue
+        
+        # Modules without a run_test function are skipped
+        if test_issues is None:
+            continue
+        
+        all_issues.extend(test_issues)
+        tests_run += 1
+        
+        # Add test info for verbose output
+        test_name = os.path.basename(test_file).replace('.py', '').replace('_', ' ').title()
+        if test_issues:
+            error_count = sum(1 for issue in test_issues if issue.severity == "ERROR")
+            warning_count = sum(1 for issue in test_issues if issue.severity == "WARNING")
+            info_count = sum(1 for issue in test_issues if issue.severity == "INFO")
+            
+            if error_count > 0:
+                emit(f"  Test '{test_name}': {error_count} error(s) found")
+            elif warning_count > 0:
+                emit(f"  Test '{test_name}': {warning_count} warning(s) found")
+            elif info_count > 0:
+                emit(f"  Test '{test_name}': {info_count} info message(s)")
+            else:
+                emit(f"  Test '{test_name}': {len(test_issues)} issue(s) found")
+        else:
+            emit(f"  Test '{test_name}': PASSED")
     
-    print(f"Ran {tests_run} test module(s)")
+    emit(f"Ran {tests_run} test module(s)")
     passed = not any(iss.severity == "ERROR" for iss in all_issues)
     return passed, all_issues
 
 
-def main(argv: List[str]) -> int:
-    """Main entry point for the wrapper script linter.
+def _lint(script_path: str, parameters: Optional[List[str]], emit: Callable[[str], None]) -> int:
+    """Validate a wrapper script, passing each report line to emit.
     
     Args:
-        argv: Command line arguments (excluding script name)
+        script_path: Path to wrapper script file
+        parameters: Expected parameter names, or None to skip parameter validation
+        emit: Callable receiving each report line
         
     Returns:
         Exit code: 0 for success, 1 for failure
     """
-    args = parse_args(argv)
-    
-    script_path = args.script_path
-    
     # Basic path validation
     if not script_path:
-        print("ERROR: No script path provided")
+        emit("ERROR: No script path provided")
         return 1
     
     # Convert to absolute path for consistent handling
@@ -230,16 +287,16 @@ def main(argv: List[str]) -> int:
     
     # Prepare test context - pass all CLI arguments to tests
     test_kwargs = {
-        'expected_parameters': args.parameters,  # May be None or empty list
+        'expected_parameters': parameters,  # May be None or empty list
     }
     
     # Run modular tests
-    print(f"Running modular tests on wrapper script: {script_path}")
-    passed, issues = run_modular_tests(script_path, **test_kwargs)
+    emit(f"Running modular tests on wrapper script: {script_path}")
+    passed, issues = run_modular_tests(script_path, emit=emit, **test_kwargs)
     
     # Output results
     if passed:
-        print(f"\nPASS: Wrapper script '{script_path}' passed all validation checks.")
+        emit(f"\nPASS: Wrapper script '{script_path}' passed all validation checks.")
         return 0
     else:
         error_count = sum(1 for i in issues if i.severity == "ERROR")
@@ -250,12 +307,69 @@ def main(argv: List[str]) -> int:
         header = f"\nFAIL: Wrapper script '{script_path}' failed {error_count} check{plural_e}"
         if warning_count:
             header += f" and has {warning_count} warning{plural_w}"
-        print(header + ":")
+        emit(header + ":")
         
-        for issue in issues:
-            print(issue.format())
+        # Emit the issue list as one block rather than one write per issue
+        emit("\n".join(issue.format() for issue in issues))
         return 1
 
 
+def lint(script_path: str, parameters: Optional[List[str]] = None) -> tuple[int, str, str]:
+    """Validate a wrapper script without going through the command line interface.
+    
+    Args:
+        script_path: Path to wrapper script file
+        parameters: Expected parameter names, or None to skip parameter validation
+        
+    Returns:
+        Tuple of (exit_code, report, errors) where report matches the text main() prints
+        and errors holds any error output (the linter itself writes none)
+    """
+    lines: List[str] = []
+    exit_code = _lint(script_path, parameters, lines.append)
+    report = "".join(f"{line}\n" for line in lines)
+    return exit_code, report, ""
+
+
+def lint_batch(script_paths: List[str], parameters: Optional[List[str]] = None,
+               use_processes: bool = True) -> Dict[str, tuple[int, str, str]]:
+    """Validate several wrapper scripts in parallel, one lint() call per script.
+    
+    Args:
+        script_paths: Paths to wrapper script files
+        parameters: Expected parameter names applied to every script, or None to skip
+            parameter validation
+        use_processes: Lint in worker processes (the checks are CPU-bound regex work);
+            pass False to use threads where forking is expensive
+        
+    Returns:
+        Dict mapping each script path to its lint() result
+    """
+    if not script_paths:
+        return {}
+    
+    workers = min(len(script_paths), os.cpu_count() or 1)
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    # Each worker loads the test modules once, so hand out paths in chunks
+    chunksize = max(1, len(script_paths) // (4 * workers))
+    with executor_class(max_workers=workers) as executor:
+        results = executor.map(functools.partial(lint, parameters=parameters),
+                               script_paths, chunksize=chunksize)
+        return dict(zip(script_paths, results))
+
+
+def main(argv: List[str]) -> int:
+    """Main entry point for the wrapper script linter.
+    
+    Args:
+        argv: Command line arguments (excluding script name)
+        
+    Returns:
+        Exit code: 0 for success, 1 for failure
+    """
+    args = parse_args(argv)
+    return _lint(args.script_path, args.parameters, print)
+
+
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:]))
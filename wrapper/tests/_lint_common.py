@@ -0,0 +1,40 @@
+"""
+Helpers shared by the wrapper test modules.
+
+The leading underscore keeps this module out of the linter's test_*.py discovery.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters differently from str.lower()
+_CASE_FOLD_EXCEPTIONS = ('\u0130', '\u0131', '\u017f')
+
+
+def score_patterns(content: str, patterns) -> tuple[int, List[str]]:
+    """Sum the points of every (pattern, description, points) entry whose pattern matches.
+
+    A pattern is either a compiled regex or a plain string, which is matched
+    with a substring check.
+
+    Returns:
+        Tuple of (score, list_of_found_patterns)
+    """
+    patterns_found = []
+    score = 0
+    for pattern, description, points in patterns:
+        if pattern in content if isinstance(pattern, str) else pattern.search(content):
+            patterns_found.append(description)
+            score += points
+    return score, patterns_found
+
+
+def lowered_for_search(content: str) -> Optional[str]:
+    """Return content.lower() when case-sensitive searches on it agree with re.IGNORECASE, else None.
+
+    Lowercased patterns searched over the result can use re's literal-prefix scan, which
+    case-insensitive patterns cannot.
+    """
+    if content.isascii() or not any(char in content for char in _CASE_FOLD_EXCEPTIONS):
+        return content.lower()
+    return None
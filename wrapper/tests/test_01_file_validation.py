@@ -10,26 +10,30 @@ from __future__ import annotations
 import sys
 import os
 import re
+import stat
 from typing import List
-from dataclasses import dataclass
 
-# Add parent directory to path for imports  
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
 
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+# Lowercased file extensions that identify the script type outright
+_EXTENSION_TYPES = {
+    '.py': 'python',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.r': 'r',
+    '.pl': 'perl',
+    '.perl': 'perl',
+    '.js': 'javascript',
+    '.javascript': 'javascript',
+    '.rb': 'ruby',
+    '.ruby': 'ruby',
+}
 
 
 def detect_script_type(script_path: str, content: str) -> str:
@@ -42,30 +46,19 @@ def detect_script_type(script_path: str, content: str) -> str:
     Returns:
         Detected script type (python, bash, r, shell, other)
     """
-    # Check file extension first
-    path_lower = script_path.lower()
-    
-    if path_lower.endswith('.py'):
-        return 'python'
-    elif path_lower.endswith(('.sh', '.bash')):
-        return 'bash'
-    elif path_lower.endswith(('.r',)):
-        return 'r'
-    elif path_lower.endswith(('.pl', '.perl')):
-        return 'perl'
-    elif path_lower.endswith(('.js', '.javascript')):
-        return 'javascript'
-    elif path_lower.endswith(('.rb', '.ruby')):
-        return 'ruby'
+    # Check file extension first (everything from the last dot; unlike os.path.splitext
+    # this also treats a bare dotfile such as ".py" as a Python extension)
+    extension = script_path[script_path.rfind('.'):].lower()
+    if extension in _EXTENSION_TYPES:
+        return _EXTENSION_TYPES[extension]
     
     # Check shebang line if no clear extension
-    lines = content.split('\n')
-    if lines and lines[0].startswith('#!'):
-        shebang = lines[0].lower()
+    if content.startswith('#!'):
+        shebang = content.partition('\n')[0].lower()
         
         if 'python' in shebang:
             return 'python'
-        elif any(shell in shebang for shell in ['bash', 'sh', 'zsh', 'ksh']):
+        elif 'sh' in shebang:  # bash, sh, zsh and ksh all contain "sh"
             return 'bash'
         elif '/r' in shebang or 'rscript' in shebang:
             return 'r'
@@ -97,22 +90,19 @@ def detect_script_type(script_path: str, content: str) -> str:
     return 'other'
 
 
-def check_file_permissions(script_path: str) -> tuple[bool, str]:
+def check_file_permissions(stat_info: os.stat_result) -> tuple[bool, str]:
     """Check if the script file has appropriate permissions.
     
+    Args:
+        stat_info: Result of os.stat() on the script file
+        
     Returns:
         Tuple of (is_executable, permission_info)
     """
-    try:
-        stat_info = os.stat(script_path)
-        is_executable = stat_info.st_mode & 0o111 != 0  # Check if any execute bit is set
-        
-        # Format permissions in octal
-        permissions = oct(stat_info.st_mode)[-3:]
-        
-        return is_executable, f"Permissions: {permissions}"
-    except Exception as e:
-        return False, f"Could not check permissions: {str(e)}"
+    is_executable = stat_info.st_mode & 0o111 != 0  # Check if any execute bit is set
+    
+    # Format permissions in octal
+    return is_executable, f"Permissions: {stat_info.st_mode & 0o777:03o}"
 
 
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
@@ -128,8 +118,10 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     issues: List[LintIssue] = []
     
-    # Check if file exists
-    if not os.path.exists(script_path):
+    # Check if file exists, with a single stat reused for the remaining file checks
+    try:
+        stat_info = os.stat(script_path)
+    except (OSError, ValueError):
         issues.append(LintIssue(
             "ERROR",
             f"Script file does not exist: {script_path}"
@@ -137,7 +129,7 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
     
     # Check if it's a regular file
-    if not os.path.isfile(script_path):
+    if not stat.S_ISREG(stat_info.st_mode):
         issues.append(LintIssue(
             "ERROR",
             f"Path is not a regular file: {script_path}"
@@ -146,19 +138,16 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     
     # Try to read the file
     try:
-        with open(script_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Try with different encoding
+        with open(script_path, 'rb') as f:
+            raw = f.read()
         try:
-            with open(script_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        except Exception as e:
-            issues.append(LintIssue(
-                "ERROR",
-                f"Failed to read script file: {str(e)}"
-            ))
-            return issues
+            content = raw.decode('utf-8')
+        except UnicodeDecodeError:
+            # Try with different encoding, decoding the bytes already read
+            content = raw.decode('latin-1')
+        if '\r' in content:
+            # Match text-mode reads, which translate \r\n and \r line endings to \n
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
     except PermissionError:
         issues.append(LintIssue(
             "ERROR",
@@ -193,7 +182,7 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     ))
     
     # Check file permissions
-    is_executable, perm_info = check_file_permissions(script_path)
+    is_executable, perm_info = check_file_permissions(stat_info)
     
     if not is_executable:
         issues.append(LintIssue(
@@ -207,10 +196,9 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
             f"Script file is executable ({perm_info})"
         ))
     
-    # Basic content analysis
-    lines = content.split('\n')
-    line_count = len(lines)
-    non_empty_lines = len([line for line in lines if line.strip()])
+    # Basic content analysis, counting lines without building a filtered copy of them
+    line_count = content.count('\n') + 1
+    non_empty_lines = sum(1 for line in content.split('\n') if line and not line.isspace())
     
     issues.append(LintIssue(
         "INFO",
@@ -218,10 +206,11 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     ))
     
     # Check for shebang
-    if lines and lines[0].startswith('#!'):
+    if content.startswith('#!'):
+        first_line = content.partition('\n')[0]
         issues.append(LintIssue(
             "INFO",
-            f"Found shebang: {lines[0]}"
+            f"Found shebang: {first_line}"
         ))
     elif script_type in ['python', 'bash', 'r']:
         issues.append(LintIssue(
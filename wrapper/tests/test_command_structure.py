@@ -8,29 +8,55 @@ and proper command-line interface structure.
 """
 from __future__ import annotations
 
+import functools
 import sys
 import os
 import re
+from collections import Counter
 from typing import List
-from dataclasses import dataclass
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
-
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
+
+from wrapper.linter import LintIssue
+
+
+# Patterns used by the command structure checks, compiled once at import
+
+# Python structure markers, found together in a single scan. Each alternative is wrapped in
+# a lookahead so markers that overlap one another are all still reported.
+_PY_STRUCTURE_RE = re.compile(
+    r'(?=(?P<main_block>if\s+__name__\s*==\s*["\']__main__["\'])'
+    r'|(?P<argparse>argparse\.ArgumentParser)'
+    r'|def\s+(?P<function>\w+)\s*\('
+    r'|(?P<imports>^import\s+|^from\s+\w+\s+import)'
+    r'|(?P<subprocess>subprocess\.(?:run|call|Popen))'
+    r'|(?P<class_def>class\s+\w+))',
+    re.MULTILINE,
+)
+_PY_SYS_ARGV_RE = re.compile(r'import\s+sys.*sys\.argv', re.DOTALL)
+
+_BASH_STRICT_MODE_RE = re.compile(r'set\s+-[euo]+')
+_BASH_FUNC_RE = re.compile(r'\w+\s*\(\s*\)\s*\{')
+_BASH_USAGE_FUNC_RE = re.compile(r'(usage|help)\s*\(\s*\)\s*\{')
+_BASH_ARG_LOOP_RE = re.compile(r'while\s+\[\[\s*\$#\s*-gt\s*0\s*\]\]')
+_BASH_ARG_CASE_RE = re.compile(r'case\s+\$1\s+in')
+_BASH_MAIN_SECTION_RE = re.compile(r'#.*[Mm]ain|#.*[Ee]xecution')
+
+_R_OPTPARSE_RE = re.compile(r'library\s*\(\s*optparse\s*\)')
+_R_COMMAND_ARGS_RE = re.compile(r'commandArgs\s*\(')
+_R_OPTION_PARSER_RE = re.compile(r'OptionParser\s*\(')
+_R_FUNC_RE = re.compile(r'\w+\s*<-\s*function\s*\(')
+_R_MAIN_FUNC_RE = re.compile(r'(main|run_analysis)\s*<-\s*function')
+_R_TRYCATCH_RE = re.compile(r'tryCatch\s*\(\s*\{')
+
+# Fallback checks for unrecognized script types as (pattern, description) pairs
+_GENERIC_PATTERNS = (
+    (re.compile(r'def\s+\w+|function\s+\w+|\w+\s*\(\s*\)'), "Function definitions"),
+    (re.compile(r'#!'), "Shebang line"),
+)
 
 
 def check_python_command_structure(content: str) -> tuple[int, List[str]]:
@@ -42,26 +68,33 @@ def check_python_command_structure(content: str) -> tuple[int, List[str]]:
     patterns_found = []
     score = 0
 
+    counts = Counter()
+    has_main_function = False
+    for match in _PY_STRUCTURE_RE.finditer(content):
+        counts[match.lastgroup] += 1
+        if match.lastgroup == 'function' and match.group('function') == 'main':
+            has_main_function = True
+
     # Main execution block
-    if re.search(r'if\s+__name__\s*==\s*["\']__main__["\']', content):
+    if counts['main_block']:
         patterns_found.append("Proper main execution block")
         score += 3
 
     # Argument parsing
-    if re.search(r'argparse\.ArgumentParser', content):
+    if counts['argparse']:
         patterns_found.append("Using argparse for CLI")
         score += 2
-    elif re.search(r'import\s+sys.*sys\.argv', content, re.DOTALL):
+    elif _PY_SYS_ARGV_RE.search(content):
         patterns_found.append("Manual argument parsing")
         score += 1
 
     # Main function
-    if re.search(r'def\s+main\s*\(', content):
+    if has_main_function:
         patterns_found.append("Main function defined")
         score += 2
 
     # Function organization (multiple functions suggest good structure)
-    func_count = len(re.findall(r'def\s+\w+\s*\(', content))
+    func_count = counts['function']
     if func_count >= 5:
         patterns_found.append(f"Well-organized with {func_count} functions")
         score += 2
@@ -70,17 +103,17 @@ def check_python_command_structure(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Import statements
-    if re.search(r'^import\s+|^from\s+\w+\s+import', content, re.MULTILINE):
+    if counts['imports']:
         patterns_found.append("Proper import statements")
         score += 1
 
     # Subprocess/command execution (typical for wrappers)
-    if re.search(r'subprocess\.(run|call|Popen)', content):
+    if counts['subprocess']:
         patterns_found.append("Uses subprocess for command execution")
         score += 1
 
     # Class-based organization (optional but good)
-    if re.search(r'class\s+\w+', content):
+    if counts['class_def']:
         patterns_found.append("Class-based organization")
         score += 1
 
@@ -103,12 +136,12 @@ def check_bash_command_structure(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Strict error handling
-    if re.search(r'set\s+-[euo]+', content):
+    if _BASH_STRICT_MODE_RE.search(content):
         patterns_found.append("Strict error handling (set -e/u/o)")
         score += 2
 
     # Function definitions (good organization)
-    func_count = len(re.findall(r'\w+\s*\(\s*\)\s*\{', content))
+    func_count = sum(1 for _ in _BASH_FUNC_RE.finditer(content))
     if func_count >= 5:
         patterns_found.append(f"Well-organized with {func_count} functions")
         score += 2
@@ -117,20 +150,20 @@ def check_bash_command_structure(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Usage/help function
-    if re.search(r'(usage|help)\s*\(\s*\)\s*\{', content):
+    if _BASH_USAGE_FUNC_RE.search(content):
         patterns_found.append("Usage/help function")
         score += 2
 
     # Proper argument parsing loop
-    if re.search(r'while\s+\[\[\s*\$#\s*-gt\s*0\s*\]\]', content):
+    if _BASH_ARG_LOOP_RE.search(content):
         patterns_found.append("Proper argument parsing loop")
         score += 2
-    elif re.search(r'case\s+\$1\s+in', content):
+    elif _BASH_ARG_CASE_RE.search(content):
         patterns_found.append("Case-based argument parsing")
         score += 1
 
     # Main execution section
-    if re.search(r'#.*[Mm]ain|#.*[Ee]xecution', content):
+    if _BASH_MAIN_SECTION_RE.search(content):
         patterns_found.append("Clearly marked main section")
         score += 1
 
@@ -153,20 +186,20 @@ def check_r_command_structure(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Using optparse library
-    if re.search(r'library\s*\(\s*optparse\s*\)', content):
+    if _R_OPTPARSE_RE.search(content):
         patterns_found.append("Using optparse for CLI")
         score += 3
-    elif re.search(r'commandArgs\s*\(', content):
+    elif _R_COMMAND_ARGS_RE.search(content):
         patterns_found.append("Manual argument parsing")
         score += 1
 
     # OptionParser setup
-    if re.search(r'OptionParser\s*\(', content):
+    if _R_OPTION_PARSER_RE.search(content):
         patterns_found.append("OptionParser configured")
         score += 2
 
     # Function definitions (good organization)
-    func_count = len(re.findall(r'\w+\s*<-\s*function\s*\(', content))
+    func_count = sum(1 for _ in _R_FUNC_RE.finditer(content))
     if func_count >= 5:
         patterns_found.append(f"Well-organized with {func_count} functions")
         score += 2
@@ -175,23 +208,46 @@ def check_r_command_structure(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Main execution function
-    if re.search(r'(main|run_analysis)\s*<-\s*function', content):
+    if _R_MAIN_FUNC_RE.search(content):
         patterns_found.append("Main execution function")
         score += 2
 
     # Library loading with suppressPackageStartupMessages
-    if re.search(r'suppressPackageStartupMessages', content):
+    if 'suppressPackageStartupMessages' in content:
         patterns_found.append("Clean library loading")
         score += 1
 
     # tryCatch for main execution
-    if re.search(r'tryCatch\s*\(\s*\{', content):
+    if _R_TRYCATCH_RE.search(content):
         patterns_found.append("Main execution in tryCatch")
         score += 1
 
     return score, patterns_found
 
 
+@functools.lru_cache(maxsize=32)
+def _score_script(content: str, script_type: str) -> tuple[int, tuple[str, ...]]:
+    """Score a script's command structure for its type.
+
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        score, patterns_found = check_python_command_structure(content)
+    elif script_type == 'bash':
+        score, patterns_found = check_bash_command_structure(content)
+    elif script_type == 'r':
+        score, patterns_found = check_r_command_structure(content)
+    else:
+        # Generic check for any script type
+        score, patterns_found = 0, []
+        for pattern, desc in _GENERIC_PATTERNS:
+            if pattern.search(content):
+                patterns_found.append(desc)
+                score += 1
+    return score, tuple(patterns_found)
+
+
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     Test wrapper script command structure.
@@ -245,25 +301,8 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for command structure patterns based on script type
-    score = 0
-    patterns_found = []
-
-    if script_type == 'python':
-        score, patterns_found = check_python_command_structure(script_content)
-    elif script_type == 'bash':
-        score, patterns_found = check_bash_command_structure(script_content)
-    elif script_type == 'r':
-        score, patterns_found = check_r_command_structure(script_content)
-    else:
-        # Generic check for any script type
-        generic_patterns = [
-            (r'def\s+\w+|function\s+\w+|\w+\s*\(\s*\)', "Function definitions"),
-            (r'#!', "Shebang line"),
-        ]
-        for pattern, desc in generic_patterns:
-            if re.search(pattern, script_content):
-                patterns_found.append(desc)
-                score += 1
+    score, patterns = _score_script(script_content, script_type)
+    patterns_found = list(patterns)
 
     # Store command structure info in context
     shared_context['command_structure_score'] = score
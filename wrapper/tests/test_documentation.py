@@ -7,29 +7,36 @@ including docstrings, comments, help text, and usage information.
 """
 from __future__ import annotations
 
+import functools
 import sys
 import os
 import re
 from typing import List
-from dataclasses import dataclass
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
 
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+# Patterns used by the documentation checks, compiled once at import
+_PY_DOCSTRING_RE = re.compile(r'^[\s]*["\'{3}]', re.MULTILINE)
+_PY_FUNC_DOCSTRING_RE = re.compile(r'def\s+\w+\s*\([^)]*\)\s*:\s*["\'{3}]')
+_HELP_TEXT_RE = re.compile(r'help\s*=\s*["\']')
+_DESCRIPTION_RE = re.compile(r'description\s*=\s*["\']')
+_USAGE_EXAMPLE_RE = re.compile(r'(usage|example|Usage|Example|USAGE|EXAMPLE)')
+_INLINE_COMMENT_RE = re.compile(r'^\s*#[^!]', re.MULTILINE)
+_HEADER_COMMENT_RE = re.compile(r'^#[^!].*', re.MULTILINE)
+_ANY_COMMENT_RE = re.compile(r'^\s*#', re.MULTILINE)
+
+_BASH_USAGE_FUNC_RE = re.compile(r'(usage|help)\s*\(\s*\)\s*\{')
+_BASH_FUNC_COMMENT_RE = re.compile(r'#.*\n\s*\w+\s*\(\s*\)\s*\{')
+_BASH_OPTION_HELP_RE = re.compile(r'echo.*--\w+.*#')
+
+_R_ROXYGEN_FUNC_RE = re.compile(r'#\'.*\n\s*\w+\s*<-\s*function')
+_R_FUNC_COMMENT_RE = re.compile(r'#.*\n\s*\w+\s*<-\s*function')
 
 
 def check_python_documentation(content: str) -> tuple[int, List[str]]:
@@ -42,18 +49,18 @@ def check_python_documentation(content: str) -> tuple[int, List[str]]:
     score = 0
 
     # Module-level docstring
-    if re.search(r'^[\s]*["\'{3}]', content, re.MULTILINE):
+    if _PY_DOCSTRING_RE.search(content):
         patterns_found.append("Module-level docstring")
         score += 2
 
     # Function docstrings
-    func_with_docs = len(re.findall(r'def\s+\w+\s*\([^)]*\)\s*:\s*["\'{3}]', content))
+    func_with_docs = sum(1 for _ in _PY_FUNC_DOCSTRING_RE.finditer(content))
     if func_with_docs > 0:
         patterns_found.append(f"Function docstrings ({func_with_docs} found)")
         score += min(func_with_docs, 3)  # Cap at 3 points
 
     # Inline comments
-    comment_count = len(re.findall(r'^\s*#[^!]', content, re.MULTILINE))
+    comment_count = sum(1 for _ in _INLINE_COMMENT_RE.finditer(content))
     if comment_count > 5:
         patterns_found.append(f"Inline comments ({comment_count} found)")
         score += 2
@@ -62,17 +69,17 @@ def check_python_documentation(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Help text in argparse
-    if re.search(r'help\s*=\s*["\']', content):
+    if _HELP_TEXT_RE.search(content):
         patterns_found.append("Argument help text")
         score += 2
 
     # Description in argparse
-    if re.search(r'description\s*=\s*["\']', content):
+    if _DESCRIPTION_RE.search(content):
         patterns_found.append("Script description")
         score += 1
 
     # Usage examples
-    if re.search(r'(usage|example|Usage|Example|USAGE|EXAMPLE)', content):
+    if _USAGE_EXAMPLE_RE.search(content):
         patterns_found.append("Usage examples or instructions")
         score += 1
 
@@ -89,7 +96,7 @@ def check_bash_documentation(content: str) -> tuple[int, List[str]]:
     score = 0
 
     # Header comments
-    header_comments = len(re.findall(r'^#[^!].*', content[:500], re.MULTILINE))
+    header_comments = sum(1 for _ in _HEADER_COMMENT_RE.finditer(content, 0, 500))
     if header_comments > 3:
         patterns_found.append(f"Header documentation ({header_comments} lines)")
         score += 2
@@ -98,18 +105,18 @@ def check_bash_documentation(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Usage function
-    if re.search(r'(usage|help)\s*\(\s*\)\s*\{', content):
+    if _BASH_USAGE_FUNC_RE.search(content):
         patterns_found.append("Usage/help function")
         score += 3
 
     # Function comments
-    func_comments = len(re.findall(r'#.*\n\s*\w+\s*\(\s*\)\s*\{', content))
+    func_comments = sum(1 for _ in _BASH_FUNC_COMMENT_RE.finditer(content))
     if func_comments > 0:
         patterns_found.append(f"Function comments ({func_comments} found)")
         score += 2
 
     # Inline comments
-    comment_count = len(re.findall(r'^\s*#[^!]', content, re.MULTILINE))
+    comment_count = sum(1 for _ in _INLINE_COMMENT_RE.finditer(content))
     if comment_count > 10:
         patterns_found.append(f"Inline comments ({comment_count} found)")
         score += 2
@@ -118,7 +125,7 @@ def check_bash_documentation(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Parameter descriptions in usage
-    if re.search(r'echo.*--\w+.*#', content):
+    if _BASH_OPTION_HELP_RE.search(content):
         patterns_found.append("Parameter descriptions in help")
         score += 1
 
@@ -135,7 +142,7 @@ def check_r_documentation(content: str) -> tuple[int, List[str]]:
     score = 0
 
     # Header comments
-    header_comments = len(re.findall(r'^#[^!].*', content[:500], re.MULTILINE))
+    header_comments = sum(1 for _ in _HEADER_COMMENT_RE.finditer(content, 0, 500))
     if header_comments > 3:
         patterns_found.append(f"Header documentation ({header_comments} lines)")
         score += 2
@@ -144,29 +151,29 @@ def check_r_documentation(content: str) -> tuple[int, List[str]]:
         score += 1
 
     # Function documentation
-    func_docs = len(re.findall(r'#\'.*\n\s*\w+\s*<-\s*function', content))
+    func_docs = sum(1 for _ in _R_ROXYGEN_FUNC_RE.finditer(content))
     if func_docs > 0:
         patterns_found.append(f"Roxygen-style function docs ({func_docs} found)")
         score += 3
 
     # Regular function comments
-    func_comments = len(re.findall(r'#.*\n\s*\w+\s*<-\s*function', content))
+    func_comments = sum(1 for _ in _R_FUNC_COMMENT_RE.finditer(content))
     if func_comments > func_docs:
         patterns_found.append(f"Function comments ({func_comments} found)")
         score += 2
 
     # Option descriptions in optparse
-    if re.search(r'help\s*=\s*["\']', content):
+    if _HELP_TEXT_RE.search(content):
         patterns_found.append("Parameter help text")
         score += 2
 
     # Script description
-    if re.search(r'description\s*=\s*["\']', content):
+    if _DESCRIPTION_RE.search(content):
         patterns_found.append("Script description")
         score += 1
 
     # Inline comments
-    comment_count = len(re.findall(r'^\s*#[^!]', content, re.MULTILINE))
+    comment_count = sum(1 for _ in _INLINE_COMMENT_RE.finditer(content))
     if comment_count > 10:
         patterns_found.append(f"Inline comments ({comment_count} found)")
         score += 2
@@ -177,6 +184,35 @@ def check_r_documentation(content: str) -> tuple[int, List[str]]:
     return score, patterns_found
 
 
+@functools.lru_cache(maxsize=32)
+def _score_script(content: str, script_type: str) -> tuple[int, tuple[str, ...]]:
+    """Score a script's documentation for its type.
+
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        score, patterns_found = check_python_documentation(content)
+    elif script_type == 'bash':
+        score, patterns_found = check_bash_documentation(content)
+    elif script_type == 'r':
+        score, patterns_found = check_r_documentation(content)
+    else:
+        # Generic check for any script type
+        score, patterns_found = 0, []
+        comment_count = sum(1 for _ in _ANY_COMMENT_RE.finditer(content))
+        if comment_count > 10:
+            patterns_found.append(f"Comments ({comment_count} found)")
+            score += 3
+        elif comment_count > 5:
+            patterns_found.append(f"Some comments ({comment_count} found)")
+            score += 2
+        elif comment_count > 0:
+            patterns_found.append(f"Minimal comments ({comment_count} found)")
+            score += 1
+    return score, tuple(patterns_found)
+
+
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     Test wrapper script documentation quality.
@@ -213,27 +249,8 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for documentation patterns based on script type
-    score = 0
-    patterns_found = []
-
-    if script_type == 'python':
-        score, patterns_found = check_python_documentation(script_content)
-    elif script_type == 'bash':
-        score, patterns_found = check_bash_documentation(script_content)
-    elif script_type == 'r':
-        score, patterns_found = check_r_documentation(script_content)
-    else:
-        # Generic check for any script type
-        comment_count = len(re.findall(r'^\s*#', script_content, re.MULTILINE))
-        if comment_count > 10:
-            patterns_found.append(f"Comments ({comment_count} found)")
-            score += 3
-        elif comment_count > 5:
-            patterns_found.append(f"Some comments ({comment_count} found)")
-            score += 2
-        elif comment_count > 0:
-            patterns_found.append(f"Minimal comments ({comment_count} found)")
-            score += 1
+    score, patterns = _score_script(script_content, script_type)
+    patterns_found = list(patterns)
 
     # Store documentation info in context
     shared_context['documentation_score'] = score
@@ -10,206 +10,143 @@ from __future__ import annotations
 import sys
 import os
 import re
+import functools
 from typing import List
-from dataclasses import dataclass
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so LintIssue and the shared test helpers can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
+from wrapper.tests._lint_common import score_patterns
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
-
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
-
-
-def check_python_error_handling(content: str) -> tuple[int, List[str]]:
-    """Check for error handling patterns in Python scripts.
-
-    Returns:
-        Tuple of (error_handling_score, list_of_found_patterns)
-    """
-    patterns_found = []
-    score = 0
 
+# (pattern, description, points) checks scored by check_python_error_handling
+_PY_ERROR_HANDLING_PATTERNS = (
     # Try-except blocks
-    if re.search(r'\btry\s*:', content):
-        patterns_found.append("try-except block")
-        score += 2
-
+    (re.compile(r'\btry\s*:'), "try-except block", 2),
     # Exception handling
-    if re.search(r'\bexcept\s+\w+', content):
-        patterns_found.append("Specific exception catching")
-        score += 1
-
+    (re.compile(r'\bexcept\s+\w+'), "Specific exception catching", 1),
     # Exit code handling
-    if re.search(r'sys\.exit\s*\(', content):
-        patterns_found.append("sys.exit() usage")
-        score += 1
-
+    (re.compile(r'sys\.exit\s*\('), "sys.exit() usage", 1),
     # Raising exceptions
-    if re.search(r'\braise\s+\w+', content):
-        patterns_found.append("Raising exceptions")
-        score += 1
-
+    (re.compile(r'\braise\s+\w+'), "Raising exceptions", 1),
     # Logging errors
-    if re.search(r'logging\.(error|warning|exception)', content, re.IGNORECASE):
-        patterns_found.append("Error logging")
-        score += 1
-
+    (re.compile(r'logging\.(?:error|warning|exception|Error|Warning|Exception|ERROR|WARNING|EXCEPTION)'), "Error logging", 1),
     # Error messages to stderr
-    if re.search(r'sys\.stderr\.write', content):
-        patterns_found.append("Writing to stderr")
-        score += 1
-
+    ('sys.stderr.write', "Writing to stderr", 1),
     # File/path validation
-    if re.search(r'os\.path\.exists|Path\([^)]+\)\.exists', content):
-        patterns_found.append("File existence checking")
-        score += 1
-
+    (re.compile(r'os\.path\.exists|Path\([^)]+\)\.exists'), "File existence checking", 1),
     # Subprocess error checking
-    if re.search(r'subprocess\.run\([^)]*check\s*=\s*True', content):
-        patterns_found.append("Subprocess error checking (check=True)")
-        score += 1
-
-    if re.search(r'subprocess\.CalledProcessError', content):
-        patterns_found.append("Subprocess error handling")
-        score += 1
-
+    (re.compile(r'subprocess\.run\([^)]*check\s*=\s*True'), "Subprocess error checking (check=True)", 1),
+    ('subprocess.CalledProcessError', "Subprocess error handling", 1),
     # Assert statements (can be basic error checking)
-    if re.search(r'\bassert\s+', content):
-        patterns_found.append("Assert statements")
-        score += 0.5
+    (re.compile(r'\bassert\s+'), "Assert statements", 0.5),
+)
 
-    return score, patterns_found
 
-
-def check_bash_error_handling(content: str) -> tuple[int, List[str]]:
-    """Check for error handling patterns in Bash scripts.
+def check_python_error_handling(content: str) -> tuple[int, List[str]]:
+    """Check for error handling patterns in Python scripts.
 
     Returns:
         Tuple of (error_handling_score, list_of_found_patterns)
     """
-    patterns_found = []
-    score = 0
+    return score_patterns(content, _PY_ERROR_HANDLING_PATTERNS)
 
-    # Exit on error
-    if re.search(r'set\s+-e', content):
-        patterns_found.append("set -e (exit on error)")
-        score += 2
 
+# (pattern, description, points) checks scored by check_bash_error_handling
+_BASH_ERROR_HANDLING_PATTERNS = (
+    # Exit on error
+    (re.compile(r'set\s+-e'), "set -e (exit on error)", 2),
     # Pipefail
-    if re.search(r'set\s+-o\s+pipefail', content):
-        patterns_found.append("set -o pipefail")
-        score += 1
-
+    (re.compile(r'set\s+-o\s+pipefail'), "set -o pipefail", 1),
     # Exit code checking
-    if re.search(r'\$\?', content):
-        patterns_found.append("Exit code checking ($?)")
-        score += 1
-
+    ('$?', "Exit code checking ($?)", 1),
     # Conditional error checking
-    if re.search(r'if\s+\[\s*\$\?\s*-ne\s*0', content):
-        patterns_found.append("Explicit exit code checking")
-        score += 1
-
+    (re.compile(r'if\s+\[\s*\$\?\s*-ne\s*0'), "Explicit exit code checking", 1),
     # File existence checks
-    if re.search(r'\[\s*-[ef]\s+', content):
-        patterns_found.append("File existence checking (-e/-f)")
-        score += 1
-
+    (re.compile(r'\[\s*-[ef]\s+'), "File existence checking (-e/-f)", 1),
     # Error messages to stderr
-    if re.search(r'>&2|1>&2', content):
-        patterns_found.append("Redirecting to stderr")
-        score += 1
-
+    ('>&2', "Redirecting to stderr", 1),
     # Error trap
-    if re.search(r'trap\s+', content):
-        patterns_found.append("Error trap handling")
-        score += 2
-
+    (re.compile(r'trap\s+'), "Error trap handling", 2),
     # Explicit exit statements
-    if re.search(r'\bexit\s+[1-9]', content):
-        patterns_found.append("Non-zero exit codes")
-        score += 1
-
+    (re.compile(r'\bexit\s+[1-9]'), "Non-zero exit codes", 1),
     # Die/error functions
-    if re.search(r'(die|error|fail)\s*\(\s*\)', content):
-        patterns_found.append("Error handling function")
-        score += 1
+    (re.compile(r'(die|error|fail)\s*\(\s*\)'), "Error handling function", 1),
+)
 
-    return score, patterns_found
 
-
-def check_r_error_handling(content: str) -> tuple[int, List[str]]:
-    """Check for error handling patterns in R scripts.
+def check_bash_error_handling(content: str) -> tuple[int, List[str]]:
+    """Check for error handling patterns in Bash scripts.
 
     Returns:
         Tuple of (error_handling_score, list_of_found_patterns)
     """
-    patterns_found = []
-    score = 0
+    return score_patterns(content, _BASH_ERROR_HANDLING_PATTERNS)
 
-    # tryCatch blocks
-    if re.search(r'tryCatch\s*\(', content):
-        patterns_found.append("tryCatch block")
-        score += 2
 
+# (pattern, description, points) checks scored by check_r_error_handling
+_R_ERROR_HANDLING_PATTERNS = (
+    # tryCatch blocks
+    (re.compile(r'tryCatch\s*\('), "tryCatch block", 2),
     # try blocks
-    if re.search(r'\btry\s*\(', content):
-        patterns_found.append("try() block")
-        score += 1
-
+    (re.compile(r'\btry\s*\('), "try() block", 1),
     # Error handlers
-    if re.search(r'error\s*=\s*function', content):
-        patterns_found.append("Error handling function")
-        score += 1
-
+    (re.compile(r'error\s*=\s*function'), "Error handling function", 1),
     # Warning handlers
-    if re.search(r'warning\s*=\s*function', content):
-        patterns_found.append("Warning handling function")
-        score += 1
-
+    (re.compile(r'warning\s*=\s*function'), "Warning handling function", 1),
     # Stop on error
-    if re.search(r'\bstop\s*\(', content):
-        patterns_found.append("stop() calls")
-        score += 1
-
+    (re.compile(r'\bstop\s*\('), "stop() calls", 1),
     # Warnings
-    if re.search(r'\bwarning\s*\(', content):
-        patterns_found.append("warning() calls")
-        score += 0.5
-
+    (re.compile(r'\bwarning\s*\('), "warning() calls", 0.5),
     # quit/q with status
-    if re.search(r'quit\s*\(\s*status\s*=', content):
-        patterns_found.append("quit() with status code")
-        score += 1
-
+    (re.compile(r'quit\s*\(\s*status\s*='), "quit() with status code", 1),
     # File existence checks
-    if re.search(r'file\.exists\s*\(', content):
-        patterns_found.append("file.exists() checking")
-        score += 1
-
+    (re.compile(r'file\.exists\s*\('), "file.exists() checking", 1),
     # stopifnot
-    if re.search(r'\bstopifnot\s*\(', content):
-        patterns_found.append("stopifnot() assertions")
-        score += 1
-
+    (re.compile(r'\bstopifnot\s*\('), "stopifnot() assertions", 1),
     # Message/cat for errors
-    if re.search(r'cat\s*\(\s*["\']Error', content, re.IGNORECASE):
-        patterns_found.append("Error messages")
-        score += 0.5
+    (re.compile(r'cat\s*\(\s*["\'](?:Error|error|ERROR)'), "Error messages", 0.5),
+)
+
 
-    return score, patterns_found
+def check_r_error_handling(content: str) -> tuple[int, List[str]]:
+    """Check for error handling patterns in R scripts.
+
+    Returns:
+        Tuple of (error_handling_score, list_of_found_patterns)
+    """
+    return score_patterns(content, _R_ERROR_HANDLING_PATTERNS)
+
+
+# Fallback checks for script types without a dedicated checker
+_GENERIC_ERROR_HANDLING_PATTERNS = (
+    (re.compile(r'\btry\b', re.IGNORECASE), "try statement", 1),
+    (re.compile(r'\bcatch\b', re.IGNORECASE), "catch statement", 1),
+    (re.compile(r'\berror\b', re.IGNORECASE), "error handling", 1),
+    (re.compile(r'\bexit\s+[1-9]', re.IGNORECASE), "non-zero exit", 1),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _score_script(content: str, script_type: str) -> tuple[int, tuple[str, ...]]:
+    """Score a script's error handling for its type.
+
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        score, patterns_found = check_python_error_handling(content)
+    elif script_type == 'bash':
+        score, patterns_found = check_bash_error_handling(content)
+    elif script_type == 'r':
+        score, patterns_found = check_r_error_handling(content)
+    else:
+        # Generic check for any script type
+        score, patterns_found = score_patterns(content, _GENERIC_ERROR_HANDLING_PATTERNS)
+    return score, tuple(patterns_found)
 
 
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
@@ -248,27 +185,8 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for error handling patterns based on script type
-    score = 0
-    patterns_found = []
-
-    if script_type == 'python':
-        score, patterns_found = check_python_error_handling(script_content)
-    elif script_type == 'bash':
-        score, patterns_found = check_bash_error_handling(script_content)
-    elif script_type == 'r':
-        score, patterns_found = check_r_error_handling(script_content)
-    else:
-        # Generic check for any script type
-        generic_patterns = [
-            (r'\btry\b', "try statement"),
-            (r'\bcatch\b', "catch statement"),
-            (r'\berror\b', "error handling"),
-            (r'\bexit\s+[1-9]', "non-zero exit"),
-        ]
-        for pattern, desc in generic_patterns:
-            if re.search(pattern, script_content, re.IGNORECASE):
-                patterns_found.append(desc)
-                score += 1
+    score, patterns = _score_script(script_content, script_type)
+    patterns_found = list(patterns)
 
     # Store error handling info in context
     shared_context['error_handling_score'] = score
@@ -10,209 +10,142 @@ from __future__ import annotations
 import sys
 import os
 import re
+import functools
 from typing import List
-from dataclasses import dataclass
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so LintIssue and the shared test helpers can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
+from wrapper.tests._lint_common import score_patterns
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
-
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
-
-
-def check_python_input_validation(content: str) -> tuple[int, List[str]]:
-    """Check for input validation patterns in Python scripts.
-
-    Returns:
-        Tuple of (validation_score, list_of_found_patterns)
-    """
-    patterns_found = []
-    score = 0
 
+# (pattern, description, points) checks scored by check_python_input_validation
+_PY_INPUT_VALIDATION_PATTERNS = (
     # File existence checks
-    if re.search(r'os\.path\.exists\s*\(', content):
-        patterns_found.append("os.path.exists() checking")
-        score += 2
-
-    if re.search(r'Path\([^)]+\)\.exists\s*\(', content):
-        patterns_found.append("pathlib Path.exists() checking")
-        score += 2
-
+    (re.compile(r'os\.path\.exists\s*\('), "os.path.exists() checking", 2),
+    (re.compile(r'Path\([^)]+\)\.exists\s*\('), "pathlib Path.exists() checking", 2),
     # File type checks
-    if re.search(r'os\.path\.isfile\s*\(', content):
-        patterns_found.append("os.path.isfile() checking")
-        score += 1
-
-    if re.search(r'os\.path\.isdir\s*\(', content):
-        patterns_found.append("os.path.isdir() checking")
-        score += 1
-
+    (re.compile(r'os\.path\.isfile\s*\('), "os.path.isfile() checking", 1),
+    (re.compile(r'os\.path\.isdir\s*\('), "os.path.isdir() checking", 1),
     # File permissions/readability
-    if re.search(r'os\.access\s*\([^)]*os\.R_OK', content):
-        patterns_found.append("File readability checking")
-        score += 1
-
+    (re.compile(r'os\.access\s*\([^)]*os\.R_OK'), "File readability checking", 1),
     # Required parameter validation
-    if re.search(r'required\s*=\s*True', content):
-        patterns_found.append("Required parameters defined")
-        score += 1
-
+    (re.compile(r'required\s*=\s*True'), "Required parameters defined", 1),
     # Argument validation functions
-    if re.search(r'def\s+validate_\w+\s*\(', content):
-        patterns_found.append("Validation functions defined")
-        score += 2
-
+    (re.compile(r'def\s+validate_\w+\s*\('), "Validation functions defined", 2),
     # Type validation
-    if re.search(r'type\s*=\s*(int|float|str)', content):
-        patterns_found.append("Type validation in argparse")
-        score += 1
-
+    (re.compile(r'type\s*=\s*(int|float|str)'), "Type validation in argparse", 1),
     # Choices validation
-    if re.search(r'choices\s*=\s*\[', content):
-        patterns_found.append("Choice validation in argparse")
-        score += 1
-
+    (re.compile(r'choices\s*=\s*\['), "Choice validation in argparse", 1),
     # File format validation
-    if re.search(r'\.endswith\s*\(', content):
-        patterns_found.append("File extension checking")
-        score += 1
-
+    (re.compile(r'\.endswith\s*\('), "File extension checking", 1),
     # Empty/None checks
-    if re.search(r'if\s+not\s+\w+:|if\s+\w+\s+is\s+None', content):
-        patterns_found.append("Empty/None value checking")
-        score += 1
-
+    (re.compile(r'if\s+not\s+\w+:|if\s+\w+\s+is\s+None'), "Empty/None value checking", 1),
     # Value range checking
-    if re.search(r'if\s+\w+\s*[<>]=?\s*\d+', content):
-        patterns_found.append("Value range checking")
-        score += 1
-
-    return score, patterns_found
+    (re.compile(r'if\s+\w+\s*[<>]=?\s*\d+'), "Value range checking", 1),
+)
 
 
-def check_bash_input_validation(content: str) -> tuple[int, List[str]]:
-    """Check for input validation patterns in Bash scripts.
+def check_python_input_validation(content: str) -> tuple[int, List[str]]:
+    """Check for input validation patterns in Python scripts.
 
     Returns:
         Tuple of (validation_score, list_of_found_patterns)
     """
-    patterns_found = []
-    score = 0
+    return score_patterns(content, _PY_INPUT_VALIDATION_PATTERNS)
 
-    # File existence checks
-    if re.search(r'\[\s*-[ef]\s+["\$]', content):
-        patterns_found.append("File existence checking (-e/-f)")
-        score += 2
 
+# (pattern, description, points) checks scored by check_bash_input_validation
+_BASH_INPUT_VALIDATION_PATTERNS = (
+    # File existence checks
+    (re.compile(r'\[\s*-[ef]\s+["\$]'), "File existence checking (-e/-f)", 2),
     # File type checks
-    if re.search(r'\[\s*-d\s+["\$]', content):
-        patterns_found.append("Directory checking (-d)")
-        score += 1
-
+    (re.compile(r'\[\s*-d\s+["\$]'), "Directory checking (-d)", 1),
     # File readability
-    if re.search(r'\[\s*-r\s+["\$]', content):
-        patterns_found.append("File readability checking (-r)")
-        score += 1
-
+    (re.compile(r'\[\s*-r\s+["\$]'), "File readability checking (-r)", 1),
     # Empty variable checks
-    if re.search(r'\[\s*-z\s+["\$]', content):
-        patterns_found.append("Empty variable checking (-z)")
-        score += 1
-
+    (re.compile(r'\[\s*-z\s+["\$]'), "Empty variable checking (-z)", 1),
     # Required parameter checking
-    if re.search(r'if\s+\[\[\s*-z\s+["\$].*\]\].*echo.*required', content, re.IGNORECASE):
-        patterns_found.append("Required parameter validation")
-        score += 2
-
+    (re.compile(r'if\s+\[\[\s*-z\s+["\$].*\]\].*echo.*(?:required|Required|REQUIRED)'), "Required parameter validation", 2),
     # Usage function
-    if re.search(r'(usage|help)\s*\(\s*\)\s*\{', content):
-        patterns_found.append("Usage/help function defined")
-        score += 1
-
+    (re.compile(r'(usage|help)\s*\(\s*\)\s*\{'), "Usage/help function defined", 1),
     # Parameter validation in case statements
-    if re.search(r'case\s+\$\d+\s+in', content):
-        patterns_found.append("Parameter validation in case statement")
-        score += 1
-
+    (re.compile(r'case\s+\$\d+\s+in'), "Parameter validation in case statement", 1),
     # Numeric validation
-    if re.search(r'\[\[\s*\$\w+\s*=~\s*\^[0-9]', content):
-        patterns_found.append("Numeric validation with regex")
-        score += 1
+    (re.compile(r'\[\[\s*\$\w+\s*=~\s*\^[0-9]'), "Numeric validation with regex", 1),
+)
 
-    return score, patterns_found
 
-
-def check_r_input_validation(content: str) -> tuple[int, List[str]]:
-    """Check for input validation patterns in R scripts.
+def check_bash_input_validation(content: str) -> tuple[int, List[str]]:
+    """Check for input validation patterns in Bash scripts.
 
     Returns:
         Tuple of (validation_score, list_of_found_patterns)
     """
-    patterns_found = []
-    score = 0
+    return score_patterns(content, _BASH_INPUT_VALIDATION_PATTERNS)
 
-    # File existence checks
-    if re.search(r'file\.exists\s*\(', content):
-        patterns_found.append("file.exists() checking")
-        score += 2
 
+# (pattern, description, points) checks scored by check_r_input_validation
+_R_INPUT_VALIDATION_PATTERNS = (
+    # File existence checks
+    (re.compile(r'file\.exists\s*\('), "file.exists() checking", 2),
     # Directory checks
-    if re.search(r'dir\.exists\s*\(', content):
-        patterns_found.append("dir.exists() checking")
-        score += 1
-
+    (re.compile(r'dir\.exists\s*\('), "dir.exists() checking", 1),
     # NULL/NA checks
-    if re.search(r'is\.null\s*\(', content):
-        patterns_found.append("is.null() checking")
-        score += 1
+    (re.compile(r'is\.null\s*\('), "is.null() checking", 1),
+    (re.compile(r'is\.na\s*\('), "is.na() checking", 1),
+    # stopifnot validation
+    (re.compile(r'stopifnot\s*\('), "stopifnot() assertions", 2),
+    # Required parameters in optparse
+    (re.compile(r'default\s*=\s*NULL'), "Required parameters (default=NULL)", 1),
+    # Type checking
+    (re.compile(r'is\.(numeric|integer|character|logical)\s*\('), "Type validation functions", 1),
+    # Validation functions
+    (re.compile(r'validate\w*\s*<-\s*function'), "Validation functions defined", 2),
+    # File format checks
+    (re.compile(r'grepl\s*\(["\'].*\\.(csv|txt|tsv)'), "File format validation", 1),
+    # Argument parsing validation
+    (re.compile(r'if\s*\(\s*is\.null\s*\(\s*args\$\w+\s*\)\s*\)'), "Argument validation", 1),
+)
 
-    if re.search(r'is\.na\s*\(', content):
-        patterns_found.append("is.na() checking")
-        score += 1
 
-    # stopifnot validation
-    if re.search(r'stopifnot\s*\(', content):
-        patterns_found.append("stopifnot() assertions")
-        score += 2
+def check_r_input_validation(content: str) -> tuple[int, List[str]]:
+    """Check for input validation patterns in R scripts.
 
-    # Required parameters in optparse
-    if re.search(r'default\s*=\s*NULL', content):
-        patterns_found.append("Required parameters (default=NULL)")
-        score += 1
+    Returns:
+        Tuple of (validation_score, list_of_found_patterns)
+    """
+    return score_patterns(content, _R_INPUT_VALIDATION_PATTERNS)
 
-    # Type checking
-    if re.search(r'is\.(numeric|integer|character|logical)\s*\(', content):
-        patterns_found.append("Type validation functions")
-        score += 1
 
-    # Validation functions
-    if re.search(r'validate\w*\s*<-\s*function', content):
-        patterns_found.append("Validation functions defined")
-        score += 2
+# Fallback checks for script types without a dedicated checker
+_GENERIC_INPUT_VALIDATION_PATTERNS = (
+    (re.compile(r'exists', re.IGNORECASE), "existence checking", 1),
+    (re.compile(r'validate|check', re.IGNORECASE), "validation/checking", 1),
+    (re.compile(r'required', re.IGNORECASE), "required parameter handling", 1),
+)
 
-    # File format checks
-    if re.search(r'grepl\s*\(["\'].*\\.(csv|txt|tsv)', content):
-        patterns_found.append("File format validation")
-        score += 1
 
-    # Argument parsing validation
-    if re.search(r'if\s*\(\s*is\.null\s*\(\s*args\$\w+\s*\)\s*\)', content):
-        patterns_found.append("Argument validation")
-        score += 1
+@functools.lru_cache(maxsize=32)
+def _score_script(content: str, script_type: str) -> tuple[int, tuple[str, ...]]:
+    """Score a script's input validation for its type.
 
-    return score, patterns_found
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        score, patterns_found = check_python_input_validation(content)
+    elif script_type == 'bash':
+        score, patterns_found = check_bash_input_validation(content)
+    elif script_type == 'r':
+        score, patterns_found = check_r_input_validation(content)
+    else:
+        # Generic check for any script type
+        score, patterns_found = score_patterns(content, _GENERIC_INPUT_VALIDATION_PATTERNS)
+    return score, tuple(patterns_found)
 
 
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
@@ -251,26 +184,8 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for input validation patterns based on script type
-    score = 0
-    patterns_found = []
-
-    if script_type == 'python':
-        score, patterns_found = check_python_input_validation(script_content)
-    elif script_type == 'bash':
-        score, patterns_found = check_bash_input_validation(script_content)
-    elif script_type == 'r':
-        score, patterns_found = check_r_input_validation(script_content)
-    else:
-        # Generic check for any script type
-        generic_patterns = [
-            (r'exists', "existence checking"),
-            (r'validate|check', "validation/checking"),
-            (r'required', "required parameter handling"),
-        ]
-        for pattern, desc in generic_patterns:
-            if re.search(pattern, script_content, re.IGNORECASE):
-                patterns_found.append(desc)
-                score += 1
+    score, patterns = _score_script(script_content, script_type)
+    patterns_found = list(patterns)
 
     # Store input validation info in context
     shared_context['input_validation_score'] = score
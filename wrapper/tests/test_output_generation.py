@@ -10,26 +10,69 @@ from __future__ import annotations
 import sys
 import os
 import re
-from typing import List
-from dataclasses import dataclass
+import functools
+from typing import List, Optional
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so LintIssue and the shared test helpers can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
+from wrapper.tests._lint_common import lowered_for_search
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
 
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+# Escapes such as \S or \W whose meaning changes when the pattern source is lowercased
+_UPPERCASE_ESCAPE_RE = re.compile(r'\\[A-Z]')
+
+
+def _compile_patterns(label: str, *sources: str) -> tuple[tuple[str, re.Pattern, Optional[re.Pattern]], ...]:
+    """Compile case-insensitive output patterns into (name, compiled, compiled_lower) triples.
+    
+    name is the reported pattern name, label followed by the pattern source. compiled_lower
+    is the lowercased pattern compiled case-sensitively, for searching lowercased content;
+    without IGNORECASE the engine can use its literal-prefix scan.
+    """
+    return tuple(
+        (f"{label}: {source}", re.compile(source, re.IGNORECASE),
+         None if _UPPERCASE_ESCAPE_RE.search(source) else re.compile(source.lower()))
+        for source in sources
+    )
+
+
+def _pattern_matches(content: str, content_lower: Optional[str], compiled: re.Pattern,
+                     compiled_lower: Optional[re.Pattern]) -> bool:
+    """Check one _compile_patterns entry against the content."""
+    if compiled_lower is not None and content_lower is not None:
+        return compiled_lower.search(content_lower) is not None
+    return compiled.search(content) is not None
+
+
+# File writing patterns
+_PY_FILE_WRITE_PATTERNS = _compile_patterns(
+    "Python output pattern",
+    r'open\([^)]*["\']w["\']',  # open(file, 'w')
+    r'\.write\(',  # file.write()
+    r'\.to_csv\(',  # pandas DataFrame.to_csv()
+    r'\.to_excel\(',  # pandas DataFrame.to_excel()
+    r'\.savefig\(',  # matplotlib savefig()
+    r'\.save\(',  # Various save methods
+    r'pickle\.dump\(',  # Pickle dump
+    r'json\.dump\(',  # JSON dump
+    r'numpy\.save\(',  # Numpy save
+    r'with\s+open\([^)]*["\']w',  # with open context manager
+    r'pathlib\.Path\([^)]*\.write_',  # Pathlib write operations
+)
+
+# Output-related variable names
+_PY_OUTPUT_VARS = _compile_patterns(
+    "Output variable",
+    r'output[_\.]?file',
+    r'out[_\.]?file',
+    r'result[_\.]?file',
+    r'output[_\.]?path',
+    r'out[_\.]?dir',
+)
 
 
 def check_python_output_patterns(content: str) -> tuple[bool, List[str]]:
@@ -39,42 +82,45 @@ def check_python_output_patterns(content: str) -> tuple[bool, List[str]]:
         Tuple of (has_output_generation, list_of_found_patterns)
     """
     patterns_found = []
+    content_lower = lowered_for_search(content)
 
     # File writing patterns
-    file_write_patterns = [
-        r'open\([^)]*["\']w["\']',  # open(file, 'w')
-        r'\.write\(',  # file.write()
-        r'\.to_csv\(',  # pandas DataFrame.to_csv()
-        r'\.to_excel\(',  # pandas DataFrame.to_excel()
-        r'\.savefig\(',  # matplotlib savefig()
-        r'\.save\(',  # Various save methods
-        r'pickle\.dump\(',  # Pickle dump
-        r'json\.dump\(',  # JSON dump
-        r'numpy\.save\(',  # Numpy save
-        r'with\s+open\([^)]*["\']w',  # with open context manager
-        r'pathlib\.Path\([^)]*\.write_',  # Pathlib write operations
-    ]
-
-    for pattern in file_write_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            patterns_found.append(f"Python output pattern: {pattern}")
+    for name, compiled, compiled_lower in _PY_FILE_WRITE_PATTERNS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     # Check for output-related variables
-    output_vars = [
-        r'output[_\.]?file',
-        r'out[_\.]?file',
-        r'result[_\.]?file',
-        r'output[_\.]?path',
-        r'out[_\.]?dir',
-    ]
-
-    for var_pattern in output_vars:
-        if re.search(var_pattern, content, re.IGNORECASE):
-            patterns_found.append(f"Output variable: {var_pattern}")
+    for name, compiled, compiled_lower in _PY_OUTPUT_VARS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     return len(patterns_found) > 0, patterns_found
 
 
+# Bash output redirection patterns
+_BASH_OUTPUT_PATTERNS = _compile_patterns(
+    "Bash output pattern",
+    r'>\s*["\$]',  # Output redirection: > $file or > "file"
+    r'>>\s*["\$]',  # Append redirection: >> $file
+    r'\|\s*tee\s+',  # Tee command
+    r'cat\s+.*>\s*',  # Cat with redirection
+    r'echo\s+.*>\s*',  # Echo with redirection
+    r'printf\s+.*>\s*',  # Printf with redirection
+    r'\s+-o\s+',  # -o output flag
+    r'\s+--output\s+',  # --output flag
+    r'\s+--out\s+',  # --out flag
+)
+
+# Output-related variable names
+_BASH_OUTPUT_VARS = _compile_patterns(
+    "Output variable",
+    r'output[_]?file',
+    r'out[_]?file',
+    r'result[_]?file',
+    r'output[_]?dir',
+)
+
+
 def check_bash_output_patterns(content: str) -> tuple[bool, List[str]]:
     """Check for output generation patterns in Bash scripts.
 
@@ -82,39 +128,48 @@ def check_bash_output_patterns(content: str) -> tuple[bool, List[str]]:
         Tuple of (has_output_generation, list_of_found_patterns)
     """
     patterns_found = []
+    content_lower = lowered_for_search(content)
 
     # Bash output redirection patterns
-    output_patterns = [
-        r'>\s*["\$]',  # Output redirection: > $file or > "file"
-        r'>>\s*["\$]',  # Append redirection: >> $file
-        r'\|\s*tee\s+',  # Tee command
-        r'cat\s+.*>\s*',  # Cat with redirection
-        r'echo\s+.*>\s*',  # Echo with redirection
-        r'printf\s+.*>\s*',  # Printf with redirection
-        r'\s+-o\s+',  # -o output flag
-        r'\s+--output\s+',  # --output flag
-        r'\s+--out\s+',  # --out flag
-    ]
-
-    for pattern in output_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            patterns_found.append(f"Bash output pattern: {pattern}")
+    for name, compiled, compiled_lower in _BASH_OUTPUT_PATTERNS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     # Check for output-related variables
-    output_vars = [
-        r'output[_]?file',
-        r'out[_]?file',
-        r'result[_]?file',
-        r'output[_]?dir',
-    ]
-
-    for var_pattern in output_vars:
-        if re.search(var_pattern, content, re.IGNORECASE):
-            patterns_found.append(f"Output variable: {var_pattern}")
+    for name, compiled, compiled_lower in _BASH_OUTPUT_VARS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     return len(patterns_found) > 0, patterns_found
 
 
+# R output patterns
+_R_OUTPUT_PATTERNS = _compile_patterns(
+    "R output pattern",
+    r'write\.',  # write.table, write.csv, etc.
+    r'save\(',  # save()
+    r'saveRDS\(',  # saveRDS()
+    r'ggsave\(',  # ggplot2 ggsave()
+    r'pdf\(',  # PDF device
+    r'png\(',  # PNG device
+    r'jpeg\(',  # JPEG device
+    r'svg\(',  # SVG device
+    r'sink\(',  # Sink output
+    r'cat\(.*file\s*=',  # cat() with file argument
+    r'writeLines\(',  # writeLines()
+    r'write\(',  # write()
+)
+
+# Output-related variable names
+_R_OUTPUT_VARS = _compile_patterns(
+    "Output variable",
+    r'output[._]?file',
+    r'out[._]?file',
+    r'result[._]?file',
+    r'output[._]?path',
+)
+
+
 def check_r_output_patterns(content: str) -> tuple[bool, List[str]]:
     """Check for output generation patterns in R scripts.
 
@@ -122,42 +177,55 @@ def check_r_output_patterns(content: str) -> tuple[bool, List[str]]:
         Tuple of (has_output_generation, list_of_found_patterns)
     """
     patterns_found = []
+    content_lower = lowered_for_search(content)
 
     # R output patterns
-    output_patterns = [
-        r'write\.',  # write.table, write.csv, etc.
-        r'save\(',  # save()
-        r'saveRDS\(',  # saveRDS()
-        r'ggsave\(',  # ggplot2 ggsave()
-        r'pdf\(',  # PDF device
-        r'png\(',  # PNG device
-        r'jpeg\(',  # JPEG device
-        r'svg\(',  # SVG device
-        r'sink\(',  # Sink output
-        r'cat\(.*file\s*=',  # cat() with file argument
-        r'writeLines\(',  # writeLines()
-        r'write\(',  # write()
-    ]
-
-    for pattern in output_patterns:
-        if re.search(pattern, content, re.IGNORECASE):
-            patterns_found.append(f"R output pattern: {pattern}")
+    for name, compiled, compiled_lower in _R_OUTPUT_PATTERNS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     # Check for output-related variables
-    output_vars = [
-        r'output[._]?file',
-        r'out[._]?file',
-        r'result[._]?file',
-        r'output[._]?path',
-    ]
-
-    for var_pattern in output_vars:
-        if re.search(var_pattern, content, re.IGNORECASE):
-            patterns_found.append(f"Output variable: {var_pattern}")
+    for name, compiled, compiled_lower in _R_OUTPUT_VARS:
+        if _pattern_matches(content, content_lower, compiled, compiled_lower):
+            patterns_found.append(name)
 
     return len(patterns_found) > 0, patterns_found
 
 
+# Generic output patterns for any other script type
+_GENERIC_OUTPUT_PATTERNS = _compile_patterns(
+    "Generic output pattern",
+    r'>\s*["\$]',  # Output redirection
+    r'write',  # Write operations
+    r'save',  # Save operations
+    r'output',  # Output mentions
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _check_script(content: str, script_type: str) -> tuple[bool, tuple[str, ...]]:
+    """Check a script's output generation patterns for its type.
+
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        has_output, patterns_found = check_python_output_patterns(content)
+    elif script_type == 'bash':
+        has_output, patterns_found = check_bash_output_patterns(content)
+    elif script_type == 'r':
+        has_output, patterns_found = check_r_output_patterns(content)
+    else:
+        # Generic check for any script type
+        patterns_found = []
+        content_lower = lowered_for_search(content)
+        for name, compiled, compiled_lower in _GENERIC_OUTPUT_PATTERNS:
+            if _pattern_matches(content, content_lower, compiled, compiled_lower):
+                patterns_found.append(name)
+        has_output = len(patterns_found) > 0
+    return has_output, tuple(patterns_found)
+
+
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     Test wrapper script output generation patterns.
@@ -194,27 +262,8 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for output generation patterns based on script type
-    has_output = False
-    patterns_found = []
-
-    if script_type == 'python':
-        has_output, patterns_found = check_python_output_patterns(script_content)
-    elif script_type == 'bash':
-        has_output, patterns_found = check_bash_output_patterns(script_content)
-    elif script_type == 'r':
-        has_output, patterns_found = check_r_output_patterns(script_content)
-    else:
-        # Generic check for any script type
-        generic_patterns = [
-            r'>\s*["\$]',  # Output redirection
-            r'write',  # Write operations
-            r'save',  # Save operations
-            r'output',  # Output mentions
-        ]
-        for pattern in generic_patterns:
-            if re.search(pattern, script_content, re.IGNORECASE):
-                patterns_found.append(f"Generic output pattern: {pattern}")
-        has_output = len(patterns_found) > 0
+    has_output, patterns = _check_script(script_content, script_type)
+    patterns_found = list(patterns)
 
     # Report findings
     if has_output:
@@ -11,39 +11,30 @@ from __future__ import annotations
 import sys
 import os
 import re
+import functools
 from typing import List, Set
-from dataclasses import dataclass
 
-# Add parent directory to path for imports  
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
 
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+@functools.lru_cache(maxsize=8)
+def _lowered(content: str) -> str:
+    """Return the lowercased script content, computed once for all expected parameters."""
+    return content.lower()
 
 
-def search_python_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
-    """Search for parameter in Python script using Python-specific patterns.
+@functools.lru_cache(maxsize=256)
+def _python_parameter_patterns(param_lower: str) -> tuple[tuple[str, re.Pattern], ...]:
+    """Build the Python search patterns for a lowercased parameter name.
     
     Returns:
-        Tuple of (found, list_of_matched_contexts)
+        Tuple of (pattern, compiled_pattern) pairs, compiled once per parameter name
     """
-    content_lower = content.lower()
-    param_lower = parameter_name.lower()
-    
-    matches = []
-    
     # Common Python parameter patterns
     patterns = [
         # argparse patterns
@@ -75,9 +66,22 @@ def search_python_parameters(content: str, parameter_name: str) -> tuple[bool, L
         rf'os\.environ\.get\(["\']{re.escape(param_lower)}["\']',
         rf'getenv\(["\']{re.escape(param_lower)}["\']',
     ]
+    return tuple((pattern, re.compile(pattern, re.MULTILINE)) for pattern in patterns)
+
+
+def search_python_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
+    """Search for parameter in Python script using Python-specific patterns.
+    
+    Returns:
+        Tuple of (found, list_of_matched_contexts)
+    """
+    content_lower = _lowered(content)
+    param_lower = parameter_name.lower()
+    
+    matches = []
     
-    for pattern in patterns:
-        if re.search(pattern, content_lower, re.MULTILINE):
+    for pattern, compiled in _python_parameter_patterns(param_lower):
+        if compiled.search(content_lower):
             matches.append(f"Python pattern: {pattern}")
     
     # Simple string search as fallback
@@ -87,17 +91,13 @@ def search_python_parameters(content: str, parameter_name: str) -> tuple[bool, L
     return len(matches) > 0, matches
 
 
-def search_bash_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
-    """Search for parameter in Bash script using Bash-specific patterns.
+@functools.lru_cache(maxsize=256)
+def _bash_parameter_patterns(param_lower: str) -> tuple[tuple[str, re.Pattern], ...]:
+    """Build the Bash search patterns for a lowercased parameter name.
     
     Returns:
-        Tuple of (found, list_of_matched_contexts)
+        Tuple of (pattern, compiled_pattern) pairs, compiled once per parameter name
     """
-    content_lower = content.lower()
-    param_lower = parameter_name.lower()
-    
-    matches = []
-    
     # Common Bash parameter patterns
     patterns = [
         # Positional parameters
@@ -124,9 +124,22 @@ def search_bash_parameters(content: str, parameter_name: str) -> tuple[bool, Lis
         # Read statements
         rf'read\s+{re.escape(param_lower)}\b',
     ]
+    return tuple((pattern, re.compile(pattern, re.MULTILINE)) for pattern in patterns)
+
+
+def search_bash_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
+    """Search for parameter in Bash script using Bash-specific patterns.
     
-    for pattern in patterns:
-        if re.search(pattern, content_lower, re.MULTILINE):
+    Returns:
+        Tuple of (found, list_of_matched_contexts)
+    """
+    content_lower = _lowered(content)
+    param_lower = parameter_name.lower()
+    
+    matches = []
+    
+    for pattern, compiled in _bash_parameter_patterns(param_lower):
+        if compiled.search(content_lower):
             matches.append(f"Bash pattern: {pattern}")
     
     # Simple string search as fallback
@@ -136,17 +149,13 @@ def search_bash_parameters(content: str, parameter_name: str) -> tuple[bool, Lis
     return len(matches) > 0, matches
 
 
-def search_r_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
-    """Search for parameter in R script using R-specific patterns.
+@functools.lru_cache(maxsize=256)
+def _r_parameter_patterns(param_lower: str) -> tuple[tuple[str, re.Pattern], ...]:
+    """Build the R search patterns for a lowercased parameter name.
     
     Returns:
-        Tuple of (found, list_of_matched_contexts)
+        Tuple of (pattern, compiled_pattern) pairs, compiled once per parameter name
     """
-    content_lower = content.lower()
-    param_lower = parameter_name.lower()
-    
-    matches = []
-    
     # Common R parameter patterns
     patterns = [
         # Variable assignments
@@ -172,9 +181,22 @@ def search_r_parameters(content: str, parameter_name: str) -> tuple[bool, List[s
         rf'args\${re.escape(param_lower)}\b',
         rf'options\${re.escape(param_lower)}\b',
     ]
+    return tuple((pattern, re.compile(pattern, re.MULTILINE)) for pattern in patterns)
+
+
+def search_r_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
+    """Search for parameter in R script using R-specific patterns.
+    
+    Returns:
+        Tuple of (found, list_of_matched_contexts)
+    """
+    content_lower = _lowered(content)
+    param_lower = parameter_name.lower()
+    
+    matches = []
     
-    for pattern in patterns:
-        if re.search(pattern, content_lower, re.MULTILINE):
+    for pattern, compiled in _r_parameter_patterns(param_lower):
+        if compiled.search(content_lower):
             matches.append(f"R pattern: {pattern}")
     
     # Simple string search as fallback
@@ -184,17 +206,13 @@ def search_r_parameters(content: str, parameter_name: str) -> tuple[bool, List[s
     return len(matches) > 0, matches
 
 
-def search_generic_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
-    """Search for parameter using generic patterns for unknown script types.
+@functools.lru_cache(maxsize=256)
+def _generic_parameter_patterns(param_lower: str) -> tuple[tuple[str, re.Pattern], ...]:
+    """Build the generic search patterns for a lowercased parameter name.
     
     Returns:
-        Tuple of (found, list_of_matched_contexts)
+        Tuple of (pattern, compiled_pattern) pairs, compiled once per parameter name
     """
-    content_lower = content.lower()
-    param_lower = parameter_name.lower()
-    
-    matches = []
-    
     # Generic patterns that might work across languages
     patterns = [
         # Variable assignments (various forms)
@@ -211,14 +229,45 @@ def search_generic_parameters(content: str, parameter_name: str) -> tuple[bool,
         # Word boundary match
         rf'\b{re.escape(param_lower)}\b',
     ]
+    return tuple((pattern, re.compile(pattern, re.MULTILINE)) for pattern in patterns)
+
+
+def search_generic_parameters(content: str, parameter_name: str) -> tuple[bool, List[str]]:
+    """Search for parameter using generic patterns for unknown script types.
     
-    for pattern in patterns:
-        if re.search(pattern, content_lower, re.MULTILINE):
+    Returns:
+        Tuple of (found, list_of_matched_contexts)
+    """
+    content_lower = _lowered(content)
+    param_lower = parameter_name.lower()
+    
+    matches = []
+    
+    for pattern, compiled in _generic_parameter_patterns(param_lower):
+        if compiled.search(content_lower):
             matches.append(f"Generic pattern: {pattern}")
     
     return len(matches) > 0, matches
 
 
+@functools.lru_cache(maxsize=256)
+def _search_parameter(content: str, script_type: str, parameter_name: str) -> tuple[bool, tuple[str, ...]]:
+    """Search for a parameter with the strategy for the script type.
+    
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    if script_type == 'python':
+        found, match_contexts = search_python_parameters(content, parameter_name)
+    elif script_type == 'bash':
+        found, match_contexts = search_bash_parameters(content, parameter_name)
+    elif script_type == 'r':
+        found, match_contexts = search_r_parameters(content, parameter_name)
+    else:
+        found, match_contexts = search_generic_parameters(content, parameter_name)
+    return found, tuple(match_contexts)
+
+
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     Test wrapper script parameter validation.
@@ -264,14 +313,7 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     missing_parameters: Set[str] = set()
     
     for param_name in expected_parameters:
-        if script_type == 'python':
-            found, match_contexts = search_python_parameters(script_content, param_name)
-        elif script_type == 'bash':
-            found, match_contexts = search_bash_parameters(script_content, param_name)
-        elif script_type == 'r':
-            found, match_contexts = search_r_parameters(script_content, param_name)
-        else:
-            found, match_contexts = search_generic_parameters(script_content, param_name)
+        found, match_contexts = _search_parameter(script_content, script_type, param_name)
         
         if found:
             found_parameters.add(param_name)
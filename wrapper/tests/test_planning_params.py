@@ -21,27 +21,17 @@ from __future__ import annotations
 import re
 import os
 import sys
-from dataclasses import dataclass
 from typing import List, Tuple
 
 # ---------------------------------------------------------------------------
 # Boilerplate shared across all wrapper tests
 # ---------------------------------------------------------------------------
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
-
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' | 'WARNING' | 'INFO'
-    message: str
-    context: str | None = None
-
-    def format(self) -> str:
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+from wrapper.linter import LintIssue
 
 
 # ---------------------------------------------------------------------------
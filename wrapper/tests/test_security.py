@@ -10,26 +10,73 @@ from __future__ import annotations
 import sys
 import os
 import re
-from typing import List
-from dataclasses import dataclass
+import functools
+from typing import List, Optional
 
-# Add parent directory to path for imports
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so LintIssue and the shared test helpers can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
+from wrapper.linter import LintIssue
+from wrapper.tests._lint_common import lowered_for_search
 
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
 
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+def _credential_patterns(source: str) -> tuple[re.Pattern, re.Pattern]:
+    """Compile a lowercase credential pattern both case-insensitively and as-is.
+    
+    The case-sensitive form searches lowercased content (see lowered_for_search), where re
+    can scan ahead for its literal prefix instead of case-folding every character.
+    """
+    return re.compile(source, re.IGNORECASE), re.compile(source)
+
+
+def _credential_found(content: str, content_lower: Optional[str],
+                      patterns: tuple[re.Pattern, re.Pattern]) -> bool:
+    """Search for a _credential_patterns entry, on the lowercased content when available."""
+    pattern, pattern_lower = patterns
+    if content_lower is not None:
+        return pattern_lower.search(content_lower) is not None
+    return pattern.search(content) is not None
+
+
+# Patterns starting with \b keep re from scanning ahead for their literal prefix, so each
+# check on one of them first looks for its keyword with a plain substring search
+#
+# Code-execution calls checked for in Python, R and other scripts
+_EVAL_CALL_RE = re.compile(r'\beval\s*\(')
+_EXEC_CALL_RE = re.compile(r'\bexec\s*\(')
+
+# Python security patterns
+_PY_SHELL_TRUE_RE = re.compile(r'subprocess\.(run|call|Popen)\s*\([^)]*shell\s*=\s*True')
+_PY_SUBPROCESS_LIST_RE = re.compile(r'subprocess\.(run|call|Popen)\s*\(\s*\[')
+_PY_PICKLE_LOAD_RE = re.compile(r'pickle\.loads?\s*\(')
+_PY_OS_SYSTEM_RE = re.compile(r'os\.system\s*\(')
+_PY_OPEN_PLUS_MODE_RE = re.compile(r'open\s*\([^)]*\+["\']')
+_PY_PATH_NORMALIZERS = ('os.path.abspath', 'os.path.realpath')
+_PY_SANITIZERS = ('shlex.quote', 're.escape')
+_PY_PASSWORD_PATTERNS = _credential_patterns(r'password\s*=\s*["\'](?!.*\$|.*%s)[^"\']{8,}["\']')
+_PY_API_KEY_PATTERNS = _credential_patterns(r'api[_-]?key\s*=\s*["\'](?!.*\$|.*%s)[^"\']{16,}["\']')
+
+# Bash security patterns
+_BASH_UNQUOTED_VAR_RE = re.compile(r'(?<!["\'])\$\w+(?!["\'])')
+_BASH_EVAL_RE = re.compile(r'\beval\s+')
+_BASH_QUOTED_VAR_RE = re.compile(r'"\$\w+"')
+_BASH_BRACED_VAR_RE = re.compile(r'\$\{[^}]+\}')
+_BASH_UNQUOTED_SUBST_RE = re.compile(r'\$\(\s*[^)]+\s*\)(?!["\'"])')
+_BASH_RM_ROOT_RE = re.compile(r'\brm\s+-rf\s+/(?!\w)')
+_BASH_SET_U_RE = re.compile(r'set\s+-u|set\s+-[a-z]*u')
+_BASH_CONDITIONAL_RE = re.compile(r'if\s+\[\[.*\]\]\s*;\s*then')
+
+# R security patterns
+_R_PARSE_TEXT_RE = re.compile(r'\bparse\s*\([^)]*text\s*=')
+_R_SYSTEM_RE = re.compile(r'\bsystem\s*\(')
+_R_SYSTEM2_RE = re.compile(r'\bsystem2\s*\(')
+_R_DYNAMIC_SOURCE_RE = re.compile(r'\bsource\s*\([^)]*paste|sprintf')
+_R_LOAD_RE = re.compile(r'\bload\s*\(')
+_R_FILE_EXISTS_RE = re.compile(r'file\.exists\s*\(')
+_R_PATH_NORMALIZERS = ('normalizePath', 'path.expand')
+_R_PASSWORD_RE = re.compile(r'password\s*<-\s*["\'][^"\']{8,}["\']', re.IGNORECASE)
 
 
 def check_python_security(content: str) -> tuple[List[str], List[str]]:
@@ -42,45 +89,46 @@ def check_python_security(content: str) -> tuple[List[str], List[str]]:
     safe_patterns = []
 
     # Check for shell=True in subprocess (potential command injection)
-    if re.search(r'subprocess\.(run|call|Popen)\s*\([^)]*shell\s*=\s*True', content):
+    if _PY_SHELL_TRUE_RE.search(content):
         security_issues.append("subprocess with shell=True (command injection risk)")
 
     # Check for safe subprocess usage
-    if re.search(r'subprocess\.(run|call|Popen)\s*\(\s*\[', content):
+    if _PY_SUBPROCESS_LIST_RE.search(content):
         safe_patterns.append("Using subprocess with list arguments (safe)")
 
     # Check for eval/exec usage (code injection)
-    if re.search(r'\beval\s*\(', content):
+    if 'eval' in content and _EVAL_CALL_RE.search(content):
         security_issues.append("eval() usage (code injection risk)")
 
-    if re.search(r'\bexec\s*\(', content):
+    if 'exec' in content and _EXEC_CALL_RE.search(content):
         security_issues.append("exec() usage (code injection risk)")
 
     # Check for unsafe pickle usage
-    if re.search(r'pickle\.loads?\s*\(', content):
+    if _PY_PICKLE_LOAD_RE.search(content):
         security_issues.append("pickle.load() usage (arbitrary code execution risk)")
 
     # Check for os.system (unsafe)
-    if re.search(r'os\.system\s*\(', content):
+    if _PY_OS_SYSTEM_RE.search(content):
         security_issues.append("os.system() usage (command injection risk)")
 
     # Check for unsafe file operations
-    if re.search(r'open\s*\([^)]*\+["\']', content):
+    if _PY_OPEN_PLUS_MODE_RE.search(content):
         security_issues.append("File opened in read+write mode (potential security risk)")
 
     # Check for path traversal protection
-    if re.search(r'os\.path\.abspath|os\.path\.realpath', content):
+    if any(name in content for name in _PY_PATH_NORMALIZERS):
         safe_patterns.append("Path normalization used (prevents traversal attacks)")
 
     # Check for input sanitization
-    if re.search(r'shlex\.quote|re\.escape', content):
+    if any(name in content for name in _PY_SANITIZERS):
         safe_patterns.append("Input sanitization found")
 
     # Check for hardcoded credentials (basic check)
-    if re.search(r'password\s*=\s*["\'](?!.*\$|.*%s)[^"\']{8,}["\']', content, re.IGNORECASE):
+    content_lower = lowered_for_search(content)
+    if _credential_found(content, content_lower, _PY_PASSWORD_PATTERNS):
         security_issues.append("Possible hardcoded password")
 
-    if re.search(r'api[_-]?key\s*=\s*["\'](?!.*\$|.*%s)[^"\']{16,}["\']', content, re.IGNORECASE):
+    if _credential_found(content, content_lower, _PY_API_KEY_PATTERNS):
         security_issues.append("Possible hardcoded API key")
 
     return security_issues, safe_patterns
@@ -96,37 +144,37 @@ def check_bash_security(content: str) -> tuple[List[str], List[str]]:
     safe_patterns = []
 
     # Check for unquoted variables (command injection risk)
-    unquoted_vars = re.findall(r'(?<!["\'])\$\w+(?!["\'])', content)
-    if len(unquoted_vars) > 5:  # Some tolerance for simple cases
-        security_issues.append(f"Many unquoted variables ({len(unquoted_vars)} found) - injection risk")
+    unquoted_count = sum(1 for _ in _BASH_UNQUOTED_VAR_RE.finditer(content))
+    if unquoted_count > 5:  # Some tolerance for simple cases
+        security_issues.append(f"Many unquoted variables ({unquoted_count} found) - injection risk")
 
     # Check for eval usage
-    if re.search(r'\beval\s+', content):
+    if 'eval' in content and _BASH_EVAL_RE.search(content):
         security_issues.append("eval usage (code injection risk)")
 
     # Check for safe variable quoting
-    quoted_vars = re.findall(r'"\$\w+"', content)
-    if len(quoted_vars) > 5:
-        safe_patterns.append(f"Good variable quoting ({len(quoted_vars)} quoted variables)")
+    quoted_count = sum(1 for _ in _BASH_QUOTED_VAR_RE.finditer(content))
+    if quoted_count > 5:
+        safe_patterns.append(f"Good variable quoting ({quoted_count} quoted variables)")
 
     # Check for ${var} usage (safer)
-    if re.search(r'\$\{[^}]+\}', content):
+    if _BASH_BRACED_VAR_RE.search(content):
         safe_patterns.append("Using ${var} syntax")
 
     # Check for command substitution without quoting
-    if re.search(r'\$\(\s*[^)]+\s*\)(?!["\'"])', content):
+    if _BASH_UNQUOTED_SUBST_RE.search(content):
         security_issues.append("Unquoted command substitution")
 
     # Check for dangerous commands
-    if re.search(r'\brm\s+-rf\s+/(?!\w)', content):
+    if 'rm' in content and _BASH_RM_ROOT_RE.search(content):
         security_issues.append("Dangerous rm -rf on root paths")
 
     # Check for set -u (undefined variable protection)
-    if re.search(r'set\s+-u|set\s+-[a-z]*u', content):
+    if _BASH_SET_U_RE.search(content):
         safe_patterns.append("Using set -u (undefined variable protection)")
 
     # Check for input validation before using in commands
-    if re.search(r'if\s+\[\[.*\]\]\s*;\s*then', content):
+    if _BASH_CONDITIONAL_RE.search(content):
         safe_patterns.append("Conditional validation before execution")
 
     return security_issues, safe_patterns
@@ -142,42 +190,67 @@ def check_r_security(content: str) -> tuple[List[str], List[str]]:
     safe_patterns = []
 
     # Check for eval/parse usage (code injection)
-    if re.search(r'\beval\s*\(', content):
+    if 'eval' in content and _EVAL_CALL_RE.search(content):
         security_issues.append("eval() usage (code injection risk)")
 
-    if re.search(r'\bparse\s*\([^)]*text\s*=', content):
+    if 'parse' in content and _R_PARSE_TEXT_RE.search(content):
         security_issues.append("parse() with text argument (code injection risk)")
 
     # Check for system() calls
-    if re.search(r'\bsystem\s*\(', content):
+    if 'system' in content and _R_SYSTEM_RE.search(content):
         security_issues.append("system() call (command injection risk)")
 
-    if re.search(r'\bsystem2\s*\(', content):
+    if 'system2' in content and _R_SYSTEM2_RE.search(content):
         safe_patterns.append("Using system2() instead of system()")
 
     # Check for source() with user input
-    if re.search(r'\bsource\s*\([^)]*paste|sprintf', content):
+    if _R_DYNAMIC_SOURCE_RE.search(content):
         security_issues.append("source() with dynamic path (code injection risk)")
 
     # Check for load() without validation
-    if re.search(r'\bload\s*\(', content):
+    if 'load' in content and _R_LOAD_RE.search(content):
         security_issues.append("load() usage (arbitrary code execution risk)")
 
     # Check for safe file operations
-    if re.search(r'file\.exists\s*\(', content):
+    if _R_FILE_EXISTS_RE.search(content):
         safe_patterns.append("File existence validation")
 
     # Check for path sanitization
-    if re.search(r'normalizePath|path\.expand', content):
+    if any(name in content for name in _R_PATH_NORMALIZERS):
         safe_patterns.append("Path normalization used")
 
     # Check for hardcoded credentials
-    if re.search(r'password\s*<-\s*["\'][^"\']{8,}["\']', content, re.IGNORECASE):
+    if _R_PASSWORD_RE.search(content):
         security_issues.append("Possible hardcoded password")
 
     return security_issues, safe_patterns
 
 
+@functools.lru_cache(maxsize=32)
+def _check_script(content: str, script_type: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Check a script's security for its type.
+
+    Cached on the script text, since the agent re-lints an unchanged wrapper on every
+    validation attempt.
+    """
+    security_issues = []
+    safe_patterns = []
+
+    if script_type == 'python':
+        security_issues, safe_patterns = check_python_security(content)
+    elif script_type == 'bash':
+        security_issues, safe_patterns = check_bash_security(content)
+    elif script_type == 'r':
+        security_issues, safe_patterns = check_r_security(content)
+    else:
+        # Generic security checks
+        if 'eval' in content and _EVAL_CALL_RE.search(content):
+            security_issues.append("eval() usage detected")
+        if 'exec' in content and _EXEC_CALL_RE.search(content):
+            security_issues.append("exec() usage detected")
+    return tuple(security_issues), tuple(safe_patterns)
+
+
 def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
     """
     Test wrapper script security.
@@ -214,21 +287,9 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
         return issues
 
     # Check for security issues based on script type
-    security_issues = []
-    safe_patterns = []
-
-    if script_type == 'python':
-        security_issues, safe_patterns = check_python_security(script_content)
-    elif script_type == 'bash':
-        security_issues, safe_patterns = check_bash_security(script_content)
-    elif script_type == 'r':
-        security_issues, safe_patterns = check_r_security(script_content)
-    else:
-        # Generic security checks
-        if re.search(r'\beval\s*\(', script_content):
-            security_issues.append("eval() usage detected")
-        if re.search(r'\bexec\s*\(', script_content):
-            security_issues.append("exec() usage detected")
+    issues_found, safe_found = _check_script(script_content, script_type)
+    security_issues = list(issues_found)
+    safe_patterns = list(safe_found)
 
     # Store security info in context
     shared_context['security_issues'] = security_issues
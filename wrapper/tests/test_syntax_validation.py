@@ -10,33 +10,25 @@ from __future__ import annotations
 import sys
 import os
 import ast
+import functools
 import re
 import subprocess
-from typing import List
-from dataclasses import dataclass
+from typing import Iterator, List
 
-# Add parent directory to path for imports  
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
+# Add the repository root to path so the shared LintIssue can be imported
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if repo_root not in sys.path:
+    sys.path.insert(0, repo_root)
 
-
-@dataclass
-class LintIssue:
-    """Represents a validation issue found during wrapper script linting."""
-    severity: str  # 'ERROR' or 'WARNING' or 'INFO'
-    message: str
-    context: str | None = None
-
-    def format(self) -> str:
-        """Format the issue for human-readable output."""
-        context_info = f" ({self.context})" if self.context else ""
-        return f"{self.severity}: {self.message}{context_info}"
+from wrapper.linter import LintIssue
 
 
+@functools.lru_cache(maxsize=32)
 def validate_python_syntax(content: str) -> tuple[bool, str]:
     """Validate Python syntax using AST parsing.
     
+    Cached on the script text, so re-linting an unchanged wrapper skips the parse.
+    
     Returns:
         Tuple of (is_valid, error_message)
     """
@@ -108,6 +100,79 @@ def validate_r_syntax(script_path: str) -> tuple[bool, str]:
         return False, f"R syntax check failed: {str(e)}"
 
 
+def _run_file_syntax_check(script_path: str, script_type: str) -> tuple[bool, str]:
+    """Run the bash or R syntax check for a script file.
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if script_type == 'bash':
+        return validate_bash_syntax(script_path)
+    return validate_r_syntax(script_path)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_file_syntax_check(script_path: str, raw_content: bytes, script_type: str) -> tuple[bool, str]:
+    """Run the bash or R syntax check, cached on the path and the file's bytes.
+    
+    raw_content is only part of the key; the interpreter still reads the file itself.
+    """
+    return _run_file_syntax_check(script_path, script_type)
+
+
+def _validate_file_syntax(script_path: str, script_type: str) -> tuple[bool, str]:
+    """Run the bash or R syntax check for a script file.
+    
+    Keyed on the raw bytes on disk rather than the decoded script_content, whose line
+    endings have already been normalized, so a wrapper that changes only in its line
+    endings is checked again.
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        with open(script_path, 'rb') as f:
+            raw_content = f.read()
+    except OSError:
+        # Let the interpreter report the unreadable file
+        return _run_file_syntax_check(script_path, script_type)
+    return _cached_file_syntax_check(script_path, raw_content, script_type)
+
+
+# A quote preceded by an even number of backslashes (including none), i.e. not escaped
+_UNESCAPED_QUOTE_RE = re.compile(r'(?<!\\)(?:\\\\)*([\'"])')
+
+
+def _count_unescaped_quotes(line: str) -> tuple[int, int]:
+    """Count the single and double quotes in a line that are not backslash-escaped.
+    
+    Returns:
+        Tuple of (single_quote_count, double_quote_count)
+    """
+    if '\\' not in line:
+        # Nothing can be escaped, so plain counts are exact
+        return line.count("'"), line.count('"')
+    single_quotes = double_quotes = 0
+    for match in _UNESCAPED_QUOTE_RE.finditer(line):
+        if match.group(1) == "'":
+            single_quotes += 1
+        else:
+            double_quotes += 1
+    return single_quotes, double_quotes
+
+
+def _iter_lines(content: str) -> Iterator[str]:
+    """Yield the lines of content one at a time, exactly as content.split('\\n') would."""
+    start = 0
+    while True:
+        end = content.find('\n', start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
 def check_basic_syntax_issues(content: str, script_type: str) -> List[str]:
     """Check for basic syntax issues common across script types.
     
@@ -115,18 +180,17 @@ def check_basic_syntax_issues(content: str, script_type: str) -> List[str]:
         List of potential syntax issues
     """
     issues = []
-    lines = content.split('\n')
     
-    # Check for common syntax issues
-    for i, line in enumerate(lines, 1):
+    # Check for common syntax issues, slicing out one line at a time rather than splitting
+    # the whole script into a list up front
+    for i, line in enumerate(_iter_lines(content), 1):
         line_stripped = line.strip()
         
         if not line_stripped:
             continue
             
         # Check for unmatched quotes (basic)
-        single_quotes = line_stripped.count("'") - line_stripped.count("\\'")
-        double_quotes = line_stripped.count('"') - line_stripped.count('\\"')
+        single_quotes, double_quotes = _count_unescaped_quotes(line_stripped)
         
         if single_quotes % 2 != 0:
             issues.append(f"Line {i}: Potential unmatched single quote")
@@ -199,7 +263,7 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
             ))
             
     elif script_type == 'bash':
-        is_valid, error_msg = validate_bash_syntax(script_path)
+        is_valid, error_msg = _validate_file_syntax(script_path, 'bash')
         
         if is_valid:
             issues.append(LintIssue(
@@ -218,7 +282,7 @@ def run_test(script_path: str, shared_context: dict) -> List[LintIssue]:
             ))
             
     elif script_type == 'r':
-        is_valid, error_msg = validate_r_syntax(script_path)
+        is_valid, error_msg = _validate_file_syntax(script_path, 'r')
         
         if is_valid:
             issues.append(LintIssue(